@@ -61,6 +61,7 @@ from godafoss.gf_pins import *
 from godafoss.gf_ports import *
 from godafoss.gf_edge import *
 from godafoss.gf_canvas import *
+from godafoss.gf_pixel_formats import *
 from godafoss.gf_shapes import *
 from godafoss.gf_fonts import *
 from godafoss.gf_terminal import *
@@ -69,6 +70,7 @@ from godafoss.gf_chips_ssd import *
 from godafoss.gf_chips_touch import *
 from godafoss.gf_chips_uc8151 import *
 from godafoss.gf_chips_misc import *
+from godafoss.gf_rp2 import *
 from godafoss.gf_displays import *
 from godafoss.gf_boards import *
 
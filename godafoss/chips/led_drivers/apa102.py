@@ -17,51 +17,93 @@ import godafoss as gf
    
 class apa102( gf.neopixels ):
     """
+    driver for apa102 (and hd107) neopixels
+
+    :param ci: (int|pin_out)
+        the clock pin, used when no spi bus is specified
+
+    :param di: (int|pin_out)
+        the data pin, used when no spi bus is specified
+
+    :param n: (int)
+        the number of pixels in the chain
+
+    :param background: (:class:`~godafoss.color`)
+        the background color (default: black)
+
+    :param order: (str)
+        the color order on the wire (default: RGB)
+
+    :param spi: (machine.SPI|machine.SoftSPI|gf.spi)
+        the spi bus (default: None, which bit-bangs the ci and di pins)
+
+    :param current: (int)
+        the global (current) brightness, 0..31 (default: 31)
+
+    The whole frame (start frame, 4 bytes per pixel, end frame)
+    is kept in one bytearray, which a flush writes
+    with a single spi write.
     """
 
     def __init__( 
         self, 
-        ci: int,
-        di: int,
-        n: int, 
+        ci: [ int, gf.pin_out ] = None,
+        di: [ int, gf.pin_out ] = None,
+        n: int = 1,
         background = gf.colors.black, 
-        order: str = "RGB"
+        order: str = "RGB",
+        spi = None,
+        current: int = 31
     ):
-        self.ci = gf.make_pin_out( ci )
-        self.di = gf.make_pin_out( di )
-        
-        self._pixels = []
-        for _ in range( n ):
-            self._pixels.append( ( 0, 0, 0 ) )
-            
-        gf.neopixels.__init__( self, n, background, order )
+        if spi is None:
+            if ( ci is None ) or ( di is None ):
+                raise ValueError( "apa102 requires either spi or ci and di" )
+            spi = gf.bit_banged_spi( ci, di )
+        self._spi = spi
 
-    # =======================================================================
-    
-    def _write_byte( self, byte ):
-        for _ in range(8):
-            self.di.write ( byte & 0x80 )
-            self.ci.write( 1 )
-            byte <<= 1
-            self.ci.write( 0 )
+        # the end frame provides the n / 2 extra clock edges
+        # that the chain needs to shift the data to the last pixel,
+        # zeros don't light up any pixels beyond the n pixels
+        frame = bytearray( 4 + 4 * n + max( 4, ( n + 15 ) // 16 ) )
+
+        gf.neopixels.__init__(
+            self,
+            n,
+            background,
+            order,
+            frame = frame,
+            offset = 5,
+            stride = 4
+        )
+        self.current( current )
 
     # =======================================================================
-    
-    def _flush_implementation(
+
+    def current(
         self,
-        forced = True
-    ):
-        for _ in range( 4 ):
-            self._write_byte( 0 )
+        level: int
+    ) -> None:
+        """
+        set the global (5-bit current) brightness of all pixels, 0..31
+
+        This brightness is applied by the pixels themselves,
+        on top of the brightness() of the colors.
+        """
 
-        for pixel in self._pixels:
-            self._write_byte( 0xFF )
-            for byte in pixel:
-                self._write_byte( byte )
+        if not 0 <= level <= 31:
+            raise ValueError( "apa102 current %d" % level )
+        header = 0xE0 | level
+        frame = self._frame
+        for i in range( 4, 4 + 4 * self.size.x, 4 ):
+            frame[ i ] = header
+        self._mark_dirty( 0, 0, self.size.x, 1 )
+
+    # =======================================================================
 
-        for _ in range( 4 ):
-            self._write_byte( 0xFF )
+    def _frame_write( self ) -> None:
+        self._spi.write( self._frame )
 
     # =======================================================================
     
 # ===========================================================================
+# $$document( 0 )
@@ -10,7 +10,6 @@
 #
 # ===========================================================================
 
-import micropython
 import framebuf
 import machine
 import uctypes
@@ -19,11 +18,7 @@ import rp2
 
 import godafoss as gf
 
-from godafoss.gf_time import *
-from godafoss.gf_report import *
-from godafoss.gf_xy import *
-from godafoss.gf_color import *
-from godafoss.gf_canvas import *
+from godafoss import *
 
 # ===========================================================================
 
@@ -64,6 +59,16 @@ class hub75( gf.canvas ):
         
         The (default) background color of the display.
 
+    :param depth: int
+        the number of bitplanes, 1..8 (default: 4)
+
+        Each color channel is displayed with depth bits,
+        at the cost of a lower refresh rate.
+
+    :param on_time: int
+        the display time of the least significant bitplane,
+        in state machine cycles (default: 16)
+
     A HUB75 panel has a two groups of three shift registers.
     Each group of three shift registers drives one row of RGB LEDs, 
     one shift register per colour per LED color..
@@ -124,6 +129,15 @@ class hub75( gf.canvas ):
     This page describes the
     [binary code modulation](http://www.batsocks.co.uk/readme/art_bcm_1.htm)
     used by the driver to dim the LEDs.
+
+    The pixels are stored as rgb565.
+    For each bitplane and row pair, the DMA stream holds a record
+    with the pixel bits of that plane, the row select,
+    and a display time that doubles from one bitplane to the next.
+    A flush encodes only the row pairs that were written since
+    the previous flush into all bitplanes.
+    The refresh rate is roughly proportional to
+    1 / ( depth * 2 * size.x + on_time * 2 ** depth ).
     """
 
     # =======================================================================
@@ -135,7 +149,9 @@ class hub75( gf.canvas ):
         a_e: int,
         clk_lat_oe: int,
         frequency: int = 10_000_000,
-        background: color = colors.black
+        background: color = colors.black,
+        depth: int = 4,
+        on_time: int = 16
     ):
         canvas.__init__(
             self,
@@ -148,6 +164,9 @@ class hub75( gf.canvas ):
         self._r1_n = r1_b2
         self._a_n = a_e
         self._clk_n = clk_lat_oe
+        self._depth = depth
+        self._on_time = on_time
+        self._rows = self.size.y // 2
         
         self._framebuffer_buffer = bytearray( 
             2 * self.size.y * self.size.x )
@@ -159,8 +178,8 @@ class hub75( gf.canvas ):
         )
 
         # any ongoing DMA must be killed before the pio sm is installed
-        machine.mem32[ 0x50000000 + 0x444 ] = 0x03
-        while machine.mem32[ 0x50000000 + 0x444 ] != 0:
+        machine.mem32[ gf.rp2_dma_abort ] = 0x03
+        while machine.mem32[ gf.rp2_dma_abort ] != 0:
             pass
         
         # the fixed values in the pio buffer must be
@@ -168,43 +187,35 @@ class hub75( gf.canvas ):
         # flush_prepare takes care of this
         self._flush_prepare()
 
-        # the state machine that outputs the word stream to the HUB75 display
+        # the state machine that outputs the word stream to the display,
+        # side set: clk (1), lat (2), oe (4, high is display off)
         @rp2.asm_pio(
             autopull = True,
             sideset_init = ( [ rp2.PIO.OUT_HIGH ] * 3 ),    
             out_init = ( [ rp2.PIO.OUT_LOW ] * 6 ),
-            set_init = ( [ rp2.PIO.OUT_HIGH ] * 4 ),    
+            set_init = ( [ rp2.PIO.OUT_HIGH ] * 5 ),
             out_shiftdir = rp2.PIO.SHIFT_RIGHT
         ) 
         def spi_cpha0():
-            
-            # pull the counts from the data stream
-            mov( x, osr )
-            mov( y, osr )
-            out( pins, 24 )
-            
-            # shift out count 6-bit values to the color pins
-            # keep the display (previous lines) enabled
-            label( "bit_loop_on" )
-            out( pins, 8 ).side( 0 + 0 + 0 )
-            jmp( x_dec, "bit_loop_on" ).side( 0 + 0 + 1 )
-            
-            # shift out count 6-bit values to the color pins
-            # keep the display off
-            label( "bit_loop_off" )
+
+            # shift out the 6-bit pixel values of a bitplane
+            # to the color pins, display off
+            out( x, 32 ).side( 4 + 0 + 0 )
+            label( "bit_loop" )
             out( pins, 8 ).side( 4 + 0 + 0 )
-            jmp( y_dec, "bit_loop_off" ).side( 4 + 0 + 1 )
-            
-            # display off, latch new data
-            nop().side( 4 + 2 + 0 ) # oe = 1, lat = 0
-            
+            jmp( x_dec, "bit_loop" ).side( 4 + 0 + 1 )
+
             # exec the instruction that 
             # outputs the row multiplex value to the a-e pins
-            out( exec, 32 )
-                 
-            # the first out in the bit_loop_on loop will disable
-            # the latch and enable the display, after which the
-            # display will be on for the duration of that loop
+            out( exec, 32 ).side( 4 + 0 + 0 )
+
+            # latch the new data
+            nop().side( 4 + 2 + 0 )
+
+            # display on for the time of the bitplane
+            out( y, 32 ).side( 4 + 0 + 0 )
+            label( "on_loop" )
+            jmp( y_dec, "on_loop" ).side( 0 + 0 + 0 )
 
         # install and start the state machine
         sm_id = 0         
@@ -223,15 +234,15 @@ class hub75( gf.canvas ):
             offset: int,
             value: int
         ):
-            machine.mem32[ 0x50000000 + channel * 0x40 + offset ] = value
+            machine.mem32[ gf.rp2_dma_register( channel, offset ) ] = value
            
         # 1st DMA channel that transfers the _pio_buffer
         # to the pio state machine
         dma_poke( 1, 0x00, uctypes.addressof( self._pio_buffer ) )
-        dma_poke( 1, 0x04, 0x50200010 )
+        dma_poke( 1, 0x04, gf.rp2_pio_tx_fifo( 0, sm_id ) )
         dma_poke( 1, 0x08, len( self._pio_buffer ) // 4 )
-        dma_poke( 1, 0x10,
-            ( 0x0 << 15 ) | ( 0 << 11 ) | ( 1 << 4 ) | ( 2 << 2 ) | 1  )
+        dma_poke( 1, 0x10, gf.rp2_dma_control(
+            treq = gf.rp2_pio_tx_dreq( 0, sm_id ), chain_to = 0 ) )
         
         # variable that holds the start address of the _pio_buffer
         self._pio_buffer_start_var = bytearray( 4 )
@@ -242,16 +253,16 @@ class hub75( gf.canvas ):
         # 2nd DMA that transfers the start of the _pio_buffer to the
         # start-and-trigger address of the 1st DMA channel
         dma_poke( 0, 0x00, uctypes.addressof( self._pio_buffer_start_var ) )
-        dma_poke( 0, 0x04, 0x50000000 + 1 * 0x40 + 0x3C )
+        dma_poke( 0, 0x04, gf.rp2_dma_register( 1, 0x3C ) )
         dma_poke( 0, 0x08, 1 )
-        dma_poke( 0, 0x0C,
-            ( 0x3F << 15 ) | ( 0 << 11 ) | ( 0 << 4 ) | ( 2 << 2 ) | 1 )
+        dma_poke( 0, 0x0C, gf.rp2_dma_control(
+            treq = 0x3F, chain_to = 0, increment_read = False ) )
         
     # =======================================================================    
 
     def _encode( self, ink ):
         a, b, c = ink.rgb()
-        return (( a >> 4 ) << 8 ) | (( b >> 4 ) << 4 ) | ( c >> 4 )        
+        return ( ( a >> 3 ) << 11 ) | ( ( b >> 2 ) << 5 ) | ( c >> 3 )
     
     # =======================================================================
 
@@ -259,95 +270,109 @@ class hub75( gf.canvas ):
         self,
         ink: color
     ):
-        self._framebuffer.fill( self._encode( ink ) )
+        self._framebuffer.fill( self._native_ink( ink ) )
         
     # =======================================================================
         
-    def _write_pixel_implementation( 
+    def _write_pixel_xy_implementation(
         self, 
-        location: ( int, xy ), 
+        x: int,
+        y: int,
         ink: color
     ):
         self._framebuffer.pixel(
-            location.x,
-            location.y,
-            self._encode( ink )
+            x,
+            y,
+            self._native_ink( ink )
         )
+
+    # =======================================================================
+
+    def _fill_span_implementation(
+        self,
+        location: xy,
+        length: int,
+        vertical: bool,
+        ink: color
+    ):
+        if vertical:
+            self._framebuffer.vline(
+                location.x, location.y, length, self._native_ink( ink ) )
+        else:
+            self._framebuffer.hline(
+                location.x, location.y, length, self._native_ink( ink ) )
+
+    # =======================================================================
+
+    def _fill_rect_implementation(
+        self,
+        location: xy,
+        size: xy,
+        ink: color
+    ):
+        self._framebuffer.fill_rect(
+            location.x, location.y, size.x, size.y, self._native_ink( ink ) )
+
+    # =======================================================================
+
+    def _blit_implementation(
+        self,
+        buffer: bytearray,
+        format: int,
+        size: xy,
+        location: xy,
+        ink: color,
+        key: int | None
+    ):
+        # the framebuffer holds little-endian rgb565,
+        # the rgb565 pixel format is big-endian
+        self._blit_framebuf(
+            self._framebuffer, pixel_format.rgb565, self._native_ink( ink ),
+            buffer, format, size, location, ink, key,
+            copy = False )
         
     # =======================================================================    
 
     def _flush_prepare( self ) -> None:
 
-        self._pio_buffer = \
-            bytearray(  ( self.size.y // 2 ) * ( self.size.x + 3 * 4 ) )
+        # the fixed parts of the stream: the pixel counts,
+        # the row select instructions and the display times
+        self._pio_buffer = gf.rp2_hub75_frame(
+            self.size.x,
+            self._rows,
+            self._depth,
+            self._on_time,
+            [ rp2.asm_pio_encode( "set( pins, %d ).side( 4 )" % y, 3 )
+                for y in range( self._rows ) ]
+        )
         self.clear()
-        
-        buffer_pointer = uctypes.addressof( self._pio_buffer )
-        for y in range( self.size.y // 2 ):
-            
-            machine.mem32[ buffer_pointer ] = self.size.x / 2
-            buffer_pointer += 4
-            
-            machine.mem32[ buffer_pointer ] = self.size.x / 2
-            buffer_pointer += 4
-            
-            for x in range( self.size.x ):
-                machine.mem8[ buffer_pointer ] = 0
-                buffer_pointer += 1
-                
-            machine.mem32[ buffer_pointer ] = \
-                rp2.asm_pio_encode( "set(pins,%d)" % y, 0 )
-            buffer_pointer += 4
+        self._flush_implementation( True )
 
     # =======================================================================
-    
-    #@micropython.native
-    def _flush_direct_decode_viper( self ) -> None:
-        pixel = self._framebuffer.pixel
-        mem8 = machine.mem8
-        size_x = self.size.x
-        size_y = self.size.y
-        
-        #@micropython.viper
-        def encode( a: uint, b: uint ) -> uint:
-            d = uint( 0 )
-            if ( a & uint( 0x0F00 ) ): d += uint( 1 )
-            if ( a & uint( 0x00F0 ) ): d += uint( 2 )
-            if ( a & uint( 0x000F ) ): d += uint( 4 )
-                
-            if ( b & uint( 0x0F00 ) ): d += uint( 8 )
-            if ( b & uint( 0x00F0 ) ): d += uint( 16 )
-            if ( b & uint( 0x000F ) ): d += uint( 32 )
-            return d
-        
-        buffer_pointer = uctypes.addressof( self._pio_buffer )
-        for y in range( size_y // 2 ):
-
-            # on count never changes
-            buffer_pointer += 4
-            
-            # off count never changes
-            buffer_pointer += 4
-            
-            for x in range( self.size.x ):                   
-                a = pixel( x, y )    
-                b = pixel( x, y + size_y // 2 )
-                
-                mem8[ buffer_pointer ] = encode( a, b )
-                buffer_pointer += 1
-                
-            # value never changes    
-            buffer_pointer += 4    
-
-    # =======================================================================    
 
-    #@_gf.report
     def _flush_implementation(
         self,
         forced: bool
     ) -> None:
-        self._flush_direct_decode_viper()
+
+        # a row pair holds the rows y and y + rows
+        rows = self._rows
+        y0, y1 = self._dirty_y0, self._dirty_y1
+        if forced or ( y0 >= y1 ) or ( y1 - y0 >= rows ):
+            row_pairs = range( rows )
+        else:
+            row_pairs = set( y % rows for y in range( y0, y1 ) )
+
+        for row in row_pairs:
+            gf.rp2_hub75_encode(
+                self._framebuffer_buffer,
+                self._pio_buffer,
+                self.size.x,
+                rows,
+                self._depth,
+                row
+            )
 
     # =======================================================================    
 
-# ===========================================================================
\ No newline at end of file
+# ===========================================================================
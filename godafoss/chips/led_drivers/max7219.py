@@ -90,17 +90,58 @@ class max7219( gf.canvas ):
         
     # =======================================================================    
 
-    def _write_pixel_implementation( 
+    def _write_pixel_xy_implementation(
         self, 
-        location: gf.xy, 
+        x: int,
+        y: int,
         ink: bool | None = True
     ) -> None:        
         self.framebuf.pixel( 
-            location.x, 
-            location.y, 
+            x,
+            y,
             ink
         )
 
+    # =======================================================================
+
+    def _fill_span_implementation(
+        self,
+        location: gf.xy,
+        length: int,
+        vertical: bool,
+        ink: bool
+    ) -> None:
+        if vertical:
+            self.framebuf.vline( location.x, location.y, length, ink )
+        else:
+            self.framebuf.hline( location.x, location.y, length, ink )
+
+    # =======================================================================
+
+    def _fill_rect_implementation(
+        self,
+        location: gf.xy,
+        size: gf.xy,
+        ink: bool
+    ) -> None:
+        self.framebuf.fill_rect(
+            location.x, location.y, size.x, size.y, ink )
+
+    # =======================================================================
+
+    def _blit_implementation(
+        self,
+        buffer: bytearray,
+        format: int,
+        size: gf.xy,
+        location: gf.xy,
+        ink: bool,
+        key: int | None
+    ) -> None:
+        self._blit_framebuf(
+            self.framebuf, gf.pixel_format.mono_hlsb, 1 if ink else 0,
+            buffer, format, size, location, ink, key )
+
     # =======================================================================    
 
     def write_command(
@@ -13,6 +13,64 @@ import godafoss as gf
 #$$document( 0 )
 
 
+# ===========================================================================
+
+class bit_banged_spi:
+    """
+    write-only spi bus, bit-banged on a clock and a data pin
+
+    :param clock: (int|pin_out)
+        the clock pin
+
+    :param data: (int|pin_out)
+        the data pin
+
+    :param delay: (int)
+        the delay in us after each clock edge (default: 0)
+
+    This is a fallback for chips with a clock and a data line
+    (like the apa102 and ws2801) for when no machine.SPI or
+    machine.SoftSPI is available for the pins.
+    It writes the bits msb first with a low idle clock (spi mode 0).
+    """
+
+    # =======================================================================
+
+    def __init__(
+        self,
+        clock: [ int, gf.pin_out ],
+        data: [ int, gf.pin_out ],
+        delay: int = 0
+    ):
+        self._clock = gf.pin_out( clock )
+        self._data = gf.pin_out( data )
+        self._delay = delay
+        self._clock.write( 0 )
+
+    # =======================================================================
+
+    def write(
+        self,
+        data: bytes
+    ) -> None:
+        """
+        write the bytes in data
+        """
+
+        for byte in data:
+            for _ in range( 8 ):
+                self._data.write( byte & 0x80 )
+                byte <<= 1
+                if self._delay:
+                    gf.sleep_us( self._delay )
+                self._clock.write( 1 )
+                if self._delay:
+                    gf.sleep_us( self._delay )
+                self._clock.write( 0 )
+
+    # =======================================================================
+
+
 # ===========================================================================
 
 class neopixels( gf.canvas ):
@@ -26,7 +84,17 @@ class neopixels( gf.canvas ):
         the background color (default: black)
 
     :param order: (str)
-        the color order (default: RGB)    
+        the color order on the wire (default: RGB)
+
+    :param frame: (bytearray)
+        the buffer that is written to the chain
+        (default: None, which allocates a 3 * n bytes frame)
+
+    :param offset: (int)
+        the offset of the first pixel in the frame (default: 0)
+
+    :param stride: (int)
+        the distance between the pixels in the frame (default: 3)
 
     Neopixels are seperately controllable RGB LEDs,
     either as separate chip and LED, or as chip combined with an RGB LED.
@@ -66,51 +134,323 @@ class neopixels( gf.canvas ):
     current: at for brightness 60mA per pixel.
     Hence for non-trivial amounts of neopixels a separate power supply 
     is required, and power + ground 'bypass' wiring might be needed.
+
+    The pixels are stored in a flat bytearray, 3 bytes per pixel,
+    in the color order of the wire.
+    A flush passes these bytes through a 256 entry lookup table
+    (for the gamma and brightness) into the frame,
+    and writes the frame to the chain.
+    A concrete driver passes its frame (for instance with the
+    start and end frames of the chip) and implements _frame_write().
+
+    A matrix of neopixels is written through
+    matrix( :class:`~godafoss.matrix_layout` ), which maps each
+    matrix pixel to its strip index with a precomputed table,
+    and writes spans and rectangles as runs of the strip.
     """
 
     # =======================================================================
 
-    def __init__( 
-        self,  
-        n: int, 
-        background, 
-        order: str = "RGB"
+    def __init__(
+        self,
+        n: int,
+        background,
+        order: str = "RGB",
+        frame: bytearray = None,
+        offset: int = 0,
+        stride: int = 3
     ):
-        gf.canvas.__init__(
-            self,
-            size = gf.xy( n, 1 ),
-            is_color = True,
-            background = gf.colors.black
-        )
-        
+        self._pixels = bytearray( 3 * n )
+        if frame is None:
+            frame = bytearray( 3 * n )
+        self._frame = frame
+        self._frame_pixels = memoryview( frame )[ offset : ]
+        self._frame_stride = stride
+        self._gamma = 1.0
+        self._brightness = 255
+        self._table = gf.brightness_table()
+
         order = order.upper()
         if order == "RGB":
-            self._permutate = lambda ink: ( ink.red, ink.green, ink.blue )
+            self._encode = lambda ink: bytes(
+                ( ink.red, ink.green, ink.blue ) )
         elif order == "RBG":
-            self._permutate = lambda ink: ( ink.red, ink.blue, ink.green )
+            self._encode = lambda ink: bytes(
+                ( ink.red, ink.blue, ink.green ) )
         elif order == "BGR":
-            self._permutate = lambda ink: ( ink.blue, ink.green, ink.red )
+            self._encode = lambda ink: bytes(
+                ( ink.blue, ink.green, ink.red ) )
         elif order == "BRG":
-            self._permutate = lambda ink: ( ink.blue, ink.red, ink.green )
+            self._encode = lambda ink: bytes(
+                ( ink.blue, ink.red, ink.green ) )
         elif order == "GRB":
-            self._permutate = lambda ink: ( ink.green, ink.red, ink.blue )
+            self._encode = lambda ink: bytes(
+                ( ink.green, ink.red, ink.blue ) )
         elif order == "GBR":
-            self._permutate = lambda ink: ( ink.green, ink.blue, ink.red )
+            self._encode = lambda ink: bytes(
+                ( ink.green, ink.blue, ink.red ) )
         else:
-            raise ValueError( "color order '%s'", order )
-        
+            raise ValueError( "color order '%s'" % order )
+
+        gf.canvas.__init__(
+            self,
+            size = gf.xy( n, 1 ),
+            is_color = True,
+            background = gf.colors.black
+        )
 
     # =======================================================================
-    
-    def _write_pixel_implementation( 
-        self, 
-        location: ( int, gf.xy ), 
+
+    def gamma(
+        self,
+        value: float = 2.5
+    ) -> None:
+        """
+        set the gamma correction that is applied when flushing
+
+        :param value: (float)
+            the gamma exponent, 1.0 is no correction (default: 2.5)
+        """
+
+        self._gamma = value
+        self._table_update()
+
+    # =======================================================================
+
+    def brightness(
+        self,
+        level: int
+    ) -> None:
+        """
+        set the brightness that is applied when flushing
+
+        :param level: (int)
+            the brightness, 0..255 (255 is the initial brightness)
+
+        This scales all pixels when they are flushed,
+        the pixels themselves keep their full colors.
+        """
+
+        self._brightness = level
+        self._table_update()
+
+    # =======================================================================
+
+    def _table_update( self ) -> None:
+        self._table = gf.brightness_table( self._gamma, self._brightness )
+        self._mark_dirty( 0, 0, self.size.x, 1 )
+
+    # =======================================================================
+
+    def fill_range(
+        self,
+        first: int,
+        n: int,
+        ink: [ gf.color | bool ] = True
+    ) -> None:
+        """
+        write n pixels, starting at pixel first
+
+        :param first: (int)
+            the index of the first pixel
+
+        :param n: (int)
+            the number of pixels
+
+        :param ink: (:class:`~godafoss.color`, bool)
+            the ink to write (default: True)
+
+        The range is clipped to the chain.
+        """
+
+        if first < 0:
+            n += first
+            first = 0
+        n = min( n, self.size.x - first )
+        if n > 0:
+            self._mark_dirty( first, 0, first + n, 1 )
+            self._fill_range( first, n, self._cure_ink( ink ) )
+
+    # =======================================================================
+
+    def fill(
+        self,
+        ink: [ gf.color | bool ] = True
+    ) -> None:
+        """
+        write all pixels
+
+        :param ink: (:class:`~godafoss.color`, bool)
+            the ink to write (default: True)
+        """
+
+        self.fill_range( 0, self.size.x, ink )
+
+    # =======================================================================
+
+    def shift(
+        self,
+        n: int = 1,
+        ink: [ gf.color | bool ] = False
+    ) -> None:
+        """
+        shift the pixels n places along the chain
+
+        :param n: (int)
+            the number of places, positive shifts away from the
+            start of the chain, negative towards it (default: 1)
+
+        :param ink: (:class:`~godafoss.color`, bool)
+            the ink for the pixels that are shifted in
+            (default: False, which is the background)
+        """
+
+        size = self.size.x
+        if n >= 0:
+            self._move( 0, n, size - n )
+            self.fill_range( 0, n, ink )
+        else:
+            self._move( -n, 0, size + n )
+            self.fill_range( size + n, -n, ink )
+
+    # =======================================================================
+
+    def rotate(
+        self,
+        n: int = 1
+    ) -> None:
+        """
+        rotate the pixels n places along the chain
+
+        :param n: (int)
+            the number of places, positive rotates away from the
+            start of the chain, negative towards it (default: 1)
+
+        The pixels that are shifted out at one end of the chain
+        are shifted in at the other end.
+        """
+
+        size = self.size.x
+        n %= size
+        if n:
+            pixels = self._pixels
+            end = 3 * size
+            pixels[ : ] = pixels[ end - 3 * n : end ] \
+                + pixels[ : end - 3 * n ]
+            self._mark_dirty( 0, 0, size, 1 )
+
+    # =======================================================================
+
+    def copy(
+        self,
+        source: [ bytes | bytearray | memoryview ],
+        first: int = 0
+    ) -> None:
+        """
+        copy pixels from a buffer
+
+        :param source: (bytes, bytearray, memoryview)
+            the pixels: 3 bytes per pixel, in the color order of the wire
+
+        :param first: (int)
+            the index of the first pixel that is written (default: 0)
+
+        The pixels that would fall beyond the end of the chain
+        are ignored.
+        """
+
+        n = min( len( source ) // 3, self.size.x - first )
+        if n > 0:
+            self._pixels[ 3 * first : 3 * ( first + n ) ] = \
+                source[ : 3 * n ]
+            self._mark_dirty( first, 0, first + n, 1 )
+
+    # =======================================================================
+
+    def _move(
+        self,
+        source: int,
+        target: int,
+        n: int
+    ) -> None:
+        if n > 0:
+            self._pixels[ 3 * target : 3 * ( target + n ) ] = \
+                self._pixels[ 3 * source : 3 * ( source + n ) ]
+            self._mark_dirty( min( source, target ), 0,
+                max( source, target ) + n, 1 )
+
+    # =======================================================================
+
+    def _fill_range(
+        self,
+        first: int,
+        n: int,
         ink: gf.color
-    ):      
-        self._pixels[ location.x ] = self._permutate( ink )
+    ) -> None:
+        # write one pixel, then keep doubling the written part
+        view = memoryview( self._pixels )[ 3 * first : 3 * ( first + n ) ]
+        view[ 0 : 3 ] = self._native_ink( ink )
+        done = 3
+        end = 3 * n
+        while done < end:
+            step = min( done, end - done )
+            view[ done : done + step ] = view[ 0 : step ]
+            done += step
 
     # =======================================================================
-    
+
+    def _write_pixel_xy_implementation(
+        self,
+        x: int,
+        y: int,
+        ink: gf.color
+    ):
+        self._pixels[ 3 * x : 3 * x + 3 ] = self._native_ink( ink )
+
+    # =======================================================================
+
+    def _fill_rect_implementation(
+        self,
+        location: gf.xy,
+        size: gf.xy,
+        ink: gf.color
+    ) -> None:
+        self._fill_range( location.x, size.x, ink )
+
+    # =======================================================================
+
+    def _clear_implementation(
+        self,
+        ink: gf.color
+    ) -> None:
+        self._fill_range( 0, self.size.x, ink )
+
+    # =======================================================================
+
+    def _flush_implementation(
+        self,
+        forced = True
+    ):
+        gf.rgb888_lookup(
+            self._pixels,
+            self._frame_pixels,
+            self.size.x,
+            self._table,
+            self._frame_stride
+        )
+        self._frame_write()
+
+    # =======================================================================
+
+    def _frame_write( self ) -> None:
+        """
+        write the frame to the chain (concrete implementation)
+        """
+
+        raise NotImplementedError
+
+    # =======================================================================
+
     def demo_color_wheel(
         self,
         color_list = (
@@ -123,22 +463,27 @@ class neopixels( gf.canvas ):
         iterations = None,
         dim: int = 30
     ):
-        for _ in gf.repeater( iterations ):
-            for c in ( color_list ):
-                self.clear()
-                for n in range( self.size.x + 1 ):
-                    self.flush()
-                    gf.sleep_us( delay )
-                    self.write_pixel(
-                        gf.xy( n, 0 ),
-                        c // dim
-                    )  
-                for n in range( self.size.x + 1 ):
-                    self.flush()
-                    gf.sleep_us( delay )
-                    self.write_pixel(
-                        gf.xy( n, 0 ),
-                        gf.colors.black
-                    ) 
+        previous = self._brightness
+        self.brightness( 255 // dim )
+        try:
+            for _ in gf.repeater( iterations ):
+                for c in ( color_list ):
+                    self.clear()
+                    for n in range( self.size.x + 1 ):
+                        self.flush()
+                        gf.sleep_us( delay )
+                        self.write_pixel(
+                            gf.xy( n, 0 ),
+                            c
+                        )
+                    for n in range( self.size.x + 1 ):
+                        self.flush()
+                        gf.sleep_us( delay )
+                        self.write_pixel(
+                            gf.xy( n, 0 ),
+                            gf.colors.black
+                        )
+        finally:
+            self.brightness( previous )
     
 # ===========================================================================
@@ -65,14 +65,15 @@ class tm1640( gf.tm16xx, gf.canvas ):
        
     # =======================================================================
 
-    def _write_pixel_implementation( 
+    def _write_pixel_xy_implementation(
         self, 
-        location: gf.xy, 
+        x: int,
+        y: int,
         ink: bool
     ) -> None:       
         self._framebuf.pixel( 
-            location.x, 
-            location.y, 
+            x,
+            y,
             ink
         )
             
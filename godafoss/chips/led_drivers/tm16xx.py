@@ -169,7 +169,32 @@ class tm16xx:
         self,
         ink: bool = False
     ) -> None:
-        self._framebuf.fill( 0xFF if ink else 0x00 )                
+        self._framebuf.fill( 0xFF if ink else 0x00 )
+
+    # =======================================================================
+
+    def _fill_span_implementation(
+        self,
+        location: gf.xy,
+        length: int,
+        vertical: bool,
+        ink: bool
+    ) -> None:
+        if vertical:
+            self._framebuf.vline( location.x, location.y, length, ink )
+        else:
+            self._framebuf.hline( location.x, location.y, length, ink )
+
+    # =======================================================================
+
+    def _fill_rect_implementation(
+        self,
+        location: gf.xy,
+        size: gf.xy,
+        ink: bool
+    ) -> None:
+        self._framebuf.fill_rect(
+            location.x, location.y, size.x, size.y, ink )
 
     # =======================================================================
 
@@ -10,11 +10,7 @@
 #
 # ===========================================================================
 
-from godafoss.gf_time import *
-from godafoss.gf_color import *
-from godafoss.gf_canvas import *
-from godafoss.gf_pins import *
-from godafoss.gf_make_pins import *
+import godafoss as gf
 
 
 # ===========================================================================
@@ -22,53 +18,60 @@ from godafoss.gf_make_pins import *
 class ws2801( gf.neopixels ):
     """
     driver for neopixels with separate clock (ck) and data (si) lines
+
+    :param clock: (int|pin_out)
+        the clock pin, used when no spi bus is specified
+
+    :param data: (int|pin_out)
+        the data pin, used when no spi bus is specified
+
+    :param n: (int)
+        the number of pixels in the chain
+
+    :param background: (:class:`~godafoss.color`)
+        the background color (default: black)
+
+    :param order: (str)
+        the color order on the wire (default: RGB)
+
+    :param spi: (machine.SPI|machine.SoftSPI|gf.spi)
+        the spi bus (default: None, which bit-bangs the clock and data pins)
+
+    The pixels are kept in one bytearray (3 bytes per pixel),
+    which a flush writes with a single spi write.
+    The chain latches the data when the clock stays low for 500 us,
+    so the bus must be in spi mode 0.
     """
 
     # =======================================================================
 
     def __init__( 
         self, 
-        clock: [ int, pin_out, pin_in_out, pin_oc ],
-        data: [ int, pin_out, pin_in_out, pin_oc ],
-        n: int, 
-        background = colors.black, 
-        order: str = "RGB"
+        clock: [ int, gf.pin_out ] = None,
+        data: [ int, gf.pin_out ] = None,
+        n: int = 1,
+        background = gf.colors.black,
+        order: str = "RGB",
+        spi = None
     ):
-        self._clock = make_pin_out( clock )
-        self._data = make_pin_out( data )
-        self._n = n
-        self._background = background
-        self._pixels = [ self._background for _ in range( self._n ) ]
+        if spi is None:
+            if ( clock is None ) or ( data is None ):
+                raise ValueError(
+                    "ws2801 requires either spi or clock and data" )
+            spi = gf.bit_banged_spi( clock, data, delay = 1 )
+        self._spi = spi
         gf.neopixels.__init__( 
             self, 
             n, 
-            self._background,
+            background,
             order
         )
 
     # =======================================================================
-    
-    def _write_byte( self, b ):
-        for _ in range( 8 ):
-            self._data.write( ( b & 0x80 ) != 0 )
-            b = b << 1
-            sleep_us( 1 )
-            
-            self._clock.write( 1 )
-            sleep_us( 1 )
-            
-            self._clock.write( 0 )
-            sleep_us( 1 )
 
-    # =======================================================================
+    def _frame_write( self ) -> None:
+        self._spi.write( self._frame )
+        gf.sleep_us( 500 )
 
-    def flush( self ): 
-        self._clock.write( 0 )
-        sleep_us( 500 )
-        for p in self._pixels:
-            self._write_byte( p.red )
-            self._write_byte( p.blue )
-            self._write_byte( p.green )
-            
 
 # ===========================================================================
@@ -18,6 +18,27 @@ import godafoss as gf
 class ws281x( gf.neopixels ):
     """
     requires neopixel support in the target, Teensy 4.1 by default doesn't
+
+    :param d: (int)
+        the data pin
+
+    :param n: (int)
+        the number of pixels in the chain
+
+    :param background: (:class:`~godafoss.color`)
+        the background color (default: black)
+
+    :param order: (str)
+        the color order as passed to the neopixel object (default: RGB)
+
+    The order has the meaning it always had for this class:
+    it is the order of the color tuple that is passed to the
+    neopixel object, which applies its own mapping (GRB for
+    the ws2812) to get the order on the wire.
+    Hence the default RGB is correct for a ws2812.
+
+    The pixels are looked up (gamma and brightness) directly
+    into the buffer of the neopixel object, which then writes it.
     """
 
     def __init__( 
@@ -28,20 +49,28 @@ class ws281x( gf.neopixels ):
         order: str = "RGB"
     ):
         import machine, neopixel
-        self._pixels = neopixel.NeoPixel( machine.Pin( d ), n )
-        
-        for i in range( n ):
-            self._pixels[ i ] = ( 0, 0, 0 )
-            
-        gf.neopixels.__init__( self, n, background, order )
+        self._neopixel = neopixel.NeoPixel( machine.Pin( d ), n )
+
+        # the wire order is the order mapped like the neopixel object
+        # maps its color tuples into its buffer
+        if len( order ) != 3:
+            raise ValueError( "color order '%s'" % order )
+        wire = [ "" ] * 3
+        for color, index in zip( order.upper(), self._neopixel.ORDER ):
+            wire[ index ] = color
+
+        gf.neopixels.__init__(
+            self,
+            n,
+            background,
+            "".join( wire ),
+            frame = self._neopixel.buf
+        )
 
     # =======================================================================
     
-    def _flush_implementation(
-        self,
-        forced = True
-    ):
-        self._pixels.write()
+    def _frame_write( self ) -> None:
+        self._neopixel.write()
         
     # =======================================================================
     
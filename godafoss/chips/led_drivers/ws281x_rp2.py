@@ -0,0 +1,194 @@
+# ===========================================================================
+#
+# file     : ws281x_rp2.py
+# part of  : godafoss micropython library
+# url      : https://www.github.com/wovo/godafoss
+# author   : Wouter van Ooijen (wouter@voti.nl) 2024
+# license  : MIT license, see license attribute (godafoss.license)
+#
+# ===========================================================================
+
+import machine
+import uctypes
+
+import rp2
+
+import godafoss as gf
+
+#$$document( 0 )
+
+
+# ===========================================================================
+
+class ws281x_rp2( gf.neopixels ):
+    """
+    RP2040 ws281x driver, using PIO and DMA
+
+    :param pins: (list)
+        the data pins, one for each strip
+
+    :param n: (int)
+        the number of pixels in each strip
+
+    :param background: (:class:`~godafoss.color`)
+        the background color (default: black)
+
+    :param order: (str)
+        the color order on the wire (default: GRB, as used by the ws2812)
+
+    :param pio: (int)
+        the PIO block (default: 1, hub75 uses PIO block 0)
+
+    :param channels: (list)
+        the DMA channels, one for each strip
+        (default: None, which uses channels 2, 3, ...,
+        hub75 uses channels 0 and 1)
+
+    :param double_buffered: (bool)
+        True (default) to encode the next frame while
+        the previous frame is still transferred
+
+    The pixels of the strips are concatenated:
+    pixel n is the first pixel of the second strip.
+    A flush encodes the pixels (after the gamma and brightness
+    lookup) into a frame of 32-bit words, one per pixel,
+    which a DMA channel per strip streams into a PIO state machine
+    per strip, all strips in parallel.
+    Unlike the stock neopixel module, the transfer doesn't block
+    and doesn't disable the interrupts.
+    With double buffering, the next flush encodes into the other frame
+    while the previous frame is still shifted out,
+    and only waits before it starts its own transfer.
+
+    The encoding, the frames and the DMA register values are
+    in gf_rp2, which is tested on CPython.
+    """
+
+    # =======================================================================
+
+    def __init__(
+        self,
+        pins: list,
+        n: int,
+        background = gf.colors.black,
+        order: str = "GRB",
+        pio: int = 1,
+        channels: list = None,
+        double_buffered: bool = True
+    ):
+        strips = len( pins )
+        if not 1 <= strips <= 4:
+            raise ValueError( "%d strips, a PIO has 4 state machines"
+                % strips )
+        if channels is None:
+            channels = list( range( 2, 2 + strips ) )
+        self._n = n
+        self._pio = pio
+        self._channels = channels
+        self._mask = sum( 1 << channel for channel in channels )
+        self._frames = gf.rp2_frames(
+            4 * n * strips,
+            2 if double_buffered else 1
+        )
+
+        gf.neopixels.__init__(
+            self,
+            n * strips,
+            background,
+            order,
+            frame = self._frames.back(),
+            stride = 4
+        )
+
+        # any ongoing DMA must be killed before the pio sm is installed
+        machine.mem32[ gf.rp2_dma_abort ] = self._mask
+        while machine.mem32[ gf.rp2_dma_abort ] != 0:
+            pass
+
+        # the state machine that shifts out the top 24 bits of each word,
+        # 10 cycles per bit: 800 kHz at a state machine frequency of 8 MHz
+        @rp2.asm_pio(
+            sideset_init = rp2.PIO.OUT_LOW,
+            out_shiftdir = rp2.PIO.SHIFT_LEFT,
+            autopull = True,
+            pull_thresh = 24
+        )
+        def ws281x_pio():
+            wrap_target()
+            label( "bit_loop" )
+            out( x, 1 ).side( 0 ) [ 2 ]
+            jmp( not_x, "zero" ).side( 1 ) [ 1 ]
+            jmp( "bit_loop" ).side( 1 ) [ 4 ]
+            label( "zero" )
+            nop().side( 0 ) [ 4 ]
+            wrap()
+
+        self._sms = []
+        for sm, pin in enumerate( pins ):
+            state_machine = rp2.StateMachine(
+                4 * pio + sm,
+                ws281x_pio,
+                freq = 8_000_000,
+                sideset_base = machine.Pin( pin )
+            )
+            state_machine.active( 1 )
+            self._sms.append( state_machine )
+
+        self._started = False
+
+    # =======================================================================
+
+    def flush_done( self ) -> bool:
+        """
+        whether the transfer of the last frame is done
+        """
+
+        if self._started:
+            for channel in self._channels:
+                if machine.mem32[
+                    gf.rp2_dma_register( channel, 0x0C )
+                ] & ( 1 << 24 ):
+                    return False
+            for sm in self._sms:
+                if sm.tx_fifo():
+                    return False
+
+            # the last word is still being shifted out,
+            # after which the chain needs a low data line to latch
+            gf.sleep_us( 300 )
+            self._started = False
+        return True
+
+    # =======================================================================
+
+    def _flush_implementation(
+        self,
+        forced = True
+    ):
+        if len( self._frames.frames ) == 1:
+            self.wait_flush()
+        gf.neopixels._flush_implementation( self, forced )
+
+    # =======================================================================
+
+    def _frame_write( self ) -> None:
+        self.wait_flush()
+        frame = self._frames.swap()
+        for register, value in gf.rp2_ws281x_dma(
+            uctypes.addressof( frame ),
+            self._n,
+            self._channels,
+            self._pio,
+            range( len( self._sms ) )
+        ):
+            machine.mem32[ register ] = value
+        machine.mem32[ gf.rp2_dma_multi_trigger ] = self._mask
+        self._started = True
+
+        # the next flush encodes into the next frame
+        self._frame = self._frames.back()
+        self._frame_pixels = memoryview( self._frame )
+
+    # =======================================================================
+
+# ===========================================================================
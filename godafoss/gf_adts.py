@@ -302,6 +302,9 @@ class xy( immutable ):
     multiplication (by an integer), integer division (by an integer),
     and taking the string representation.
 
+    For use in the library, xy._fast( x, y ) creates an xy value
+    without the checks of the immutable base class.
+
     examples
     insert_example( "tests/unit_test_xy.py", "xy examples", 1 )
     """
@@ -325,7 +328,7 @@ class xy( immutable ):
     ) -> "xy":
         for y in range( self.y ):
             for x in range( self.x ):
-                yield xy( x, y )
+                yield xy._fast( x, y )
 
     # =======================================================================
 
@@ -338,7 +341,7 @@ class xy( immutable ):
         for dy in range( -1, 0, +1 ):
             for dx in range( -1, 0, +1 ):
                 if ( dx != 0 ) or ( dy != 0 ):
-                    yield xy( self.x + dx, self.y + dy )
+                    yield xy._fast( self.x + dx, self.y + dy )
 
     # =======================================================================
 
@@ -373,7 +376,7 @@ class xy( immutable ):
         self,
         other: "xy"
     ) -> "xy":
-        return xy(
+        return xy._fast(
             self.x + other.x,
             self.y + other.y
         )
@@ -384,7 +387,7 @@ class xy( immutable ):
         self,
         other: "xy"
     ) -> "xy":
-        return xy(
+        return xy._fast(
             self.x - other.x,
             self.y - other.y
         )
@@ -392,7 +395,7 @@ class xy( immutable ):
     # =======================================================================
 
     def __neg__( self ) -> "xy":
-        return xy(
+        return xy._fast(
            - self.x,
            - self.y
         )
@@ -404,7 +407,7 @@ class xy( immutable ):
         other: any
     ) -> "xy":
         if isinstance( other, int ):
-            return xy(
+            return xy._fast(
                 self.x * other,
                 self.y * other
             )
@@ -419,7 +422,7 @@ class xy( immutable ):
         self,
         other: int
     ) -> "xy":
-        return xy(
+        return xy._fast(
             self.x * other,
             self.y * other
         )
@@ -438,7 +441,7 @@ class xy( immutable ):
         self,
         other: int
     ) -> "xy":
-        return xy(
+        return xy._fast(
             self.x // other,
             self.y // other
         )
@@ -451,6 +454,61 @@ class xy( immutable ):
     # =======================================================================
 
 
+# ===========================================================================
+#
+# trusted constructors
+#
+# ===========================================================================
+
+def _fastest(
+    candidates: list,
+    normal,
+    arguments: tuple
+):
+    """
+    the first of the candidate constructors that works, else normal
+
+    A trusted constructor creates an object without the
+    immutable.__setattr__() checks (and without the clamping
+    of the color constructor),
+    for use with values that are known to be valid.
+    Which way of doing this works depends on the Python implementation,
+    so each candidate is tried once: it must create the
+    same object as the normal constructor.
+    """
+
+    for candidate in candidates:
+        try:
+            if candidate( *arguments ).__dict__ \
+                    == normal( *arguments ).__dict__:
+                return candidate
+        except Exception:
+            pass
+    return normal
+
+
+# ===========================================================================
+
+def _xy_members( x: int, y: int ) -> xy:
+    result = object.__new__( xy )
+    members = result.__dict__
+    members[ "x" ] = x
+    members[ "y" ] = y
+    members[ "xy" ] = ( x, y )
+    members[ "_frozen" ] = True
+    return result
+
+def _xy_setattr( x: int, y: int ) -> xy:
+    result = object.__new__( xy )
+    object.__setattr__( result, "x", x )
+    object.__setattr__( result, "y", y )
+    object.__setattr__( result, "xy", ( x, y ) )
+    object.__setattr__( result, "_frozen", True )
+    return result
+
+xy._fast = _fastest( ( _xy_members, _xy_setattr ), xy, ( 1, 2 ) )
+
+
 # ===========================================================================
 #
 # 3d coordinates
@@ -637,6 +695,10 @@ class color( immutable ):
 
     Some common colors are available as attributes of the colors class.
 
+    For use in the library, color._fast( red, green, blue ) creates a
+    color without clamping and without the checks of the
+    immutable base class: the values must be within 0..255.
+
     $macro_insert invertible
 
     $macro_insert immutable
@@ -717,12 +779,16 @@ class color( immutable ):
         examples::
         $insert_example( "test_color.py", "color invert example", 2 )
         """
-        return color( 0xFF, 0xFF, 0xFF ) - self
+        return - self
 
     # =======================================================================
 
     def __neg__( self ) -> "color":
-        return color( 0xFF, 0xFF, 0xFF ) - self
+        return color._fast(
+            0xFF - self.red,
+            0xFF - self.green,
+            0xFF - self.blue
+        )
 
     # =======================================================================
 
@@ -768,6 +834,29 @@ class color( immutable ):
     # =======================================================================
 
 
+# ===========================================================================
+
+def _color_members( red: int, green: int, blue: int ) -> color:
+    result = object.__new__( color )
+    members = result.__dict__
+    members[ "red" ] = red
+    members[ "green" ] = green
+    members[ "blue" ] = blue
+    members[ "_frozen" ] = True
+    return result
+
+def _color_setattr( red: int, green: int, blue: int ) -> color:
+    result = object.__new__( color )
+    object.__setattr__( result, "red", red )
+    object.__setattr__( result, "green", green )
+    object.__setattr__( result, "blue", blue )
+    object.__setattr__( result, "_frozen", True )
+    return result
+
+color._fast = _fastest(
+    ( _color_members, _color_setattr ), color, ( 1, 2, 3 ) )
+
+
 # ===========================================================================
 
 class colors:
@@ -22,6 +22,7 @@ running_micropython =  sys.implementation.name == 'micropython'
     
 if running_micropython:
 
+    import micropython
     from micropython import const
     
     import time
@@ -46,7 +47,22 @@ else:
     def const( x: any ): 
         return x
 
-    uint = None
+    # MicroPython recognizes @micropython.native and @micropython.viper
+    # by name when it compiles a function, so code that wants the native
+    # or viper emitter must use those decorators literally.
+    # On CPython this object makes them identity decorators, and the
+    # viper casts below make a viper function run as plain Python.
+    class _micropython:
+        const = staticmethod( const )
+        native = staticmethod( lambda f: f )
+        viper = staticmethod( lambda f: f )
+
+    micropython = _micropython()
+
+    uint = int
+    ptr8 = memoryview
+    ptr16 = lambda buffer: memoryview( buffer ).cast( "H" )
+    ptr32 = lambda buffer: memoryview( buffer ).cast( "I" )
 
     import time
     initial_time = time.monotonic_ns() // 1000
@@ -59,6 +75,23 @@ else:
     from typing import List
     from typing import Dict
     from typing import IO
+
+# framebuf is part of MicroPython,
+# for CPython it is used when an implementation is available
+try:
+    import framebuf
+except ImportError:
+    framebuf = None
+
+# asyncio is not available on all MicroPython ports,
+# older versions call it uasyncio
+try:
+    import asyncio
+except ImportError:
+    try:
+        import uasyncio as asyncio
+    except ImportError:
+        asyncio = None
     
   
 # ===========================================================================
@@ -736,6 +769,22 @@ def time_us() -> int:
         return time.monotonic_ns() // 1000
 
 
+# ===========================================================================
+
+def ticks_diff_us( end: int, start: int ) -> int:
+    """
+    the microseconds from start to end, both returned by time_us()
+
+    On MicroPython time_us() wraps around, so the difference
+    must be calculated by time.ticks_diff().
+    """
+
+    if running_micropython:
+        return time.ticks_diff( end, start )
+    else:
+        return end - start
+
+
 # ===========================================================================
 
 def elapsed_us( f, *args, **kwargs ):
@@ -762,3 +811,16 @@ def sleep_us( t: int ) -> None:
 
 
 # ===========================================================================
+
+async def async_sleep_us( t: int ) -> None:
+    """
+    sleep t microseconds, other tasks can run meanwhile
+    """
+
+    if running_micropython:
+        await asyncio.sleep_ms( ( t + 999 ) // 1000 )
+    else:
+        await asyncio.sleep( t / 1_000_000 )
+
+
+# ===========================================================================
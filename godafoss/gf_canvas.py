@@ -11,6 +11,130 @@
 from godafoss import *
 
 from random import randint
+import array
+
+# ===========================================================================
+
+class pixel_format:
+    """
+    the formats of the pixel data that can be written by canvas.blit()
+
+    The values of the formats that framebuf supports are the
+    framebuf values, so a format can be passed to framebuf.FrameBuffer().
+
+    +------------+------------------------------------------------------+
+    | mono_vlsb  | 1 bit/pixel, each byte is a column of 8 pixels,      |
+    |            | the LSB is the top pixel                             |
+    +------------+------------------------------------------------------+
+    | mono_hlsb  | 1 bit/pixel, each byte is a row of 8 pixels,         |
+    |            | the MSB is the leftmost pixel,                       |
+    |            | each row is padded to a full byte                    |
+    +------------+------------------------------------------------------+
+    | mono_hmsb  | 1 bit/pixel, each byte is a row of 8 pixels,         |
+    |            | the LSB is the leftmost pixel,                       |
+    |            | each row is padded to a full byte                    |
+    +------------+------------------------------------------------------+
+    | rgb565     | 2 bytes/pixel RGB 5,6,5, high byte first             |
+    +------------+------------------------------------------------------+
+    | rgb332     | 1 byte/pixel RGB 3,3,2                               |
+    +------------+------------------------------------------------------+
+    | rgb888     | 3 bytes/pixel, R first                               |
+    +------------+------------------------------------------------------+
+    """
+
+    mono_vlsb = 0
+    rgb565 = 1
+    mono_hlsb = 3
+    mono_hmsb = 4
+    rgb332 = 16
+    rgb888 = 17
+
+    monochrome = ( mono_vlsb, mono_hlsb, mono_hmsb )
+
+
+# ===========================================================================
+
+def _pixel_value(
+    buffer,
+    format: int,
+    size: xy,
+    x: int,
+    y: int
+) -> int:
+    """
+    the value of the pixel at x, y in the pixel data
+    """
+
+    if format == pixel_format.mono_vlsb:
+        return ( buffer[ x + ( y >> 3 ) * size.x ] >> ( y & 0x07 ) ) & 0x01
+
+    elif format == pixel_format.mono_hlsb:
+        return ( buffer[ ( x >> 3 ) + y * ( ( size.x + 7 ) >> 3 ) ]
+            >> ( 7 - ( x & 0x07 ) ) ) & 0x01
+
+    elif format == pixel_format.mono_hmsb:
+        return ( buffer[ ( x >> 3 ) + y * ( ( size.x + 7 ) >> 3 ) ]
+            >> ( x & 0x07 ) ) & 0x01
+
+    elif format == pixel_format.rgb565:
+        i = 2 * ( x + y * size.x )
+        return ( buffer[ i ] << 8 ) | buffer[ i + 1 ]
+
+    elif format == pixel_format.rgb332:
+        return buffer[ x + y * size.x ]
+
+    elif format == pixel_format.rgb888:
+        i = 3 * ( x + y * size.x )
+        return ( buffer[ i ] << 16 ) | ( buffer[ i + 1 ] << 8 ) \
+            | buffer[ i + 2 ]
+
+    raise ValueError( "unsupported pixel format %d" % format )
+
+
+# ===========================================================================
+
+def _pixel_color(
+    format: int,
+    value: int
+) -> color:
+    """
+    the color of a pixel value in a color pixel format
+    """
+
+    if format == pixel_format.rgb565:
+        return color._fast(
+            ( value >> 8 ) & 0xF8,
+            ( value >> 3 ) & 0xFC,
+            ( value << 3 ) & 0xF8
+        )
+
+    elif format == pixel_format.rgb332:
+        return color._fast(
+            value & 0xE0,
+            ( value << 3 ) & 0xE0,
+            ( value << 6 ) & 0xC0
+        )
+
+    return color._fast(
+        ( value >> 16 ) & 0xFF,
+        ( value >> 8 ) & 0xFF,
+        value & 0xFF
+    )
+
+
+# ===========================================================================
+
+def _step( steps ) -> bool:
+    """
+    do the next step of a generator, return whether there was one
+    """
+
+    try:
+        next( steps )
+        return True
+    except StopIteration:
+        return False
+
 
 # ===========================================================================
 
@@ -36,6 +160,13 @@ class canvas:
     canvas, or True for a color canvas.
 
     The write_pixel method writes a single pixel.
+    The fill_span and fill_rect methods write a horizontal or vertical
+    span of pixels, or a filled rectangle of pixels.
+    The blit method writes a rectangle of pixel data.
+    The native_format attribute is the
+    :class:`~godafoss.pixel_format` in which the canvas stores its
+    pixels (None when it has no such format),
+    which can be blitted without conversion.
 
     The write method writes a :class:`~godafoss.shape`.
 
@@ -74,9 +205,64 @@ class canvas:
     ):
         self.size = size
         self.is_color = is_color
+        self.native_format = None
         self._background = background
         self._foreground = - background if self.is_color else not background
         self._dirty = True
+        self._dirty_box_reset( True )
+        self._native_inks = {}
+        self._native_last = None
+        self._native_value = None
+
+    # =======================================================================
+
+    def _dirty_box_reset(
+        self,
+        full: bool = False
+    ) -> None:
+        """
+        reset the dirty box
+
+        :param full: bool
+            True to mark all pixels as written, False to mark none
+
+        The dirty box is the bounding box of the pixels
+        written since the last flush:
+        _dirty_x0 <= x < _dirty_x1 and _dirty_y0 <= y < _dirty_y1.
+        """
+
+        if full:
+            self._dirty_x0, self._dirty_y0 = 0, 0
+            self._dirty_x1, self._dirty_y1 = self.size.x, self.size.y
+        else:
+            self._dirty_x0, self._dirty_y0 = self.size.x, self.size.y
+            self._dirty_x1, self._dirty_y1 = 0, 0
+
+    # =======================================================================
+
+    def _mark_dirty(
+        self,
+        x0: int,
+        y0: int,
+        x1: int,
+        y1: int
+    ) -> None:
+        """
+        mark a rectangle of pixels as written
+
+        This method marks the canvas as dirty, and extends the
+        dirty box to include x0 <= x < x1, y0 <= y < y1.
+        """
+
+        self._dirty = True
+        if x0 < self._dirty_x0:
+            self._dirty_x0 = x0
+        if y0 < self._dirty_y0:
+            self._dirty_y0 = y0
+        if x1 > self._dirty_x1:
+            self._dirty_x1 = x1
+        if y1 > self._dirty_y1:
+            self._dirty_y1 = y1
 
     # =======================================================================
 
@@ -130,6 +316,56 @@ class canvas:
 
     # =======================================================================
 
+    def _encode(
+        self,
+        ink: [ color | bool ]
+    ) -> [ int | color | bool ]:
+        """
+        the native value of a cured ink
+
+        A concrete canvas that stores its pixels in a native format
+        (for instance rgb565) can implement this method
+        to encode an ink into that format.
+        The default implementation returns the ink itself.
+        """
+
+        return ink
+
+    # =======================================================================
+
+    def _native_ink(
+        self,
+        ink: [ color | bool ]
+    ) -> [ int | color | bool ]:
+        """
+        the native value of a cured ink, memoized
+
+        This method returns _encode( ink ).
+        A shape writes all its pixels with the same ink,
+        so the value for the last ink is remembered,
+        and a small dictionary remembers the values for other inks.
+        This way a concrete canvas encodes an ink once per shape,
+        instead of once per pixel.
+        """
+
+        if ink is self._native_last:
+            return self._native_value
+
+        try:
+            value = self._native_inks[ ink ]
+        except KeyError:
+            # keep the dictionary small
+            if len( self._native_inks ) >= 16:
+                self._native_inks.clear()
+            value = self._encode( ink )
+            self._native_inks[ ink ] = value
+
+        self._native_last = ink
+        self._native_value = value
+        return value
+
+    # =======================================================================
+
     def write_pixel(
         self,
         location: xy,
@@ -164,12 +400,252 @@ class canvas:
         be effectuated only when the flush() method is called.
         """
 
-        if ( ink is not None ) and self.within( location ):
+        self.write_pixel_xy( location.x, location.y, ink )
+
+    # =======================================================================
+
+    def write_pixel_xy(
+        self,
+        x: int,
+        y: int,
+        ink: [ color | bool | None ] = True
+    ) -> None:
+        """
+        write a pixel at integer coordinates
+
+        :param x: int
+            the x coordinate of the pixel that is to be written
+
+        :param y: int
+            the y coordinate of the pixel that is to be written
+
+        :param ink: (:class:`~godafoss.color`, bool, None, default: True)
+            the value to be written to the pixel
+
+        This method has the same effect as
+        write_pixel( xy( x, y ), ink ),
+        but no xy object is needed to write the pixel.
+        """
+
+        if (
+            ( ink is not None )
+            and ( 0 <= x < self.size.x )
+            and ( 0 <= y < self.size.y )
+        ):
             ink = self._cure_ink( ink )
-            self._dirty = True
-            self._write_pixel_implementation(
+            self._mark_dirty( x, y, x + 1, y + 1 )
+            self._write_pixel_xy_implementation( x, y, ink )
+
+    # =======================================================================
+
+    def _write_pixel_xy(
+        self,
+        x: int,
+        y: int,
+        ink: [ color | bool ]
+    ) -> None:
+        """
+        write a pixel with an already cured ink
+
+        This method is used by a decorator canvas to write
+        to its subject, which has the same is_color and background.
+        The ink was cured by the decorator, so only the clipping
+        and the dirty box remain to be done.
+        The dirty box is extended by _mark_dirty(), because a
+        concrete canvas can override it to track more than the box.
+        """
+
+        if ( 0 <= x < self.size.x ) and ( 0 <= y < self.size.y ):
+            self._mark_dirty( x, y, x + 1, y + 1 )
+            self._write_pixel_xy_implementation( x, y, ink )
+
+    # =======================================================================
+
+    def _clipped(
+        self,
+        location: xy,
+        size: xy
+    ) -> [ tuple | None ]:
+        """
+        the part of a rectangle that is within the canvas
+
+        This method returns the start and size of the part of the
+        rectangle (specified by its location and size) that is within
+        the canvas, or None when no part of the rectangle is within
+        the canvas.
+        """
+
+        x0 = max( location.x, 0 )
+        y0 = max( location.y, 0 )
+        x1 = min( location.x + size.x, self.size.x )
+        y1 = min( location.y + size.y, self.size.y )
+        if ( x0 >= x1 ) or ( y0 >= y1 ):
+            return None
+        return xy._fast( x0, y0 ), xy._fast( x1 - x0, y1 - y0 )
+
+    # =======================================================================
+
+    def fill_span(
+        self,
+        location: xy,
+        length: int,
+        ink: [ color | bool | None ] = True,
+        vertical: bool = False
+    ) -> None:
+        """
+        write a horizontal or vertical span of pixels
+
+        :param location: :class:`~godafoss.xy`
+            the location of the first (left or top) pixel of the span
+
+        :param length: int
+            the number of pixels in the span
+
+        :param ink: (:class:`~godafoss.color`, bool, None, default: True)
+            the value to be written to the pixels
+
+        :param vertical: bool
+            False (default) for a horizontal span, True for a vertical span
+
+        This method writes the same ink to a span of pixels,
+        which has the same effect as a write_pixel() call
+        for each pixel in the span.
+        The span is clipped to the canvas once,
+        after which a concrete canvas can write the span
+        in a single operation.
+        """
+
+        if ink is not None:
+            clipped = self._clipped(
                 location,
-                ink
+                xy( 1, length ) if vertical else xy( length, 1 )
+            )
+            if clipped is not None:
+                start, size = clipped
+                ink = self._cure_ink( ink )
+                self._mark_dirty(
+                    start.x,
+                    start.y,
+                    start.x + size.x,
+                    start.y + size.y
+                )
+                self._fill_span_implementation(
+                    start,
+                    size.y if vertical else size.x,
+                    vertical,
+                    ink
+                )
+
+    # =======================================================================
+
+    def fill_rect(
+        self,
+        location: xy,
+        size: xy,
+        ink: [ color | bool | None ] = True
+    ) -> None:
+        """
+        write a filled rectangle of pixels
+
+        :param location: :class:`~godafoss.xy`
+            the location of the top-left pixel of the rectangle
+
+        :param size: :class:`~godafoss.xy`
+            the size of the rectangle in x and y direction
+
+        :param ink: (:class:`~godafoss.color`, bool, None, default: True)
+            the value to be written to the pixels
+
+        This method writes the same ink to all pixels of a rectangle,
+        which has the same effect as a write_pixel() call
+        for each pixel in the rectangle.
+        The rectangle is clipped to the canvas once,
+        after which a concrete canvas can write the rectangle
+        in a single operation.
+        """
+
+        if ink is not None:
+            clipped = self._clipped( location, size )
+            if clipped is not None:
+                start, size = clipped
+                ink = self._cure_ink( ink )
+                self._mark_dirty(
+                    start.x,
+                    start.y,
+                    start.x + size.x,
+                    start.y + size.y
+                )
+                self._fill_rect_implementation( start, size, ink )
+
+    # =======================================================================
+
+    def blit(
+        self,
+        buffer: [ bytearray | memoryview ],
+        format: int,
+        size: xy,
+        location: xy = xy( 0, 0 ),
+        ink: [ color | bool | None ] = True,
+        key: [ int | None ] = None
+    ) -> None:
+        """
+        write a rectangle of pixel data
+
+        :param buffer: (bytearray, memoryview)
+            the pixel data
+
+        :param format: int
+            the :class:`~godafoss.pixel_format` of the pixel data
+
+        :param size: :class:`~godafoss.xy`
+            the size of the pixel data in x and y direction
+
+        :param location: :class:`~godafoss.xy`
+            the location of the top-left pixel of the data in the canvas
+
+        :param ink: (:class:`~godafoss.color`, bool, None, default: True)
+            the value to be written for the set pixels of monochrome data
+
+        :param key: (int, None)
+            the (transparent) value of color pixels that are not written
+
+        For monochrome data, the set pixels are written with the ink,
+        the other pixels are not written.
+        For color data, the pixels are written with their color,
+        except for pixels that have the key value.
+        A color canvas can be written with monochrome or color data,
+        a monochrome canvas only with monochrome data.
+
+        The data is clipped to the canvas once.
+        A canvas that has a framebuf can write the data in a single
+        framebuf.blit() call, other canvases write the
+        individual pixels or spans.
+        """
+
+        monochrome = format in pixel_format.monochrome
+        if monochrome and ( ink is None ):
+            return
+        if not ( monochrome or self.is_color ):
+            raise ValueError(
+                "monochrome canvas blit called with color data"
+            )
+
+        clipped = self._clipped( location, size )
+        if clipped is not None:
+            start, part = clipped
+            self._mark_dirty(
+                start.x,
+                start.y,
+                start.x + part.x,
+                start.y + part.y
+            )
+            self._blit_implementation(
+                buffer,
+                format,
+                size,
+                location,
+                self._cure_ink( True if ink is None else ink ),
+                key
             )
 
     # =======================================================================
@@ -203,11 +679,89 @@ class canvas:
         A flush() call is a no-op when no pixels were changed since
         the previous flush() call, unless the forced parameter is True.
         $macro_end
+
+        The canvas keeps track of the bounding box of the pixels
+        that were written since the previous flush() call.
+        A concrete canvas can use this dirty box
+        to transfer only that part of its buffer.
         """
 
         if self._dirty or forced:
             self._dirty = False
             self._flush_implementation( forced )
+            self._dirty_box_reset()
+
+    # =======================================================================
+
+    def flush_done( self ) -> bool:
+        """
+        whether the previous flush has been transferred
+
+        A canvas can transfer (part of) a flush in the background.
+        Such a canvas transfers the next part of it
+        on each flush_done() call,
+        and returns whether the transfer was already complete.
+
+        The default implementation returns True.
+        """
+
+        return True
+
+    # =======================================================================
+
+    def wait_flush( self ) -> None:
+        """
+        complete the transfer started by the previous flush
+        """
+
+        while not self.flush_done():
+            pass
+
+    # =======================================================================
+
+    async def async_flush(
+        self,
+        forced: bool = False
+    ) -> None:
+        """
+        flush, letting other tasks run meanwhile
+
+        :param forced: bool
+            True forces a flush, even when no pixels were written
+
+        This is the asyncio version of flush().
+        It does the flush in bounded steps (for instance, chunks of
+        a transfer to the display), and awaits between the steps.
+        Writes to the canvas meanwhile are effectuated
+        by the next flush.
+        """
+
+        for _ in self._flush_steps( forced ):
+            await asyncio.sleep( 0 )
+
+    # =======================================================================
+
+    def _flush_steps(
+        self,
+        forced: bool
+    ):
+        """
+        a flush, as a generator that yields between the steps
+        """
+
+        if self._dirty or forced:
+            self._dirty = False
+            steps = self._flush_steps_implementation( forced )
+
+            # only the first step uses the dirty box
+            more = _step( steps )
+            self._dirty_box_reset()
+            while more:
+                yield
+                more = _step( steps )
+
+        while not self.flush_done():
+            yield
 
     # =======================================================================
 
@@ -228,7 +782,8 @@ class canvas:
         """
 
         if isinstance( thing, str ):
-            thing = text( thing )
+            # gf_shapes is imported after this module
+            thing = gf.text( thing )
 
         if ink is None:
             thing.write( self, location )
@@ -271,6 +826,7 @@ class canvas:
 
         ink = self._cure_ink( ink )
         self._dirty = True
+        self._dirty_box_reset( True )
         self._clear_implementation( ink )
 
     # =======================================================================
@@ -289,8 +845,9 @@ class canvas:
         :param ink: :class:`~godafoss.color`, bool
             the value to be written to the pixel
 
-        This method must be implemented by a concrete class that
-        inherits from canvas. When this method is called:
+        A concrete class that inherits from canvas must implement
+        either this method or _write_pixel_xy_implementation().
+        When this method is called:
         - the location is within the canvas.
         - for a monochrome canvas, the ink is True.
         - for a color canvas, the ink is a color.
@@ -300,6 +857,205 @@ class canvas:
 
     # =======================================================================
 
+    def _write_pixel_xy_implementation(
+        self,
+        x: int,
+        y: int,
+        ink: [ color | bool ]
+    ) -> None:
+        """
+        write a pixel at integer coordinates (concrete implementation)
+
+        This method should be implemented by a concrete class that
+        inherits from canvas: all pixel writes go through this method.
+        The default implementation calls _write_pixel_implementation().
+        When this method is called the pixel is within the canvas,
+        and the ink is as for _write_pixel_implementation().
+        """
+
+        self._write_pixel_implementation( xy._fast( x, y ), ink )
+
+    # =======================================================================
+
+    def _fill_span_implementation(
+        self,
+        location: xy,
+        length: int,
+        vertical: bool,
+        ink: [ color | bool ]
+    ) -> None:
+        """
+        write a span of pixels (concrete implementation)
+
+        This method can be implemented by a concrete class that
+        inherits from canvas.
+        The default implementation writes the span as a rectangle.
+        When this method is called the span is within the canvas,
+        and the ink is as for _write_pixel_implementation().
+        """
+
+        self._fill_rect_implementation(
+            location,
+            xy( 1, length ) if vertical else xy( length, 1 ),
+            ink
+        )
+
+    # =======================================================================
+
+    def _fill_rect_implementation(
+        self,
+        location: xy,
+        size: xy,
+        ink: [ color | bool ]
+    ) -> None:
+        """
+        write a filled rectangle (concrete implementation)
+
+        This method can be implemented by a concrete class that
+        inherits from canvas.
+        The default implementation writes the individual pixels.
+        When this method is called the rectangle is within the canvas,
+        and the ink is as for _write_pixel_implementation().
+        """
+
+        for x in range( location.x, location.x + size.x ):
+            for y in range( location.y, location.y + size.y ):
+                self._write_pixel_xy_implementation( x, y, ink )
+
+    # =======================================================================
+
+    def _blit_implementation(
+        self,
+        buffer: [ bytearray | memoryview ],
+        format: int,
+        size: xy,
+        location: xy,
+        ink: [ color | bool ],
+        key: [ int | None ]
+    ) -> None:
+        """
+        write a rectangle of pixel data (concrete implementation)
+
+        This method can be implemented by a concrete class that
+        inherits from canvas.
+        The default implementation writes each run of set pixels
+        of monochrome data as a span, and each pixel of color data
+        as a pixel.
+        When this method is called part of the data is within the canvas,
+        and the ink is as for _write_pixel_implementation().
+        """
+
+        start, part = self._clipped( location, size )
+        x0, y0 = start.x - location.x, start.y - location.y
+        x1, y1 = x0 + part.x, y0 + part.y
+
+        if format in pixel_format.monochrome:
+            for y in range( y0, y1 ):
+                run = None
+                for x in range( x0, x1 + 1 ):
+                    if ( x < x1 ) and _pixel_value(
+                        buffer, format, size, x, y
+                    ):
+                        if run is None:
+                            run = x
+                    elif run is not None:
+                        self._fill_span_implementation(
+                            xy._fast( location.x + run, location.y + y ),
+                            x - run,
+                            False,
+                            ink
+                        )
+                        run = None
+
+        else:
+            for y in range( y0, y1 ):
+                for x in range( x0, x1 ):
+                    value = _pixel_value( buffer, format, size, x, y )
+                    if value != key:
+                        self._write_pixel_xy_implementation(
+                            location.x + x,
+                            location.y + y,
+                            _pixel_color( format, value )
+                        )
+
+    # =======================================================================
+
+    def _blit_framebuf(
+        self,
+        target: "framebuf.FrameBuffer",
+        target_format: int,
+        target_ink: int,
+        buffer: [ bytearray | memoryview ],
+        format: int,
+        size: xy,
+        location: xy,
+        ink: [ color | bool ],
+        key: [ int | None ],
+        copy: bool = True
+    ) -> None:
+        """
+        write a rectangle of pixel data to a framebuf
+
+        :param target: framebuf.FrameBuffer
+            the framebuf of the canvas
+
+        :param target_format: int
+            the pixel_format of the framebuf:
+            mono_vlsb, mono_hlsb, mono_hmsb or rgb565
+
+        :param target_ink: int
+            the framebuf value for the ink
+
+        :param copy: bool
+            whether rgb565 data can be copied to the framebuf unchanged
+
+        This method can be called by the _blit_implementation()
+        of a canvas that stores its pixels in a framebuf.
+        Monochrome data is written by a single framebuf.blit() call,
+        with a palette that maps the set pixels to the ink
+        and the other pixels to a transparent value.
+        Rgb565 data is written by a single framebuf.blit() call
+        when copy is True and the framebuf is rgb565.
+        Otherwise the default _blit_implementation() is used.
+
+        The framebuf must store rgb565 high byte first, like the
+        pixel data, and the buffer must be writable.
+        """
+
+        if format in pixel_format.monochrome:
+            other = target_ink ^ (
+                0xFFFF if target_format == pixel_format.rgb565 else 0x01 )
+            palette = framebuf.FrameBuffer(
+                bytearray( 4 ), 2, 1, target_format )
+            palette.pixel( 0, 0, other )
+            palette.pixel( 1, 0, target_ink )
+            target.blit(
+                framebuf.FrameBuffer( buffer, size.x, size.y, format ),
+                location.x,
+                location.y,
+                other,
+                palette
+            )
+
+        elif (
+            copy
+            and ( format == pixel_format.rgb565 )
+            and ( target_format == pixel_format.rgb565 )
+        ):
+            target.blit(
+                framebuf.FrameBuffer( buffer, size.x, size.y, format ),
+                location.x,
+                location.y,
+                -1 if key is None
+                    else ( ( key & 0xFF ) << 8 ) | ( key >> 8 )
+            )
+
+        else:
+            canvas._blit_implementation(
+                self, buffer, format, size, location, ink, key )
+
+    # =======================================================================
+
     def _flush_implementation(
         self,
         forced: bool
@@ -315,6 +1071,51 @@ class canvas:
 
     # =======================================================================
 
+    def _flush_steps_implementation(
+        self,
+        forced: bool
+    ):
+        """
+        flush the canvas content in steps (concrete implementation)
+
+        This generator yields between the steps of the flush.
+        The first step can use the dirty box, the later steps can't.
+
+        The default implementation does the _flush_implementation()
+        as a single step.
+        A concrete class can implement this method to break
+        a long transfer into chunks.
+        """
+
+        self._flush_implementation( forced )
+        yield
+
+    # =======================================================================
+
+    def _rotate_implementation(
+        self,
+        rotation: int
+    ) -> bool:
+        """
+        rotate the canvas in hardware (concrete implementation)
+
+        :param rotation: int
+            the clockwise rotation: 90, 180 or 270
+
+        This method can be implemented by a concrete class that
+        inherits from canvas, when its controller can rotate
+        the scanning of its buffer.
+        It must rotate the canvas (and adapt the size
+        and the buffer to the new orientation) and return True,
+        or return False when the rotation can't be done in hardware.
+        The default implementation returns False,
+        which causes rotate() to raise a ValueError.
+        """
+
+        return False
+
+    # =======================================================================
+
     def _clear_implementation(
         self,
         ink: [ bool | color ]
@@ -335,9 +1136,7 @@ class canvas:
         - for a color canvas, the ink is a color.
         """
 
-        for x in range( 0, self.size.x ):
-            for y in range( 0, self.size.y ):
-                self._write_pixel_implementation( xy( x, y ), ink )
+        self._fill_rect_implementation( xy( 0, 0 ), self.size, ink )
 
     # =======================================================================
 
@@ -347,10 +1146,10 @@ class canvas:
     # =======================================================================
 
     def xy_swapped( self ):
-        return _canvas_transformed(
+        return _transformed(
             self,
             xy( self.size.y, self.size.x ),
-            lambda c: xy( c.y, c.x )
+            swap = True
         )
 
     # =======================================================================
@@ -393,7 +1192,30 @@ class canvas:
         zigzag: bool
     ) -> "canvas":
 
-        return _fold( self, n, zigzag )
+        return _fold( self, n, zigzag )
+
+    # =======================================================================
+
+    def matrix(
+        self,
+        layout: "matrix_layout"
+    ) -> "canvas":
+        """
+        matrix view of a strip
+
+        :param layout: :class:`~godafoss.matrix_layout`
+            the mapping of the matrix pixels to the pixels of the strip
+
+        This method returns a canvas of layout.size, that writes
+        its pixels to the pixels of this (1 pixel high) canvas
+        as mapped by the layout.
+        Spans and rectangles are written as runs of
+        consecutive strip pixels.
+        """
+
+        return _matrix( self, layout )
+
+    # =======================================================================
 
     def part(
         self,
@@ -414,7 +1236,7 @@ class canvas:
         the whole canvas).
         """
 
-        return _part( self, start, size )
+        return _transformed( self, size, dx = start.x, dy = start.y )
 
     # =======================================================================
 
@@ -428,7 +1250,7 @@ class canvas:
         of write_pixel() calls.
         """
 
-        return _inverted( self )
+        return _transformed( self, self.size, invert = True )
 
     # =======================================================================
 
@@ -436,7 +1258,48 @@ class canvas:
         self
     ) -> "canvas":
 
-        return _inverted( self )
+        return self.inverted()
+
+    # =======================================================================
+
+    def rotate(
+        self,
+        rotation: int
+    ) -> None:
+
+        """
+        rotate the canvas itself, in hardware
+
+        This method reconfigures the controller to scan its buffer
+        in the new orientation, so writing to the rotated canvas
+        is as fast as writing to the unrotated canvas.
+        Allowed rotation values are 0, 90, 180 and 270,
+        clockwise and relative to the current orientation:
+        two rotate( 90 ) calls rotate the canvas by 180 degrees.
+
+        What was written before the rotation is not rotated with it,
+        and the canvas is marked as dirty,
+        so the next flush rewrites the whole display.
+        A rotation by 90 or 270 swaps the size of the canvas:
+        views (like part() or rotated()) created before the rotation
+        still have the old size, so they should be created after it.
+
+        A ValueError is raised when the canvas can't
+        do the rotation in hardware, use rotated() instead.
+        """
+
+        if rotation == 0:
+            return
+
+        if rotation not in ( 90, 180, 270 ):
+            raise ValueError( "rotation must be 0, 90, 180 or 270" )
+
+        if not self._rotate_implementation( rotation ):
+            raise ValueError(
+                "rotation %d can't be done in hardware" % rotation )
+
+        self._dirty = True
+        self._dirty_box_reset( True )
 
     # =======================================================================
 
@@ -451,46 +1314,44 @@ class canvas:
         This method returns a canvas that is
         a rotated version of the original canvas.
         Allowed rotation values are 0, 90, 180 and 270.
+
+        The canvas itself is not changed.
+        For a canvas that can rotate in hardware,
+        rotate() rotates the canvas itself, which is faster.
         """
 
         if rotation == 0:
             return _transformed(
                 self,
-                self.size,
-                lambda c: xy(
-                    c.x,
-                    c.y
-                )
+                self.size
             )
 
         elif rotation == 90:
             return _transformed(
                 self,
                 xy( self.size.y, self.size.x ),
-                lambda c: xy(
-                    self.size.x - 1 - c.y,
-                    c.x
-                )
+                swap = True,
+                sx = -1,
+                dx = self.size.x - 1
             )
 
         elif rotation == 180:
             return _transformed(
                 self,
                 self.size,
-                lambda c: xy(
-                    self.size.x - 1 - c.x,
-                    self.size.y - 1 - c.y
-                )
+                sx = -1,
+                sy = -1,
+                dx = self.size.x - 1,
+                dy = self.size.y - 1
             )
 
         elif rotation == 270:
             return _transformed(
                 self,
                 xy( self.size.y, self.size.x ),
-                lambda c: xy(
-                    c.y,
-                    self.size.y - 1 - c.x
-                )
+                swap = True,
+                sy = -1,
+                dy = self.size.y - 1
             )
 
         else:
@@ -529,13 +1390,13 @@ class canvas_dummy( canvas ):
 
     # =======================================================================
 
-    def _write_pixel_implementation(
+    def _write_pixel_xy_implementation(
         self,
-        location,
+        x,
+        y,
         ink
     ):
-        self._lines[ location.y ][ location.x ] = \
-            self._palet[ ink ]
+        self._lines[ y ][ x ] = self._palet[ ink ]
 
     # =======================================================================
 
@@ -603,22 +1464,23 @@ class canvas_native( canvas ):
 
     # =======================================================================
 
-    def _write_pixel_implementation(
+    def _write_pixel_xy_implementation(
         self,
-        location,
+        x,
+        y,
         ink
     ):
-        for x in range( self._scale.x ):
-            for y in range( self._scale.y ):
+        for dx in range( self._scale.x ):
+            for dy in range( self._scale.y ):
 
                 self.pixels[
-                    self._scale.x * location.x + x,
-                    self._scale.y * location.y + y
+                    self._scale.x * x + dx,
+                    self._scale.y * y + dy
                 ] = ( ink.red, ink.green, ink.blue )
 
                 self.window.plot(
-                    self._scale.x * location.x + x,
-                    self._scale.y * location.y + y,
+                    self._scale.x * x + dx,
+                    self._scale.y * y + dy,
                     graphics.color_rgb( ink.red, ink.green, ink.blue )
                 )
 
@@ -669,13 +1531,25 @@ class _add( canvas ):
 
     # =======================================================================
 
-    def _write_pixel_implementation(
+    def _write_pixel_xy_implementation(
+        self,
+        x: int,
+        y: int,
+        ink: [ color, bool ]
+    ) -> None:
+        self._a.write_pixel_xy( x, y, ink )
+        self._b.write_pixel_xy( x, y, ink )
+
+    # =======================================================================
+
+    def _fill_rect_implementation(
         self,
         location: xy,
-        ink: [ color, bool, None ] = True
+        size: xy,
+        ink: [ color, bool ]
     ) -> None:
-        self._a.write_pixel( location, ink )
-        self._b.write_pixel( location, ink )
+        self._a.fill_rect( location, size, ink )
+        self._b.fill_rect( location, size, ink )
 
     # =======================================================================
 
@@ -719,13 +1593,25 @@ class _combine( canvas ):
 
     # =======================================================================
 
-    def _write_pixel_implementation(
+    def _write_pixel_xy_implementation(
+        self,
+        x: int,
+        y: int,
+        ink: [ color, bool ]
+    ) -> None:
+        for c in self._list:
+            c.write_pixel_xy( x, y, ink )
+
+    # =======================================================================
+
+    def _fill_rect_implementation(
         self,
         location: xy,
-        ink: [ color, bool, None ] = True
+        size: xy,
+        ink: [ color, bool ]
     ) -> None:
         for x in self._list:
-            x.write_pixel( location, ink )
+            x.fill_rect( location, size, ink )
 
     # =======================================================================
 
@@ -806,16 +1692,33 @@ class _extend( canvas ):
 
         canvas.__init__( self, size, a.is_color, a._background )
         self._subs = ( ( a, - a_shift ), ( b, - b_shift ) )
+        self._shifts = (
+            ( a, - a_shift.x, - a_shift.y ),
+            ( b, - b_shift.x, - b_shift.y )
+        )
 
     # =======================================================================
 
-    def _write_pixel_implementation(
+    def _write_pixel_xy_implementation(
+        self,
+        x: int,
+        y: int,
+        ink: [ color, bool ]
+    ) -> None:
+        # the two canvases can differ in color and background
+        for canvas, dx, dy in self._shifts:
+            canvas.write_pixel_xy( x + dx, y + dy, ink )
+
+    # =======================================================================
+
+    def _fill_rect_implementation(
         self,
         location: xy,
-        ink: [ color, bool, None ]
+        size: xy,
+        ink: [ color, bool ]
     ) -> None:
         for canvas, offset in self._subs:
-            canvas.write_pixel( location + offset, ink )
+            canvas.fill_rect( location + offset, size, ink )
 
     # =======================================================================
 
@@ -850,17 +1753,17 @@ class _fold( canvas ):
 
     # =======================================================================
 
-    def _write_pixel_implementation(
+    def _write_pixel_xy_implementation(
         self,
-        location: xy,
+        x: int,
+        y: int,
         ink: [ bool, color ]
     ) -> None:
-        x, y = location.x, location.y
         if self._zigzag and ( ( y % 2 ) == 1 ):
             x = self.size.x - ( x + 1 )
         x = x + self.size.x * ( y // self._subject.size.y )
         y = y % self._subject.size.y
-        self._subject.write_pixel( xy( x, y ), ink )
+        self._subject._write_pixel_xy( x, y, ink )
 
     # =======================================================================
 
@@ -883,31 +1786,253 @@ class _fold( canvas ):
 
 # ===========================================================================
 
-class _part( canvas ):
+def _index_runs(
+    indices
+) -> list:
+    """
+    the runs of consecutive indices in a sequence
+
+    A run is a tuple ( start, end, first, step ): the positions
+    start .. end - 1 in the sequence have the indices
+    first, first + step, ..., with step 1 or -1.
+    """
+
+    runs = []
+    start = 0
+    for position in range( 1, len( indices ) + 1 ):
+        if position < len( indices ):
+            step = indices[ position ] - indices[ position - 1 ]
+            if ( step in ( -1, 1 ) ) and (
+                ( position - start == 1 )
+                or ( step == indices[ start + 1 ] - indices[ start ] )
+            ):
+                continue
+        first = indices[ start ]
+        runs.append( (
+            start,
+            position,
+            first,
+            indices[ start + 1 ] - first if position - start > 1 else 1
+        ) )
+        start = position
+    return runs
+
+
+# ===========================================================================
+
+class matrix_layout:
+    """
+    mapping of the pixels of a matrix to the pixels of a strip
+
+    :param size: :class:`~godafoss.xy`
+        the size of a panel
+
+    :param zigzag: bool
+        True (default) when the strip runs back and forth,
+        False when it runs in the same direction for each row (column)
+
+    :param column_major: bool
+        False (default) when the strip runs along the rows of a panel,
+        True when it runs along the columns
+
+    :param mirror_x: bool
+        True when the strip starts at the right of a panel
+        (default: False, it starts at the left)
+
+    :param mirror_y: bool
+        True when the strip starts at the bottom of a panel
+        (default: False, it starts at the top)
+
+    :param panels: :class:`~godafoss.xy`
+        the number of panels in the x and y directions
+        (default: None, which is xy( 1, 1 ))
+
+    :param panels_zigzag: bool
+        True when the chain of panels runs back and forth,
+        False (default) when it runs from left to right for each row
+
+    A matrix of neopixels is a folded strip.
+    A matrix_layout computes for each ( x, y ) of the matrix the
+    index of its pixel in the strip, once, in an array( "H" ) table.
+    Large matrices are often tiled from smaller panels,
+    for instance 8 x 8 panels, chained into 256 x 8
+    (panels = xy( 32, 1 )) or into 64 x 64 (panels = xy( 8, 8 )).
+    The panels are chained row by row, and the pixels of
+    each panel are consecutive in the strip.
+
+    The canvas.matrix() method of a strip returns the matrix canvas.
+    """
+
+    # =======================================================================
+
+    def __init__(
+        self,
+        size: xy,
+        zigzag: bool = True,
+        column_major: bool = False,
+        mirror_x: bool = False,
+        mirror_y: bool = False,
+        panels: xy = None,
+        panels_zigzag: bool = False
+    ):
+        self.panel = size
+        self.panels = xy( 1, 1 ) if panels is None else panels
+        self.size = xy(
+            size.x * self.panels.x,
+            size.y * self.panels.y
+        )
+        if self.size.x * self.size.y > 0x10000:
+            raise ValueError(
+                "matrix of %d pixels" % ( self.size.x * self.size.y ) )
+
+        w, h = size.x, size.y
+        cells = w * h
+
+        def index( x, y ):
+            px, x = divmod( x, w )
+            py, y = divmod( y, h )
+            if panels_zigzag and ( py % 2 == 1 ):
+                px = self.panels.x - 1 - px
+            if mirror_x:
+                x = w - 1 - x
+            if mirror_y:
+                y = h - 1 - y
+            if column_major:
+                if zigzag and ( x % 2 == 1 ):
+                    y = h - 1 - y
+                i = x * h + y
+            else:
+                if zigzag and ( y % 2 == 1 ):
+                    x = w - 1 - x
+                i = y * w + x
+            return ( py * self.panels.x + px ) * cells + i
+
+        self.table = array.array( "H", (
+            index( x, y )
+                for y in range( self.size.y )
+                    for x in range( self.size.x )
+        ) )
+
+        width = self.size.x
+        self._row_runs = [
+            _index_runs( self.table[ y * width : ( y + 1 ) * width ] )
+                for y in range( self.size.y )
+        ]
+        self._column_runs = [
+            _index_runs( [
+                self.table[ x + y * width ]
+                    for y in range( self.size.y )
+            ] )
+                for x in range( width )
+        ]
+
+    # =======================================================================
+
+    def index(
+        self,
+        x: int,
+        y: int
+    ) -> int:
+        """
+        the index in the strip of the pixel at ( x, y )
+        """
+
+        return self.table[ x + y * self.size.x ]
+
+
+# ===========================================================================
+
+class _matrix( canvas ):
 
     def __init__(
         self,
         subject: canvas,
-        start: xy,
-        size: xy
-    ):
+        layout: matrix_layout
+    ) -> None:
+        cells = layout.size.x * layout.size.y
+        if cells > subject.size.x:
+            raise ValueError(
+                "layout of %d pixels on a strip of %d pixels"
+                    % ( cells, subject.size.x ) )
         self._subject = subject
-        self._start = start
+        self._layout = layout
+        self._table = layout.table
+        self._width = layout.size.x
         canvas.__init__(
             self,
-            size,
-            subject.is_color,
-            subject._background
+            layout.size,
+            is_color = subject.is_color,
+            background = subject._background
         )
 
     # =======================================================================
 
-    def _write_pixel_implementation(
+    def _write_pixel_xy_implementation(
+        self,
+        x: int,
+        y: int,
+        ink: [ bool, color ]
+    ) -> None:
+        self._subject._write_pixel_xy(
+            self._table[ x + y * self._width ], 0, ink )
+
+    # =======================================================================
+
+    def _fill_runs(
+        self,
+        runs: list,
+        start: int,
+        end: int,
+        ink: [ bool, color ]
+    ) -> None:
+        for run_start, run_end, first, step in runs:
+            a = max( start, run_start )
+            b = min( end, run_end )
+            if a < b:
+                i = first + step * ( a - run_start )
+                j = i + step * ( b - a - 1 )
+                self._subject.fill_span(
+                    xy._fast( min( i, j ), 0 ), b - a, ink )
+
+    # =======================================================================
+
+    def _fill_span_implementation(
+        self,
+        location: xy,
+        length: int,
+        vertical: bool,
+        ink: [ bool, color ]
+    ) -> None:
+        if vertical:
+            self._fill_runs(
+                self._layout._column_runs[ location.x ],
+                location.y,
+                location.y + length,
+                ink
+            )
+        else:
+            self._fill_runs(
+                self._layout._row_runs[ location.y ],
+                location.x,
+                location.x + length,
+                ink
+            )
+
+    # =======================================================================
+
+    def _fill_rect_implementation(
         self,
         location: xy,
-        ink: [ bool, None ] = True
+        size: xy,
+        ink: [ bool, color ]
     ) -> None:
-        self._subject.write_pixel( self._start + location, ink )
+        for y in range( location.y, location.y + size.y ):
+            self._fill_runs(
+                self._layout._row_runs[ y ],
+                location.x,
+                location.x + size.x,
+                ink
+            )
 
     # =======================================================================
 
@@ -918,12 +2043,20 @@ class _part( canvas ):
         self._subject.flush( forced )
 
     # =======================================================================
-    #
-    # can't use the subject clear() method, because that
-    # would clear all of the subject.
-    #
+
+    def _clear_implementation(
+        self,
+        ink: [ bool,  color ]
+    ) -> None:
+        cells = self.size.x * self.size.y
+        if cells == self._subject.size.x:
+            self._subject.clear( ink )
+        else:
+            self._subject.fill_span( xy( 0, 0 ), cells, ink )
+
     # =======================================================================
 
+
 # ===========================================================================
 
 def _invert_ink( ink: [ bool, color ] ):
@@ -931,81 +2064,337 @@ def _invert_ink( ink: [ bool, color ] ):
 
 # ===========================================================================
 
-class _inverted( canvas ):
+class _transformed( canvas ):
+    """
+    helper class that is a transformed view of a canvas
+
+    :param subject: :class:`~godafoss.canvas`
+        the canvas that is transformed
+
+    :param size: :class:`~godafoss.xy`
+        the size of the transformed canvas
+
+    :param swap: bool
+        True to swap the x and y coordinates
+
+    :param sx, sy: int
+        1, or -1 to mirror the x or y coordinate
+
+    :param dx, dy: int
+        offset that is added to the x or y coordinate
+
+    :param invert: bool
+        True to invert the ink
+
+    A location in the transformed canvas is mapped to a location
+    in the subject by first swapping x and y (when swap is True),
+    and then mapping them to ( sx * x + dx, sy * y + dy ).
+
+    When the subject is itself a _transformed canvas, the two mappings
+    are folded into one, so a chain of rotated(), xy_swapped(), part()
+    and inverted() calls is a single view of the underlying canvas:
+    a pixel write costs a few integer operations,
+    and a span or rectangle is still written as one span or rectangle.
+    The part of the underlying canvas that can be written to
+    (the intersection of all parts in the chain) is kept as
+    the clip rectangle _x0 <= x < _x1, _y0 <= y < _y1.
+    """
 
     def __init__(
         self,
-        subject: canvas
+        subject: canvas,
+        size: xy,
+        swap: bool = False,
+        sx: int = 1,
+        sy: int = 1,
+        dx: int = 0,
+        dy: int = 0,
+        invert: bool = False
     ):
-        self._subject = subject
         canvas.__init__(
             self,
-            subject.size,
-            subject.is_color,
-            subject._background
+            size = size,
+            is_color = subject.is_color,
+            background = subject._background
         )
 
+        if isinstance( subject, _transformed ):
+            if subject._swap:
+                sx, sy, dx, dy = sy, sx, dy, dx
+            self._base = subject._base
+            self._swap = swap != subject._swap
+            self._sx = subject._sx * sx
+            self._sy = subject._sy * sy
+            self._dx = subject._sx * dx + subject._dx
+            self._dy = subject._sy * dy + subject._dy
+            self._invert = invert != subject._invert
+            clip = ( subject._x0, subject._y0, subject._x1, subject._y1 )
+        else:
+            self._base = subject
+            self._swap = swap
+            self._sx, self._dx = sx, dx
+            self._sy, self._dy = sy, dy
+            self._invert = invert
+            clip = ( 0, 0, subject.size.x, subject.size.y )
+
+        self._x0, self._y0, self._x1, self._y1 = clip
+        self._x0, self._y0, self._x1, self._y1 = self._base_rect(
+            0, 0, size.x, size.y )
+
     # =======================================================================
 
-    def _write_pixel_implementation(
+    def _base_rect(
+        self,
+        x0: int,
+        y0: int,
+        x1: int,
+        y1: int
+    ) -> tuple:
+        """
+        map a rectangle to the underlying canvas
+
+        This method returns the rectangle x0 <= x < x1, y0 <= y < y1
+        mapped to the underlying canvas and clipped to the clip rectangle,
+        as an ( x0, y0, x1, y1 ) tuple.
+        The rectangle is empty when x0 >= x1 or y0 >= y1.
+        """
+
+        if self._swap:
+            x0, y0, x1, y1 = y0, x0, y1, x1
+        ax, bx = self._sx * x0 + self._dx, self._sx * ( x1 - 1 ) + self._dx
+        ay, by = self._sy * y0 + self._dy, self._sy * ( y1 - 1 ) + self._dy
+        return (
+            max( min( ax, bx ), self._x0 ),
+            max( min( ay, by ), self._y0 ),
+            min( max( ax, bx ) + 1, self._x1 ),
+            min( max( ay, by ) + 1, self._y1 )
+        )
+
+    # =======================================================================
+
+    def _ink(
+        self,
+        ink: [ bool, color ]
+    ) -> [ bool, color ]:
+        return _invert_ink( ink ) if self._invert else ink
+
+    # =======================================================================
+
+    def _write_pixel_xy_implementation(
+        self,
+        x: int,
+        y: int,
+        ink: [ bool, color ]
+    ) -> None:
+        if self._swap:
+            x, y = y, x
+        x = self._sx * x + self._dx
+        y = self._sy * y + self._dy
+        if ( self._x0 <= x < self._x1 ) and ( self._y0 <= y < self._y1 ):
+            self._base._write_pixel_xy(
+                x,
+                y,
+                _invert_ink( ink ) if self._invert else ink
+            )
+
+    # =======================================================================
+
+    def _fill_span_implementation(
+        self,
+        location: xy,
+        length: int,
+        vertical: bool,
+        ink: [ bool, color ]
+    ) -> None:
+        x0, y0, x1, y1 = self._base_rect(
+            location.x,
+            location.y,
+            location.x + ( 1 if vertical else length ),
+            location.y + ( length if vertical else 1 )
+        )
+        if ( x0 < x1 ) and ( y0 < y1 ):
+            vertical = ( x1 - x0 ) == 1
+            self._base.fill_span(
+                xy._fast( x0, y0 ),
+                ( y1 - y0 ) if vertical else ( x1 - x0 ),
+                self._ink( ink ),
+                vertical
+            )
+
+    # =======================================================================
+
+    def _fill_rect_implementation(
         self,
         location: xy,
+        size: xy,
         ink: [ bool, color ]
     ) -> None:
-        self._subject.write_pixel(
+        x0, y0, x1, y1 = self._base_rect(
+            location.x,
+            location.y,
+            location.x + size.x,
+            location.y + size.y
+        )
+        if ( x0 < x1 ) and ( y0 < y1 ):
+            self._base.fill_rect(
+                xy._fast( x0, y0 ),
+                xy._fast( x1 - x0, y1 - y0 ),
+                self._ink( ink )
+            )
+
+    # =======================================================================
+
+    def _blit_implementation(
+        self,
+        buffer: [ bytearray | memoryview ],
+        format: int,
+        size: xy,
+        location: xy,
+        ink: [ color | bool ],
+        key: [ int | None ]
+    ) -> None:
+
+        # a shifted view can pass the data on
+        # when what lands on the underlying canvas is within the clip
+        if (
+            ( not self._swap )
+            and ( not self._invert )
+            and ( self._sx == 1 )
+            and ( self._sy == 1 )
+        ):
+            x, y = location.x + self._dx, location.y + self._dy
+            if (
+                ( max( x, 0 ) >= self._x0 )
+                and ( max( y, 0 ) >= self._y0 )
+                and ( min( x + size.x, self._base.size.x ) <= self._x1 )
+                and ( min( y + size.y, self._base.size.y ) <= self._y1 )
+            ):
+                self._base.blit(
+                    buffer,
+                    format,
+                    size,
+                    xy._fast( x, y ),
+                    ink,
+                    key
+                )
+                return
+
+        canvas._blit_implementation(
+            self,
+            buffer,
+            format,
+            size,
             location,
-            _invert_ink( ink )
+            ink,
+            key
         )
 
     # =======================================================================
 
-    def _flush_implementation(
+    def flush(
+        self,
+        forced: bool = False
+    ) -> None:
+        self._base.flush( forced )
+
+    # =======================================================================
+
+    def flush_done( self ) -> bool:
+        return self._base.flush_done()
+
+    # =======================================================================
+
+    def _flush_steps(
         self,
         forced: bool
+    ):
+        return self._base._flush_steps( forced )
+
+    # =======================================================================
+
+    def _clear_implementation(
+        self,
+        ink: [ bool, color ]
     ) -> None:
-        self._subject.flush( forced )
+        if ( self._x0, self._y0, self._x1, self._y1 ) == (
+            0, 0, self._base.size.x, self._base.size.y
+        ):
+            self._base.clear( self._ink( ink ) )
+        elif ( self._x0 < self._x1 ) and ( self._y0 < self._y1 ):
+            self._base.fill_rect(
+                xy._fast( self._x0, self._y0 ),
+                xy._fast( self._x1 - self._x0, self._y1 - self._y0 ),
+                self._ink( ink )
+            )
 
     # =======================================================================
 
 
 # ===========================================================================
 
-class _transformed( canvas ):
+class frame_pacer:
     """
-    helper class that is a transformed version of the canvas
+    flush a canvas at most once per frame interval
+
+    :param subject: :class:`~godafoss.canvas`
+        the canvas to be flushed
+
+    :param frame_us: int
+        the frame interval in microseconds
+        (default: 40_000, which is 25 frames per second)
+
+    Tasks that write to the canvas call request()
+    instead of flushing the canvas themselves.
+    The run() task flushes the canvas with async_flush(),
+    at most once per frame interval,
+    so all requests made during a frame interval
+    are combined into one flush.
     """
 
-    def __init__( self, subject, size, transform_location ):
-        self._subject = subject
-        self._transform_location = transform_location
-        canvas.__init__(
-            self,
-            size = size,
-            is_color = subject.is_color,
-            background = subject._background
-        )
+    # =======================================================================
 
-    def write_pixel(
+    def __init__(
         self,
-        location: xy,
-        ink: [ bool, None ] = True
+        subject: canvas,
+        frame_us: int = 40_000
     ) -> None:
-        p = self._transform_location( location )
-        if self._subject.within( p ):
-            self._subject.write_pixel( p, ink )
+        self.subject = subject
+        self.frame_us = frame_us
+        self.frames = 0
+        self._requested = asyncio.Event()
 
     # =======================================================================
 
-    def flush(
+    def request( self ) -> None:
+        """
+        request a flush of the canvas
+        """
+
+        self._requested.set()
+
+    # =======================================================================
+
+    async def run(
         self,
-        forced: bool = False
+        frames: int = None
     ) -> None:
-        self._subject.flush( forced )
+        """
+        the task that flushes the canvas when requested
 
-    # =======================================================================
+        :param frames: int | None
+            the number of flushes after which the task returns,
+            None (default) for never
+        """
 
-    def clear( self, ink: bool = False ) -> None:
-        self._subject.clear( ink )
+        for _ in repeater( frames ):
+            await self._requested.wait()
+            self._requested.clear()
+            start = time_us()
+            await self.subject.async_flush()
+            self.frames += 1
+            rest = self.frame_us - ticks_diff_us( time_us(), start )
+            if rest > 0:
+                await async_sleep_us( rest )
 
     # =======================================================================
 
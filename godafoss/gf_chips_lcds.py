@@ -313,11 +313,14 @@ class generic_color_lcd(
         method to transport data to the LCD when the LCD is
         use in monochrome mode.
         
-        The default value of 0 uses a 4k lookup table.
-        When this memory use is a problem, 1 can be specified.
-        This setting uses a line buffer of 2 bytes per pixel in the x
-        direction (256 bytes for 128 x 128 display) and calculates
-        the data on the fly, which is much slower.
+        The default value of 3 uses a line buffer of 2 bytes per pixel
+        in the x direction (256 bytes for a 128 x 128 display).
+        Each line is expanded into this buffer by a framebuf blit
+        with a 2-color palette, and written to the LCD.
+
+        The value 0 uses a 4k lookup table.
+        The value 1 uses the same line buffer as 3,
+        but calculates the data pixel by pixel, which is much slower.
         
         For a RP2040 chip setting 2 uses a PIO engine to
         generate the data.
@@ -337,8 +340,42 @@ class generic_color_lcd(
         +-----------------+--------------+---------------------+
         | monochrome      | 2            | 114 ms              |
         +-----------------+--------------+---------------------+       
+
+    :param monochrome_on: :class:`~godafoss.color`
+        the color of a set pixel in monochrome mode
+        (default: colors.white)
+
+    :param monochrome_off: :class:`~godafoss.color`
+        the color of a pixel that is not set in monochrome mode
+        (default: colors.black)
+
+    :param double_buffered: bool
+        transfer the frame in the background (default: False)
+
+        In color mode, this uses a second (front) buffer
+        of the same size as the (back) buffer that is drawn on.
+        A flush() copies the changed rows to the front buffer,
+        transfers the first chunk of it, but doesn't wait for the rest.
+        Meanwhile, the application can draw the next frame.
+
+        There is no interrupt or thread that does the transfer:
+        the rest of the frame is only transferred (and shown) when
+        the application calls flush_done() (which transfers one chunk),
+        wait_flush() or the next flush() (which transfer all),
+        or runs an async_flush().
+        Each chunk is a separate SPI transaction that sets its own
+        window, so other devices on the same SPI bus
+        can be used between the chunks.
+
+    :param chunk_size: int
+        the maximum number of bytes in a chunk of a background
+        or async transfer, a chunk is at least one row of
+        the transferred window (default: 1024)
     
     This class is the base for various SPI color LCDs.
+
+    In color mode, flush() transfers only the window that contains
+    the pixels that were written since the previous flush().
     """
 
     # =======================================================================
@@ -372,7 +409,11 @@ class generic_color_lcd(
         background: gf.color = gf.colors.black, 
         monochrome: bool = False,
         color_order: str = "RGB",
-        mechanism: int = 0,
+        mechanism: int = 3,
+        monochrome_on: gf.color = gf.colors.white,
+        monochrome_off: gf.color = gf.colors.black,
+        double_buffered: bool = False,
+        chunk_size: int = 1024,
         invert: bool = False,
         mirror_x: bool = False,
         mirror_y: bool = False,
@@ -382,6 +423,7 @@ class generic_color_lcd(
         orientation: gf.orientation = gf.orientation.north
     ):
         
+        offsets = offset
         if not isinstance( offset, gf.xy ):
             offset = offset[ orientation - gf.orientation.north ]
         
@@ -408,11 +450,20 @@ class generic_color_lcd(
             raise Exception( f"invalid orientation {orientation}" )        
         
         self._color_order = color_order
+        self._x_deadband = x_deadband
         self._invert = invert
         self._mirror_x = mirror_x
         self._mirror_y = mirror_y
         self._swap_xy = swap_xy
         self._offset = offset
+        self._offsets = offsets
+        self._orientation = orientation
+        self._buffer = None
+        self._line_buffer = None
+        self._double_buffered = double_buffered
+        self._front = None
+        self._chunk_size = chunk_size
+        self._transfer = None
         
         gf.canvas.__init__(
             self,
@@ -450,14 +501,7 @@ class generic_color_lcd(
         self.write_command( self.commands.colmod, [ 0x55 ] ) 
         
         # swapping and mirroring
-        m = 0x00
-        if self._swap_xy:
-            m |= 0x20
-        if self._mirror_x:
-            m |= 0x40
-        if self._mirror_y:
-            m |= 0x80
-        self.write_command( self.commands.madctl, [ m ] )  
+        self._write_madctl()
 
         # row and column length
         self.write_command( self.commands.caset, [
@@ -479,56 +523,55 @@ class generic_color_lcd(
         # display on
         self.write_command( self.commands.dispon )        
                
+        color_order = ( color_order or "RGB" ).upper()
+        self._color_order = color_order
+        if color_order == "RGB":
+            encode = lambda c: _encode_565( c.red, c.green, c.blue )
+
+        elif color_order == "RBG":
+            encode = lambda c: _encode_565( c.red, c.blue, c.green )
+
+        elif color_order == "GRB":
+            encode = lambda c: _encode_565( c.green, c.red, c.blue )
+
+        elif color_order == "GBR":
+            encode = lambda c: _encode_565( c.green, c.blue, c.red )
+
+        elif color_order == "BRG":
+            encode = lambda c: _encode_565( c.blue, c.red, c.green )
+
+        elif color_order == "BGR":
+            encode = lambda c: _encode_565( c.blue, c.green, c.red )
+
+        else:
+            raise ValueError( "unsupported color order '%s'" % color_order )
+
         if self.is_color:
         
-            color_order = color_order.upper()
-            if color_order == "RGB":
-                self._encode = lambda c: _encode_565( c.red, c.green, c.blue )
-                
-            elif color_order == "RBG":
-                self._encode = lambda c: _encode_565( c.red, c.blue, c.green )
-                
-            elif color_order == "GRB":
-                self._encode = lambda c: _encode_565( c.green, c.red, c.blue )
-                
-            elif color_order == "GBR":
-                self._encode = lambda c: _encode_565( c.green, c.blue, c.red )
-                 
-            elif color_order == "BRG":
-                self._encode = lambda c: _encode_565( c.blue, c.red, c.green )
-                
-            elif color_order == "BGR":
-                self._encode = lambda c: _encode_565( c.blue, c.green, c.red )
-                
-            else:
-                raise ValueError( "unsupported color order '%s'" % color_order )   
+            self._encode = encode
         
             # import gc; gc.collect()
-            self._buffer = bytearray( 
-                2 * self.size.y * ( self.size.x + x_deadband ) )
-            self._framebuffer = framebuf.FrameBuffer(
-                self._buffer, 
-                self.size.x + x_deadband, 
-                self.size.y, 
-                framebuf.RGB565 
-            )
+            self._framebuffer_create()
             
+            if color_order == "RGB":
+                self.native_format = gf.pixel_format.rgb565
+
             self._flush_data_transport = \
                self._flush_data_transport_color                        
             
         else:    
+            if double_buffered:
+                raise ValueError( "double buffering requires color mode" )
+
             self._encode = lambda x: x
         
-            self._buffer_size = \
-                ( ( self.size.x + x_deadband ) * ( self.size.y ) + 7 ) // 8
-            self._buffer = bytearray( self._buffer_size )
-            self._framebuffer = framebuf.FrameBuffer(
-                self._buffer, 
-                self.size.x + x_deadband, 
-                self.size.y, 
-                framebuf.MONO_HLSB 
-            )
+            self._framebuffer_create()
             
+            # the rgb565 values of the set and cleared pixels,
+            # byte-swapped like the values in a RGB565 framebuffer
+            self._on = encode( monochrome_on )
+            self._off = encode( monochrome_off )
+
             if mechanism == 0:
                 
                # create fast-lookup for 8 pixels at a time
@@ -538,9 +581,9 @@ class generic_color_lcd(
                     i = 0
                     m = 0x80
                     for _ in range( 8 ):
-                        c = 0xFF if v & m != 0 else 0x00
-                        self._pixels[ v ][ i ] = c                  
-                        self._pixels[ v ][ i + 1 ] = c
+                        c = self._on if v & m != 0 else self._off
+                        self._pixels[ v ][ i ] = c & 0xFF
+                        self._pixels[ v ][ i + 1 ] = c >> 8
                         m = m >> 1
                         i += 2
                         
@@ -549,7 +592,7 @@ class generic_color_lcd(
                 
             elif mechanism == 1:
                 
-               self._line_buffer = bytearray( 2 * self.size.x )
+               self._line_buffer_create()
                self._flush_data_transport = \
                   self._flush_data_transport_monochrome_line_buffer                        
                 
@@ -569,38 +612,372 @@ class generic_color_lcd(
                 self._flush_data_transport = \
                     self._flush_data_transport_monochrome_rp2_pio
         
+            elif mechanism == 3:
+
+                # the two colors, indexed by the value of a mono pixel
+                self._palette = framebuf.FrameBuffer(
+                    bytearray( 4 ), 2, 1, framebuf.RGB565 )
+                self._palette.pixel( 0, 0, self._off )
+                self._palette.pixel( 1, 0, self._on )
+
+                self._line_buffer_create()
+                self._flush_data_transport = \
+                    self._flush_data_transport_monochrome_palette
+
             else:
                 raise ValueError( "undefined mechanism '%d'" % mechanism )
             
     # =======================================================================
+
+    def _write_madctl( self ) -> None:
+        """
+        write the swapping and mirroring to the chip
+        """
+
+        m = 0x00
+        if self._swap_xy:
+            m |= 0x20
+        if self._mirror_x:
+            m |= 0x40
+        if self._mirror_y:
+            m |= 0x80
+        self.write_command( self.commands.madctl, [ m ] )
+
+    # =======================================================================
+
+    def _framebuffer_create( self ) -> None:
+        """
+        create the framebuffer for the current size
+
+        The existing buffer is re-used when it has the required size.
+        """
+
+        if self.is_color:
+            self._buffer_size = \
+                2 * self.size.y * ( self.size.x + self._x_deadband )
+        else:
+            # MONO_HLSB: each row starts at a byte
+            self._buffer_size = \
+                ( ( self.size.x + self._x_deadband + 7 ) // 8 ) * self.size.y
+
+        if (
+            ( self._buffer is None )
+            or ( len( self._buffer ) != self._buffer_size )
+        ):
+            self._buffer = bytearray( self._buffer_size )
+
+        if self._double_buffered and (
+            ( self._front is None )
+            or ( len( self._front ) != self._buffer_size )
+        ):
+            self._front = bytearray( self._buffer_size )
+
+        self._framebuffer = framebuf.FrameBuffer(
+            self._buffer,
+            self.size.x + self._x_deadband,
+            self.size.y,
+            framebuf.RGB565 if self.is_color else framebuf.MONO_HLSB
+        )
+
+    # =======================================================================
+
+    def _line_buffer_create( self ) -> None:
+        """
+        create the rgb565 buffer for one line of the current width
+        """
+
+        self._line_buffer = bytearray( 2 * self.size.x )
+        self._line_framebuffer = framebuf.FrameBuffer(
+            self._line_buffer,
+            self.size.x,
+            1,
+            framebuf.RGB565
+        )
+
+    # =======================================================================
+
+    def _rotate_implementation(
+        self,
+        rotation: int
+    ) -> bool:
+        """
+        rotate the lcd by changing its scan direction (MADCTL)
+
+        The framebuffer is re-used in the new orientation.
+        A rotation by 90 or 270 swaps the x and y sizes,
+        which can't be done in hardware when there is an x deadband.
+        """
+
+        swap = rotation != 180
+        if swap and ( self._x_deadband != 0 ):
+            return False
+
+        self.wait_flush()
+
+        # the rotation as swapping and mirroring,
+        # the mirroring is done after the current swapping
+        mirror_x = rotation in ( 90, 180 )
+        mirror_y = rotation in ( 180, 270 )
+        if self._swap_xy:
+            mirror_x, mirror_y = mirror_y, mirror_x
+        self._swap_xy = self._swap_xy != swap
+        self._mirror_x = self._mirror_x != mirror_x
+        self._mirror_y = self._mirror_y != mirror_y
+
+        # each clockwise quarter turn is one orientation step back
+        self._orientation = gf.orientation.north + (
+            ( self._orientation - gf.orientation.north - rotation // 90 )
+                % 4 )
+        offset = self._offsets
+        if not isinstance( offset, gf.xy ):
+            offset = offset[ self._orientation - gf.orientation.north ]
+        if self._orientation in ( gf.orientation.east, gf.orientation.west ):
+            offset = gf.xy( offset.y, offset.x )
+        self._offset = offset
+
+        if swap:
+            self.size = gf.xy( self.size.y, self.size.x )
+            self._framebuffer_create()
+            if self._line_buffer is not None:
+                self._line_buffer_create()
+
+        self._write_madctl()
+        return True
+
+    # =======================================================================
        
     def _flush_implementation(
         self,
         forced: bool
-    ) -> None:     
-        
-        x_end = self.size.x - 1 + self._offset.x
+    ) -> None:
+
+        # a background transfer is completed first
+        self.wait_flush()
+
+        if self._double_buffered:
+            if forced:
+                self._flush_double_buffered(
+                    0, 0, self.size.x, self.size.y )
+            else:
+                self._flush_double_buffered(
+                    self._dirty_x0, self._dirty_y0,
+                    self._dirty_x1, self._dirty_y1
+                )
+            return
+
+        # the monochrome transports always convert the whole buffer
+        if (
+            forced
+            or ( not self.is_color )
+            or (
+                ( self._dirty_x1 - self._dirty_x0 == self.size.x )
+                and ( self._dirty_y1 - self._dirty_y0 == self.size.y )
+            )
+        ):
+            self._flush_window( 0, 0, self.size.x, self.size.y )
+            self._flush_data_transport()
+
+        else:
+            self._flush_window(
+                self._dirty_x0, self._dirty_y0,
+                self._dirty_x1, self._dirty_y1
+            )
+            self._flush_data_transport_color_window(
+                self._dirty_x0, self._dirty_y0,
+                self._dirty_x1, self._dirty_y1
+            )
+
+    # =======================================================================
+
+    def _flush_double_buffered(
+        self,
+        x0: int,
+        y0: int,
+        x1: int,
+        y1: int
+    ) -> None:
+        """
+        copy the changed rows to the front buffer and start its transfer
+        """
+
+        stride = 2 * ( self.size.x + self._x_deadband )
+        self._front[ y0 * stride : y1 * stride ] = \
+            memoryview( self._buffer )[ y0 * stride : y1 * stride ]
+
+        # the first chunk is transferred right away
+        self._transfer = self._transfer_chunks(
+            self._front, x0, y0, x1, y1 )
+        self.flush_done()
+
+    # =======================================================================
+
+    def _transfer_chunks(
+        self,
+        buffer: bytearray,
+        x0: int,
+        y0: int,
+        x1: int,
+        y1: int
+    ):
+        """
+        write the x0 <= x < x1, y0 <= y < y1 part of a buffer
+
+        This is a generator that yields after each chunk.
+        A chunk is as many rows of the window as fit in the chunk size
+        (but at least one row), written as a complete transaction:
+        the window of its rows, a RAMWR command, and the data.
+        Hence the chip select is not active between the chunks,
+        and another device on the same bus can be used meanwhile.
+        """
+
+        stride = 2 * ( self.size.x + self._x_deadband )
+        width = 2 * ( x1 - x0 )
+        data = memoryview( buffer )
+        rows = max( 1, self._chunk_size // width )
+
+        # complete rows are a contiguous part of the buffer
+        contiguous = ( x0 == 0 ) and ( width == stride )
+
+        for y in range( y0, y1, rows ):
+            end = min( y + rows, y1 )
+            self._flush_window( x0, y, x1, end )
+            self.write_command( self.commands.ramwr )
+            self._data_command.write( 1 )
+            self._chip_select.write( 0 )
+
+            if contiguous:
+                self._spi.write( data[ y * stride : end * stride ] )
+            else:
+                start = y * stride + 2 * x0
+                for _ in range( y, end ):
+                    self._spi.write( data[ start : start + width ] )
+                    start += stride
+
+            self._chip_select.write( 1 )
+            yield
+
+    # =======================================================================
+
+    def flush_done( self ) -> bool:
+        """
+        whether the previous flush has been transferred
+
+        In double buffered mode, a flush() only starts
+        the transfer of the frame, and an async_flush() transfers
+        its frame in chunks.
+        A flush_done() call transfers the next chunk of such
+        a transfer, and returns whether it was already complete.
+
+        Otherwise a flush() transfers the frame
+        and flush_done() returns True.
+        """
+
+        if self._transfer is not None:
+            try:
+                next( self._transfer )
+                return False
+            except StopIteration:
+                self._transfer = None
+        return True
+
+    # =======================================================================
+
+    def _flush_steps_implementation(
+        self,
+        forced: bool
+    ):
+        if not self.is_color:
+            yield from gf.canvas._flush_steps_implementation( self, forced )
+            return
+
+        # only the first step can use the dirty box
+        if forced:
+            x0, y0, x1, y1 = 0, 0, self.size.x, self.size.y
+        else:
+            x0, y0 = self._dirty_x0, self._dirty_y0
+            x1, y1 = self._dirty_x1, self._dirty_y1
+
+        # a transfer that is still running is completed first
+        while not self.flush_done():
+            yield
+
+        # the chunks are transferred by the flush_done() steps,
+        # so a flush() meanwhile first completes this transfer
+        if self._double_buffered:
+            self._flush_double_buffered( x0, y0, x1, y1 )
+        else:
+            self._transfer = self._transfer_chunks(
+                self._buffer, x0, y0, x1, y1 )
+
+    # =======================================================================
+
+    def _flush_window(
+        self,
+        x0: int,
+        y0: int,
+        x1: int,
+        y1: int
+    ) -> None:
+        """
+        set the lcd window to x0 <= x < x1, y0 <= y < y1
+        """
+
+        x0 += self._offset.x
+        x1 += self._offset.x - 1
         self.write_command( self.commands.caset, [
-            0x00, self._offset.x, 
-            x_end // 256, x_end % 256
+            x0 >> 8, x0 & 0xFF,
+            x1 >> 8, x1 & 0xFF
         ])
-        
-        y_end = self.size.y - 1 + self._offset.y
-        self.write_command( self.commands.raset, [ 
-            0x00, self._offset.y,
-            y_end // 256, y_end % 256
+
+        y0 += self._offset.y
+        y1 += self._offset.y - 1
+        self.write_command( self.commands.raset, [
+            y0 >> 8, y0 & 0xFF,
+            y1 >> 8, y1 & 0xFF
         ])
-        
-        self._flush_data_transport()             
-                
+
     # =======================================================================
-    
+
     def _flush_data_transport_color( self ):
         self.write_command( self.commands.ramwr, buffer = self._buffer )
-      
+
     # =======================================================================
-    
-    #@micropython.native      
+
+    def _flush_data_transport_color_window(
+        self,
+        x0: int,
+        y0: int,
+        x1: int,
+        y1: int
+    ) -> None:
+        """
+        write the x0 <= x < x1, y0 <= y < y1 part of the buffer
+        """
+
+        stride = 2 * ( self.size.x + self._x_deadband )
+        data = memoryview( self._buffer )
+
+        self.write_command( self.commands.ramwr )
+        self._data_command.write( 1 )
+        self._chip_select.write( 0 )
+
+        if ( x0 == 0 ) and ( 2 * x1 == stride ):
+            # complete rows are a contiguous part of the buffer
+            self._spi.write( data[ y0 * stride : y1 * stride ] )
+
+        else:
+            start = y0 * stride + 2 * x0
+            end = start + 2 * ( x1 - x0 )
+            for _ in range( y0, y1 ):
+                self._spi.write( data[ start : end ] )
+                start += stride
+                end += stride
+
+        self._chip_select.write( 1 )
+
+    # =======================================================================
+
+    @micropython.native
     def _flush_data_transport_monochrome_lookup( self ):       
         self.write_command( self.commands.ramwr )
         self._data_command.write( 1 )
@@ -621,23 +998,45 @@ class generic_color_lcd(
             if i >= _m:
                 ww( p )
                 i = 0
+        if i > 0:
+            ww( memoryview( p )[ : i ] )
                 
         self._chip_select.write( 1 )        
       
     # =======================================================================
     
-    #@micropython.native      
+    @micropython.native
     def _flush_data_transport_monochrome_line_buffer( self ):       
-        self.write_command( self._driver.command.ramwr )
+        self.write_command( self.commands.ramwr )
         self._data_command.write( 1 )
         self._chip_select.write( 0 )
         for y in range( self.size.y ):
             for x in range( self.size.x ):
-                c = 0xFF if self._framebuffer.pixel( x, y ) else 0x00
-                self._line_buffer[ 2 * x ] = c                  
-                self._line_buffer[ 2 * x + 1 ] = c                  
+                pixel = self._framebuffer.pixel( x, y )
+                c = self._on if pixel else self._off
+                self._line_buffer[ 2 * x ] = c & 0xFF
+                self._line_buffer[ 2 * x + 1 ] = c >> 8
             self._spi.write( self._line_buffer )         
+        self._chip_select.write( 1 )
+
+    # =======================================================================
+
+    def _flush_data_transport_monochrome_palette( self ):
+        self.write_command( self.commands.ramwr )
+        self._data_command.write( 1 )
         self._chip_select.write( 0 )
+
+        line = self._line_framebuffer
+        source = self._framebuffer
+        palette = self._palette
+        write = self._spi.write
+
+        for y in range( self.size.y ):
+            # the blit is clipped to row y of the source
+            line.blit( source, 0, -y, -1, palette )
+            write( self._line_buffer )
+
+        self._chip_select.write( 1 )
      
     # =======================================================================
 
@@ -645,22 +1044,73 @@ class generic_color_lcd(
         self,
         ink: gf.color
     ):
-        self._framebuffer.fill( self._encode( ink ) )
+        self._framebuffer.fill( self._native_ink( ink ) )
         
     # =======================================================================
         
-    def _write_pixel_implementation( 
+    def _write_pixel_xy_implementation(
         self, 
-        location: ( int, gf.xy ), 
+        x: int,
+        y: int,
         ink: gf.color
     ):
         self._framebuffer.pixel(
-            location.x,
-            location.y,
-            self._encode( ink )
+            x,
+            y,
+            self._native_ink( ink )
         )
         
     # =======================================================================
+
+    def _fill_span_implementation(
+        self,
+        location: gf.xy,
+        length: int,
+        vertical: bool,
+        ink: gf.color
+    ):
+        if vertical:
+            self._framebuffer.vline(
+                location.x, location.y, length, self._native_ink( ink ) )
+        else:
+            self._framebuffer.hline(
+                location.x, location.y, length, self._native_ink( ink ) )
+
+    # =======================================================================
+
+    def _fill_rect_implementation(
+        self,
+        location: gf.xy,
+        size: gf.xy,
+        ink: gf.color
+    ):
+        self._framebuffer.fill_rect(
+            location.x, location.y, size.x, size.y, self._native_ink( ink ) )
+
+    # =======================================================================
+
+    def _blit_implementation(
+        self,
+        buffer: bytearray,
+        format: int,
+        size: gf.xy,
+        location: gf.xy,
+        ink: gf.color,
+        key: int | None
+    ):
+        if self.is_color:
+            self._blit_framebuf(
+                self._framebuffer, gf.pixel_format.rgb565,
+                self._native_ink( ink ),
+                buffer, format, size, location, ink, key,
+                copy = self._color_order == "RGB" )
+        else:
+            self._blit_framebuf(
+                self._framebuffer, gf.pixel_format.mono_hlsb,
+                1 if ink else 0,
+                buffer, format, size, location, ink, key )
+
+    # =======================================================================
     
     
 # ===========================================================================
@@ -787,9 +1237,10 @@ class pcd8544(
         
     # =======================================================================    
 
-    def _write_pixel_implementation( 
+    def _write_pixel_xy_implementation(
         self, 
-        location: gf.xy, 
+        x: int,
+        y: int,
         ink: bool
     ) -> None:
         """
@@ -797,10 +1248,50 @@ class pcd8544(
         """
                
         self._framebuf.pixel( 
-            location.x, 
-            location.y, 
+            x,
+            y,
             ink
         )
+
+    # =======================================================================
+
+    def _fill_span_implementation(
+        self,
+        location: gf.xy,
+        length: int,
+        vertical: bool,
+        ink: bool
+    ) -> None:
+        if vertical:
+            self._framebuf.vline( location.x, location.y, length, ink )
+        else:
+            self._framebuf.hline( location.x, location.y, length, ink )
+
+    # =======================================================================
+
+    def _fill_rect_implementation(
+        self,
+        location: gf.xy,
+        size: gf.xy,
+        ink: bool
+    ) -> None:
+        self._framebuf.fill_rect(
+            location.x, location.y, size.x, size.y, ink )
+
+    # =======================================================================
+
+    def _blit_implementation(
+        self,
+        buffer: bytearray,
+        format: int,
+        size: gf.xy,
+        location: gf.xy,
+        ink: bool,
+        key: int | None
+    ) -> None:
+        self._blit_framebuf(
+            self._framebuf, gf.pixel_format.mono_vlsb, 1 if ink else 0,
+            buffer, format, size, location, ink, key )
         
     # =======================================================================    
 
@@ -934,9 +1425,10 @@ class ks0107(
 
     # =======================================================================    
 
-    def _write_pixel_implementation( 
+    def _write_pixel_xy_implementation(
         self, 
-        location: gf.xy, 
+        x: int,
+        y: int,
         ink: bool
     ) -> None:
         """
@@ -944,10 +1436,50 @@ class ks0107(
         """
                
         self._framebuf.pixel( 
-            location.x, 
-            location.y, 
+            x,
+            y,
             ink
         )
+
+    # =======================================================================
+
+    def _fill_span_implementation(
+        self,
+        location: gf.xy,
+        length: int,
+        vertical: bool,
+        ink: bool
+    ) -> None:
+        if vertical:
+            self._framebuf.vline( location.x, location.y, length, ink )
+        else:
+            self._framebuf.hline( location.x, location.y, length, ink )
+
+    # =======================================================================
+
+    def _fill_rect_implementation(
+        self,
+        location: gf.xy,
+        size: gf.xy,
+        ink: bool
+    ) -> None:
+        self._framebuf.fill_rect(
+            location.x, location.y, size.x, size.y, ink )
+
+    # =======================================================================
+
+    def _blit_implementation(
+        self,
+        buffer: bytearray,
+        format: int,
+        size: gf.xy,
+        location: gf.xy,
+        ink: bool,
+        key: int | None
+    ) -> None:
+        self._blit_framebuf(
+            self._framebuf, gf.pixel_format.mono_vlsb, 1 if ink else 0,
+            buffer, format, size, location, ink, key )
         
     # =======================================================================    
 
@@ -1142,6 +1674,14 @@ class hd44780( gf.terminal ):
 
     # =======================================================================    
 
+    async def async_clear( self ) -> None:
+        """clear, but await instead of sleeping while the chip clears"""
+        self.command( 0x01 )
+        await gf.async_sleep_us( 5_000 )
+        self.cursor_set( gf.xy( 0, 0 ) )
+
+    # =======================================================================
+
     def _cursor_set_implementation( self ) -> None:
         # the NVI cursor_set() method has already set the cursor 
 
@@ -83,6 +83,11 @@ class sx127x:
     specific chip.
     
     The driver supports raw LoRa, not LoRaWAN.
+
+    The payload is transferred to and from the FIFO in a single
+    SPI transaction (burst_write() and burst_readinto()).
+    The read_payload_into() method reads a received payload into
+    a caller-provided buffer, without allocating memory.
     """
 
     class registers:
@@ -132,7 +137,12 @@ class sx127x:
     ) -> None:
     
         self._spi = spi
-        self._chip_select = make_pin_out( chip_select )    
+        self._chip_select = pin_out( chip_select )
+
+        # pre-allocated buffers for the register access
+        self._address = bytearray( 1 )
+        self._value = bytearray( 1 )
+        self._address_value = bytearray( 2 )
 
         self.config( configuration )
         
@@ -181,8 +191,10 @@ class sx127x:
         address: int, 
         value: int
     ) -> None:
+        self._address_value[ 0 ] = address | 0x80
+        self._address_value[ 1 ] = value & 0xFF
         self._chip_select.write( 0 )  
-        self._spi.write( bytes( [ address | 0x80, value & 0xFF ] ) )
+        self._spi.write( self._address_value )
         self._chip_select.write( 1 )  
         
     # =======================================================================
@@ -191,12 +203,52 @@ class sx127x:
         self, 
         address: int
     ) -> int:
+        self._address[ 0 ] = address
         self._chip_select.write( 0 )  
-        self._spi.write( bytes( [ address ] ) )
-        response = bytearray( 1 )
-        self._spi.readinto( response )
+        self._spi.write( self._address )
+        self._spi.readinto( self._value )
         self._chip_select.write( 1 )  
-        return int( response[ 0 ] )
+        return int( self._value[ 0 ] )
+
+    # =======================================================================
+
+    def burst_write(
+        self,
+        address: int,
+        data: [ bytes, bytearray, memoryview ]
+    ) -> None:
+        """
+        write data to a register in a single transaction
+
+        For the fifo register, the data goes to successive fifo
+        locations, for other registers to successive registers.
+        """
+
+        self._address[ 0 ] = address | 0x80
+        self._chip_select.write( 0 )
+        self._spi.write( self._address )
+        self._spi.write( data )
+        self._chip_select.write( 1 )
+
+    # =======================================================================
+
+    def burst_readinto(
+        self,
+        address: int,
+        buffer: [ bytearray, memoryview ]
+    ) -> None:
+        """
+        fill the buffer from a register in a single transaction
+
+        For the fifo register, the data comes from successive fifo
+        locations, for other registers from successive registers.
+        """
+
+        self._address[ 0 ] = address
+        self._chip_select.write( 0 )
+        self._spi.write( self._address )
+        self._spi.readinto( buffer )
+        self._chip_select.write( 1 )
 
     # =======================================================================
     
@@ -481,8 +533,12 @@ class sx127x:
             self.tx_fifo_base_address 
         )
         
-        for i in range( length ):
-            self.register_write( self.registers.fifo, buffer[ i ] )
+        if not isinstance( buffer, ( bytes, bytearray, memoryview ) ):
+            buffer = bytes( buffer[ : length ] )
+        self.burst_write(
+            self.registers.fifo,
+            memoryview( buffer )[ : length ]
+        )
         self.register_write( self.registers.payload_length, length )
         
         _ = self.irq_flags()
@@ -508,7 +564,22 @@ class sx127x:
     
     # =======================================================================
     
-    def read_payload( self ) -> bytearray:
+    def read_payload_into(
+        self,
+        buffer: [ bytearray, memoryview ]
+    ) -> int:
+        """
+        read the received payload into the buffer
+
+        This method returns the number of bytes read,
+        which is the length of the payload,
+        or the length of the buffer when that is smaller.
+
+        When the payload fills the buffer (for instance a memoryview
+        slice of the known packet length) nothing is allocated.
+        A shorter payload is read through a memoryview slice
+        of the buffer, which is one small allocation.
+        """
     
         # set FIFO address to current RX address
         self.register_write(
@@ -516,13 +587,21 @@ class sx127x:
             self.register_read( self.registers.fifo_rx_current_addr )
         )
 
-        packet_length = self.register_read( self.registers.rx_nb_bytes )
+        n = min(
+            self.register_read( self.registers.rx_nb_bytes ),
+            len( buffer )
+        )
+        if n < len( buffer ):
+            buffer = memoryview( buffer )[ : n ]
+        self.burst_readinto( self.registers.fifo, buffer )
+        return n
 
-        payload = bytearray()
-        for i in range( packet_length ):
-            payload.append( self.register_read( self.registers.fifo ) )
+    # =======================================================================
 
-        return bytes( payload )    
+    def read_payload( self ) -> bytes:
+        payload = bytearray( 256 )
+        n = self.read_payload_into( payload )
+        return bytes( payload[ : n ] )
     
     # =======================================================================
 
@@ -15,7 +15,160 @@ from godafoss import *
 
 # ===========================================================================
 
-class ssd1306_base( canvas ):
+class _ssd_paged( canvas ):
+    """
+    common part of the ssd1306 and ssd1309 drivers
+
+    The pixels of these chips are organized in pages of 8 rows.
+    This class tracks, for each page, the range of columns
+    that were written since the last flush.
+    A flush transfers only those column ranges,
+    consecutive pages with the same range share one address window.
+
+    Both chips can flip the segment and com scan directions,
+    so a rotation by 180 degrees is done in hardware.
+    """
+
+    # =======================================================================
+
+    def __init__(
+        self,
+        size: xy,
+        background: bool
+    ) -> None:
+        self._pages = ( size.y + 7 ) // 8
+        self._page_x0 = bytearray( self._pages )
+        self._page_x1 = bytearray( self._pages )
+        self._flipped = False
+        canvas.__init__(
+            self,
+            size = size,
+            is_color = False,
+            background = background
+        )
+
+    # =======================================================================
+
+    def _dirty_box_reset(
+        self,
+        full: bool = False
+    ) -> None:
+        canvas._dirty_box_reset( self, full )
+        for page in range( self._pages ):
+            self._page_x0[ page ] = 0 if full else self.size.x
+            self._page_x1[ page ] = self.size.x if full else 0
+
+    # =======================================================================
+
+    def _mark_dirty(
+        self,
+        x0: int,
+        y0: int,
+        x1: int,
+        y1: int
+    ) -> None:
+        canvas._mark_dirty( self, x0, y0, x1, y1 )
+        for page in range( y0 >> 3, ( y1 + 7 ) >> 3 ):
+            if x0 < self._page_x0[ page ]:
+                self._page_x0[ page ] = x0
+            if x1 > self._page_x1[ page ]:
+                self._page_x1[ page ] = x1
+
+    # =======================================================================
+
+    def _flush_implementation(
+        self,
+        forced: bool
+    ) -> None:
+
+        if forced:
+            self._dirty_box_reset( True )
+
+        # the active area is x-centered
+        x_offset = ( 128 - self.size.x ) // 2
+
+        data = memoryview( self._buffer )
+        page = 0
+        while page < self._pages:
+            x0 = self._page_x0[ page ]
+            x1 = self._page_x1[ page ]
+            if x0 >= x1:
+                page += 1
+                continue
+
+            # following pages with the same column range
+            last = page
+            while (
+                ( last + 1 < self._pages )
+                and ( self._page_x0[ last + 1 ] == x0 )
+                and ( self._page_x1[ last + 1 ] == x1 )
+            ):
+                last += 1
+
+            self.write_command( self.commands.set_col_addr )
+            self.write_command( x_offset + x0 )
+            self.write_command( x_offset + x1 - 1 )
+            self.write_command( self.commands.set_page_addr )
+            self.write_command( page )
+            self.write_command( last )
+
+            if ( x0 == 0 ) and ( x1 == self.size.x ):
+                # complete pages are a contiguous part of the buffer
+                self._write_framebuf( ( data[
+                    page * self.size.x : ( last + 1 ) * self.size.x ], ) )
+            else:
+                self._write_framebuf( [
+                    data[ p * self.size.x + x0 : p * self.size.x + x1 ]
+                        for p in range( page, last + 1 ) ] )
+
+            page = last + 1
+
+    # =======================================================================
+
+    def _rotate_implementation(
+        self,
+        rotation: int
+    ) -> bool:
+        """
+        rotate by 180 degrees by flipping the scan directions
+
+        The segment remap only affects data that is written
+        after it, but rotate() marks the whole canvas as dirty,
+        so the next flush rewrites all pages.
+        """
+
+        if rotation != 180:
+            return False
+
+        self._flipped = not self._flipped
+        if self._flipped:
+            self.write_command( self.commands.set_seg_remap | 0x00 )
+            self.write_command( self.commands.set_com_out_dir | 0x00 )
+        else:
+            self.write_command( self.commands.set_seg_remap | 0x01 )
+            self.write_command( self.commands.set_com_out_dir | 0x08 )
+        return True
+
+    # =======================================================================
+
+    def _write_framebuf(
+        self,
+        parts
+    ) -> None:
+        """
+        write parts of the buffer as data to the chip
+
+        :param parts: (sequence of memoryview)
+            the parts of the buffer, in the order they must be written
+        """
+        raise NotImplementedError
+
+    # =======================================================================
+
+
+# ===========================================================================
+
+class ssd1306_base( _ssd_paged ):
     """    
     This is a driver for the ssd1306 monochrome oled display driver
     for up to 128x64 pixels.
@@ -63,10 +216,9 @@ class ssd1306_base( canvas ):
         background: bool
     ) ->  None:
 
-        canvas.__init__( 
-            self, 
+        _ssd_paged.__init__(
+            self,
             size = size,
-            is_color = False,
             background = background
         )
         self._buffer = bytearray((( self.size.y + 7 ) // 8 ) * self.size.x )
@@ -103,16 +255,57 @@ class ssd1306_base( canvas ):
         
     # =======================================================================
 
-    def _write_pixel_implementation(
+    def _write_pixel_xy_implementation(
         self,
-        location: xy,
+        x: int,
+        y: int,
         ink: bool
     ) -> None:
         self._framebuf.pixel(
-            location.x,
-            location.y,
+            x,
+            y,
             ink
-        )           
+        )
+
+    # =======================================================================
+
+    def _fill_span_implementation(
+        self,
+        location: xy,
+        length: int,
+        vertical: bool,
+        ink: bool
+    ) -> None:
+        if vertical:
+            self._framebuf.vline( location.x, location.y, length, ink )
+        else:
+            self._framebuf.hline( location.x, location.y, length, ink )
+
+    # =======================================================================
+
+    def _fill_rect_implementation(
+        self,
+        location: xy,
+        size: xy,
+        ink: bool
+    ) -> None:
+        self._framebuf.fill_rect(
+            location.x, location.y, size.x, size.y, ink )
+
+    # =======================================================================
+
+    def _blit_implementation(
+        self,
+        buffer: bytearray,
+        format: int,
+        size: xy,
+        location: xy,
+        ink: bool,
+        key: int | None
+    ) -> None:
+        self._blit_framebuf(
+            self._framebuf, pixel_format.mono_vlsb, 1 if ink else 0,
+            buffer, format, size, location, ink, key )
 
     # =======================================================================
     
@@ -135,25 +328,6 @@ class ssd1306_base( canvas ):
                
     # =======================================================================
 
-    def _flush_implementation(
-        self,
-        forced: bool
-    ) -> None:
-        
-        # the active area is x-centered
-        x0 = ( 128 - self.size.x ) // 2 
-        x1 = x0 + self.size.x - 1
-            
-        self.write_command( self.commands.set_col_addr )
-        self.write_command( x0 )
-        self.write_command( x1 )
-        self.write_command( self.commands.set_page_addr )
-        self.write_command( 0 )
-        self.write_command( ( self.size.y // 8 ) - 1 )
-        self._write_framebuf()
-
-    # =======================================================================
-        
         
 # ===========================================================================d
 
@@ -220,12 +394,13 @@ class ssd1306_i2c( ssd1306_base ):
 
     # =======================================================================
 
-    def _write_framebuf( self ) -> None:
+    def _write_framebuf( self, parts ) -> None:
         self._i2c.start()
         self._cmd[ 0 ] = ( self._address << 1 ) | 0x00
         self._cmd[ 1 ] = 0x40 # set_disp_start_line?
         self._i2c.write( self._cmd )
-        self._i2c.write( self._buffer )
+        for part in parts:
+            self._i2c.write( part )
         self._i2c.stop()
         
     # =======================================================================
@@ -298,16 +473,17 @@ class ssd1306_spi(
 
     # =======================================================================
     
-    def _write_framebuf( self ) -> None:
-        self.write_command( None, buffer = self._buffer )
+    def _write_framebuf( self, parts ) -> None:
+        for part in parts:
+            self.write_command( None, buffer = part )
 
     # =======================================================================
     
 
 # ===========================================================================
 
-class ssd1309_base( 
-    canvas 
+class ssd1309_base(
+    _ssd_paged
 ):
     """
     ssd1309 spi/i2c b/w oled display driver
@@ -383,10 +559,9 @@ class ssd1309_base(
         background: bool
     ) ->  None:
 
-        canvas.__init__( 
-            self, 
+        _ssd_paged.__init__(
+            self,
             size = size,
-            is_color = False,
             background = background
         )
         self._buffer = bytearray((( self.size.y + 7 ) // 8 ) * self.size.x )
@@ -419,16 +594,57 @@ class ssd1309_base(
         
     # =======================================================================
 
-    def _write_pixel_implementation(
+    def _write_pixel_xy_implementation(
         self,
-        location: xy,
+        x: int,
+        y: int,
         ink: bool
     ) -> None:
         self._framebuf.pixel(
-            location.x,
-            location.y,
+            x,
+            y,
             ink
-        )           
+        )
+
+    # =======================================================================
+
+    def _fill_span_implementation(
+        self,
+        location: xy,
+        length: int,
+        vertical: bool,
+        ink: bool
+    ) -> None:
+        if vertical:
+            self._framebuf.vline( location.x, location.y, length, ink )
+        else:
+            self._framebuf.hline( location.x, location.y, length, ink )
+
+    # =======================================================================
+
+    def _fill_rect_implementation(
+        self,
+        location: xy,
+        size: xy,
+        ink: bool
+    ) -> None:
+        self._framebuf.fill_rect(
+            location.x, location.y, size.x, size.y, ink )
+
+    # =======================================================================
+
+    def _blit_implementation(
+        self,
+        buffer: bytearray,
+        format: int,
+        size: xy,
+        location: xy,
+        ink: bool,
+        key: int | None
+    ) -> None:
+        self._blit_framebuf(
+            self._framebuf, pixel_format.mono_vlsb, 1 if ink else 0,
+            buffer, format, size, location, ink, key )
 
     # =======================================================================
     
@@ -451,21 +667,6 @@ class ssd1309_base(
                
     # =======================================================================
 
-    def _flush_implementation( self, forced ) -> None:
-        
-        # the active area is x-centered
-        x0 = ( 128 - self.size.x ) // 2 
-        x1 = x0 + self.size.x - 1
-            
-        self.write_command( self.commands.set_col_addr )
-        self.write_command( x0 )
-        self.write_command( x1 )
-        self.write_command( self.commands.set_page_addr )
-        self.write_command( 0 )
-        self.write_command( ( self.size.y // 8 ) - 1 )
-        self._write_framebuf()
-
-    # =======================================================================
 
 
 # ===========================================================================
@@ -535,12 +736,13 @@ class ssd1309_i2c(
 
     # =======================================================================
 
-    def _write_framebuf( self ) -> None:
+    def _write_framebuf( self, parts ) -> None:
         self._i2c.start()
         self._cmd[ 0 ] = ( self._address << 1 ) | 0x00
         self._cmd[ 1 ] = 0x40 # set_disp_start_line?
         self._i2c.write( self._cmd )
-        self._i2c.write( self._buffer )
+        for part in parts:
+            self._i2c.write( part )
         self._i2c.stop()
         
     # =======================================================================        
@@ -613,8 +815,9 @@ class ssd1309_spi(
 
     # =======================================================================
     
-    def _write_framebuf( self ) -> None:
-        self.write_command( None, buffer = self._buffer )
+    def _write_framebuf( self, parts ) -> None:
+        for part in parts:
+            self.write_command( None, buffer = part )
 
     # =======================================================================
     
@@ -39,6 +39,57 @@ def _make_bytes(
     return data
 
 
+# ===========================================================================
+
+def _partial_window(
+    x0: int,
+    y0: int,
+    x1: int,
+    y1: int
+) -> bytes:
+    """
+    the PTL data for the x0 <= x < x1, y0 <= y < y1 window
+
+    The x0 and x1 must be multiples of 8.
+    """
+
+    return bytes( [
+        x0,
+        x1 - 1,
+        y0 >> 8, y0 & 0xFF,
+        ( y1 - 1 ) >> 8, ( y1 - 1 ) & 0xFF,
+        0x01 # PT_SCAN: the gates outside the window are scanned too
+    ] )
+
+
+# ===========================================================================
+
+def _partial_data(
+    fb: bytearray,
+    width: int,
+    x0: int,
+    y0: int,
+    x1: int,
+    y1: int
+) -> bytearray:
+    """
+    the x0 <= x < x1, y0 <= y < y1 part of a MONO_HLSB framebuffer
+
+    The x0 and x1 must be multiples of 8.
+    """
+
+    n = ( x1 - x0 ) // 8
+    data = bytearray( n * ( y1 - y0 ) )
+    source = memoryview( fb )
+    i = 0
+    start = y0 * ( width // 8 ) + x0 // 8
+    for _ in range( y0, y1 ):
+        data[ i : i + n ] = source[ start : start + n ]
+        i += n
+        start += width // 8
+    return data
+
+
 # ===========================================================================
 #
 # Set a given row in a waveform lookup table.
@@ -90,6 +141,16 @@ class uc8151(
     This is a driver for the uc8151 /IL0373 e-paper display which is used
     in the Badger 2040. It is an adaption of the driver written by 
     Salvatore Sanfilippo.
+
+    A flush() starts the refresh of the display, but doesn't wait
+    for it to complete: flush_done() returns whether the refresh
+    is complete (and switches the display off when it is).
+
+    When partial is True, a flush() refreshes only the part
+    of the display that was written.
+    After full_update_period partial refreshes,
+    or when more than half of the display was written,
+    a flush() does a full refresh to remove the ghosting.
     """
 
     # =======================================================================
@@ -245,7 +306,8 @@ class uc8151(
         no_flickering=False,
         debug=False,
         full_update_period=50,
-        dangerous_reaffirm_black=False
+        dangerous_reaffirm_black=False,
+        partial=False
     ) -> None:
         self.spi = spi
         self.cs = pin_out( cs )
@@ -261,6 +323,9 @@ class uc8151(
         self.mirror_x = mirror_x
         self.mirror_y = mirror_y
         self.debug = debug
+        self.partial = partial
+        self._refreshing = False
+        self._partial_count = 0
         self.initialize_display( )
         
         self.raw_fb = bytearray( width*height//8 )
@@ -323,9 +388,9 @@ class uc8151(
         """
         
         self.rst.write( 0 )
-        time.sleep_ms( 10 )
+        sleep_us( 10_000 )
         self.rst.write( 1 )
-        time.sleep_ms( 10 )
+        sleep_us( 10_000 )
         self.wait_ready()
 
     # =======================================================================
@@ -370,19 +435,20 @@ class uc8151(
         must be set to look into the internal tables.
         """
 
-        psr_settings = FORMAT_BW | BOOSTER_ON | RESET_NONE
+        r = uc8151._registers
+        psr_settings = r.FORMAT_BW | r.BOOSTER_ON | r.RESET_NONE
 
         if self.width == 96 and self.height == 230:
-            psr_settings |= RES_96x230
+            psr_settings |= r.RES_96x230
             
         elif self.width == 96 and self.height == 252:
-            psr_settings |= RES_96x252
+            psr_settings |= r.RES_96x252
             
         elif self.width == 128 and self.height == 296:
-            psr_settings |= RES_128x296
+            psr_settings |= r.RES_128x296
             
         elif self.width == 160 and self.height == 296:
-            psr_settings |= RES_160x296
+            psr_settings |= r.RES_160x296
             
         else:
             raise ValueError( "Unsupported display resolution specified" )
@@ -391,13 +457,13 @@ class uc8151(
         # lookup tables defined by the device. Otherwise the values for
         # the lookup tables must be read from the registers we set.
         if self.speed == 0:
-            psr_settings |= LUT_OTP
+            psr_settings |= r.LUT_OTP
         else:
-            psr_settings |= LUT_REG
+            psr_settings |= r.LUT_REG
 
         # Configure mirroring.
-        psr_settings |= SHIFT_LEFT if self.mirror_x else SHIFT_RIGHT
-        psr_settings |= SCAN_DOWN if self.mirror_y else SCAN_UP
+        psr_settings |= r.SHIFT_LEFT if self.mirror_x else r.SHIFT_RIGHT
+        psr_settings |= r.SCAN_DOWN if self.mirror_y else r.SCAN_UP
 
         self._chip_write( uc8151._commands.PSR, psr_settings )
 
@@ -410,7 +476,8 @@ class uc8151(
         self.reset()
 
         # Soft reset
-        self._chip_write( uc8151._commands.PSR, RESET_SOFT )
+        self._chip_write(
+            uc8151._commands.PSR, uc8151._registers.RESET_SOFT )
 
         # Here we set the voltage levels that are used for the low-high
         # transitions states, driven by the waveforms provided in the
@@ -426,8 +493,9 @@ class uc8151(
         self._chip_write(
             uc8151._commands.PWR,
             [
-                VDS_INTERNAL|VDG_INTERNAL,
-                VCOM_VD|VGHL_16V, # VCOM_VD sets VCOM voltage to VD[HL]+VCOM_DC
+                uc8151._power.VDS_INTERNAL | uc8151._power.VDG_INTERNAL,
+                # VCOM_VD sets VCOM voltage to VD[HL]+VCOM_DC
+                uc8151._power.VCOM_VD | uc8151._power.VGHL_16V,
                 0b100110, # +10v VDH
                 0b100110, # -10v VDL
                 0b000011  # VDHR default (For red pixels, not used here)
@@ -438,7 +506,11 @@ class uc8151(
         self.set_waveform_lut()
 
         # Booster soft start configuration.
-        boost_value = START_10MS | STRENGTH_3 | OFF_6_58US
+        boost_value = (
+            uc8151._booster.START_10MS
+            | uc8151._booster.STRENGTH_3
+            | uc8151._booster.OFF_6_58US
+        )
         self._chip_write( uc8151._commands.BTST, [ boost_value ] * 3 )
 
         # Power on
@@ -456,11 +528,15 @@ class uc8151(
         # disconnected if we use a 40 millisecond delay. There is a cost
         # for this of course: more latency in functions executing the POF
         # command.
-        self._chip_write( uc8151._commands.PFS, FRAMES_4 )
+        self._chip_write(
+            uc8151._commands.PFS, uc8151._frames_per_second.FRAMES_4 )
 
         # Use the internal temperature sensor. Unfortunately there is
         # no input line connected, so we can't read the temperature.
-        self._chip_write( uc8151._commands.TSE, TEMP_INTERNAL | OFFSET_0 )
+        self._chip_write(
+            uc8151._commands.TSE,
+            uc8151._tse.TEMP_INTERNAL | uc8151._tse.OFFSET_0
+        )
 
         # Set non overlapping period for Gate and Source lines.
         # TCON set to 0x22 means 12 periods (1 period is 660ns) for
@@ -738,6 +814,7 @@ class uc8151(
         
         self.wait_ready()
         self._chip_write( uc8151._commands.POF )
+        self._refreshing = False
 
     # =======================================================================
 
@@ -775,12 +852,87 @@ class uc8151(
         # Load back the no-flickering LUTs if we forced a flickered refresh.
         if do_full_update: self.set_waveform_lut()
 
+        self._refreshing = True
         if blocking: self.wait_and_switch_off()
         self.update_count += 1
         return True
 
     # =======================================================================
 
+    def update_region(
+        self,
+        x0: int,
+        y0: int,
+        x1: int,
+        y1: int,
+        blocking: bool = True
+    ) -> bool:
+        """
+        update the x0 <= x < x1, y0 <= y < y1 part of the screen
+
+        The x range is widened to multiples of 8 pixels.
+        This uses the partial mode of the chip: only the window
+        is transferred and refreshed.
+        The blocking parameter and the return value are as for update().
+        """
+
+        if blocking == False and self.is_busy():
+            return False
+
+        x0 = x0 & ~ 7
+        x1 = ( x1 + 7 ) & ~ 7
+
+        # Power on, partial mode on, the next update() sets it off
+        self._chip_write( uc8151._commands.PON )
+        self._chip_write( uc8151._commands.PTIN )
+        self._chip_write(
+            uc8151._commands.PTL, _partial_window( x0, y0, x1, y1 ) )
+        self._chip_write(
+            uc8151._commands.DTM2,
+            _partial_data( self.raw_fb, self.width, x0, y0, x1, y1 ) )
+        self._chip_write( uc8151._commands.DSP )
+        self._chip_write( uc8151._commands.DRF )
+
+        self._refreshing = True
+        if blocking: self.wait_and_switch_off()
+        return True
+
+    # =======================================================================
+
+    def _update_steps(
+        self,
+        fb = None
+    ):
+        """
+        a blocking update(), as a generator that yields while busy
+        """
+
+        while self.is_busy():
+            yield
+        self.update( blocking = False, fb = fb )
+        while self.is_busy():
+            yield
+        self._chip_write( uc8151._commands.POF )
+
+    # =======================================================================
+
+    async def async_update(
+        self,
+        fb = None
+    ) -> None:
+        """
+        update the screen, letting other tasks run meanwhile
+
+        This is the asyncio version of update( blocking = True ):
+        it awaits while the display is busy,
+        which for a refresh cycle can take seconds.
+        """
+
+        for _ in self._update_steps( fb ):
+            await asyncio.sleep( 0 )
+
+    # =======================================================================
+
     # Transfer bitmap to device. The chip has two framebuffers, one for
     # the old image and one for the new image. This way it can do the
     # difference when performing the update and apply the correct waveform
@@ -810,9 +962,10 @@ class uc8151(
 
     # =======================================================================    
 
-    def _write_pixel_implementation( 
+    def _write_pixel_xy_implementation(
         self, 
-        location: xy, 
+        x: int,
+        y: int,
         ink: bool
     ) -> None:
         """
@@ -820,10 +973,50 @@ class uc8151(
         """
                
         self.fb.pixel( 
-            location.x, 
-            location.y, 
+            x,
+            y,
             ink
         )
+
+    # =======================================================================
+
+    def _fill_span_implementation(
+        self,
+        location: xy,
+        length: int,
+        vertical: bool,
+        ink: bool
+    ) -> None:
+        if vertical:
+            self.fb.vline( location.x, location.y, length, ink )
+        else:
+            self.fb.hline( location.x, location.y, length, ink )
+
+    # =======================================================================
+
+    def _fill_rect_implementation(
+        self,
+        location: xy,
+        size: xy,
+        ink: bool
+    ) -> None:
+        self.fb.fill_rect(
+            location.x, location.y, size.x, size.y, ink )
+
+    # =======================================================================
+
+    def _blit_implementation(
+        self,
+        buffer: bytearray,
+        format: int,
+        size: xy,
+        location: xy,
+        ink: bool,
+        key: int | None
+    ) -> None:
+        self._blit_framebuf(
+            self.fb, pixel_format.mono_hlsb, 1 if ink else 0,
+            buffer, format, size, location, ink, key )
         
    # =======================================================================    
 
@@ -844,12 +1037,84 @@ class uc8151(
         forced: bool
     ) -> None:
         """
-        flush the framebuffer to the display
+        start the refresh of the display
         """          
         
-        self.update()     
+        window = self._refresh_window( forced )
+        self.wait_flush()
+        self._refresh( window )
     
     # =======================================================================
 
+    def _flush_steps_implementation(
+        self,
+        forced: bool
+    ):
+        window = self._refresh_window( forced )
+        while not self.flush_done():
+            yield
+        self._refresh( window )
+
+    # =======================================================================
+
+    def _refresh_window(
+        self,
+        forced: bool
+    ):
+        """
+        the window for a partial refresh, or None for a full refresh
+        """
+
+        if (
+            forced
+            or ( not self.partial )
+            or (
+                ( self.full_update_period != 0 )
+                and ( self._partial_count >= self.full_update_period )
+            )
+            or (
+                2 * ( self._dirty_x1 - self._dirty_x0 )
+                    * ( self._dirty_y1 - self._dirty_y0 )
+                > self.size.x * self.size.y
+            )
+        ):
+            return None
+
+        return self._dirty_x0, self._dirty_y0, self._dirty_x1, self._dirty_y1
+
+    # =======================================================================
+
+    def _refresh(
+        self,
+        window
+    ) -> None:
+        """
+        start a partial (window) or full (None) refresh
+        """
+
+        if window is None:
+            self.update( blocking = False )
+            self._partial_count = 0
+        else:
+            self.update_region( *window, blocking = False )
+            self._partial_count += 1
+
+    # =======================================================================
+
+    def flush_done( self ) -> bool:
+        """
+        whether the refresh started by the previous flush is complete
+
+        When it is, the display is switched off.
+        """
+
+        if self._refreshing:
+            if self.is_busy():
+                return False
+            self.wait_and_switch_off()
+        return True
+
+    # =======================================================================
+
 
 # ===========================================================================
\ No newline at end of file
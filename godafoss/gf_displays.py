@@ -23,7 +23,7 @@ def oled128m32a(
     reset: [ int, pin_out, pin_in_out, pin_oc ] = None,
     backlight: [ int, pin_out, pin_in_out, pin_oc ] = None,
     power: [ int, pin_out, pin_in_out, pin_oc ] = None,
-    mechanism: int = 0,
+    mechanism: int = 3,
     background: color = colors.black, 
     monochrome: bool = False,
     invert: bool = False,
@@ -81,7 +81,7 @@ def oled128m64a(
     reset: [ int, pin_out, pin_in_out, pin_oc ] = None,
     backlight: [ int, pin_out, pin_in_out, pin_oc ] = None,
     power: [ int, pin_out, pin_in_out, pin_oc ] = None,
-    mechanism: int = 0,
+    mechanism: int = 3,
     background: color = colors.black, 
     monochrome: bool = False,
     invert: bool = False,
@@ -139,7 +139,7 @@ def lcd128c128a(
     reset: [ int, pin_out, pin_in_out, pin_oc ] = None,
     backlight: [ int, pin_out, pin_in_out, pin_oc ] = None,
     power: [ int, pin_out, pin_in_out, pin_oc ] = None,
-    mechanism: int = 0,
+    mechanism: int = 3,
     background: color = colors.black, 
     monochrome: bool = False,
     invert: bool = False,
@@ -195,7 +195,7 @@ def lcd128c128b(
     reset: [ int, pin_out, pin_in_out, pin_oc ] = None,
     backlight: [ int, pin_out, pin_in_out, pin_oc ] = None,
     power: [ int, pin_out, pin_in_out, pin_oc ] = None,
-    mechanism: int = 0,
+    mechanism: int = 3,
     background: color = colors.black, 
     monochrome: bool = False,
     invert: bool = False,
@@ -253,7 +253,7 @@ def lcd160c80a(
     reset: [ int, pin_out, pin_in_out, pin_oc ] = None,
     backlight: [ int, pin_out, pin_in_out, pin_oc ] = None,
     power: [ int, pin_out, pin_in_out, pin_oc ] = None,
-    mechanism: int = 0,
+    mechanism: int = 3,
     background: color = colors.black, 
     monochrome: bool = False,
     invert: bool = False,
@@ -309,7 +309,7 @@ def lcd160c128a(
     reset: [ int, pin_out, pin_in_out, pin_oc ] = None,
     backlight: [ int, pin_out, pin_in_out, pin_oc ] = None,
     power: [ int, pin_out, pin_in_out, pin_oc ] = None,
-    mechanism: int = 0,
+    mechanism: int = 3,
     background: color = colors.black, 
     monochrome: bool = False,
     invert: bool = False,
@@ -367,7 +367,7 @@ def lcd240c135a(
     reset: [ int, pin_out, pin_in_out, pin_oc ] = None,
     backlight: [ int, pin_out, pin_in_out, pin_oc ] = None,
     power: [ int, pin_out, pin_in_out, pin_oc ] = None,
-    mechanism: int = 0,
+    mechanism: int = 3,
     background: color = colors.black, 
     monochrome: bool = False,
     invert: bool = False,
@@ -428,7 +428,7 @@ def lcd240c240a(
     reset: [ int, pin_out, pin_in_out, pin_oc ] = None,
     backlight: [ int, pin_out, pin_in_out, pin_oc ] = None,
     power: [ int, pin_out, pin_in_out, pin_oc ] = None,
-    mechanism: int = 0,
+    mechanism: int = 3,
     background: color = colors.black, 
     monochrome: bool = False,
     invert: bool = False,
@@ -485,7 +485,7 @@ def lcd320c240a(
     reset: [ int, pin_out, pin_in_out, pin_oc ] = None,
     backlight: [ int, pin_out, pin_in_out, pin_oc ] = None,
     power: [ int, pin_out, pin_in_out, pin_oc ] = None,
-    mechanism: int = 0,
+    mechanism: int = 3,
     background: color = colors.black, 
     monochrome: bool = False,
     invert: bool = False,
@@ -543,7 +543,7 @@ def lcd320c240b(
     reset: [ int, pin_out, pin_in_out, pin_oc ] = None,
     backlight: [ int, pin_out, pin_in_out, pin_oc ] = None,
     power: [ int, pin_out, pin_in_out, pin_oc ] = None,
-    mechanism: int = 0,
+    mechanism: int = 3,
     background: color = colors.black, 
     monochrome: bool = False,
     invert: bool = False,
@@ -601,7 +601,7 @@ def lcd320c240c(
     reset: [ int, pin_out, pin_in_out, pin_oc ] = None,
     backlight: [ int, pin_out, pin_in_out, pin_oc ] = None,
     power: [ int, pin_out, pin_in_out, pin_oc ] = None,
-    mechanism: int = 0,
+    mechanism: int = 3,
     background: color = colors.black, 
     monochrome: bool = False,
     invert: bool = False,
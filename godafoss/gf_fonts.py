@@ -11,6 +11,80 @@
 from godafoss import *
 
 
+# ===========================================================================
+
+class glyph_cache:
+    """
+    a bounded cache of glyphs
+
+    :param size: (int)
+        the maximum number of glyphs in the cache (default: 64)
+
+    A glyph cache stores the glyphs that were recently read from
+    fonts, keyed by ( font, char ).
+    When the cache is full, the least recently used glyph is dropped.
+
+    The :class:`~godafoss.font` read() method uses
+    the cache in glyph_cache.default.
+    """
+
+    # =======================================================================
+
+    def __init__(
+        self,
+        size: int = 64
+    ) -> None:
+        self.size = size
+        self._glyphs = {}
+        self._order = []
+
+    # =======================================================================
+
+    def read(
+        self,
+        font: "font",
+        c: chr
+    ) -> glyph:
+        """
+        the :class:`~godafoss.glyph` for the character in the font
+
+        :param font: (:class:`~godafoss.font`)
+            the font from which the glyph is read
+
+        :param c: (chr)
+            the char for which the :class:`~godafoss.glyph` is retrieved
+
+        When the glyph is not in the cache, it is read from the font
+        (by its _read_implementation method) and added to the cache.
+        """
+
+        key = ( font, c )
+        result = self._glyphs.get( key )
+        if result is None:
+            result = font._read_implementation( c )
+            if len( self._order ) >= self.size:
+                del self._glyphs[ self._order.pop( 0 ) ]
+            self._glyphs[ key ] = result
+        else:
+            self._order.remove( key )
+        self._order.append( key )
+        return result
+
+    # =======================================================================
+
+    def clear( self ) -> None:
+        """
+        remove all glyphs from the cache
+        """
+
+        self._glyphs = {}
+        self._order = []
+
+    # =======================================================================
+
+glyph_cache.default = glyph_cache()
+
+
 # ===========================================================================
 
 class font:
@@ -26,6 +100,10 @@ class font:
     Each font has a fixed character height, equal to size.y.
     A proportional font has a size.x == 0.
     For a fixed width font size.x is the witdh of each character.
+
+    The glyphs read from a font are kept in a
+    :class:`~godafoss.glyph_cache`.
+    A concrete font implements _read_implementation().
     """
 
     # =======================================================================
@@ -40,9 +118,9 @@ class font:
     
     def __call__(
         self,
-        text: str
+        s: str
     ) -> text:
-        return text( text, self )
+        return text( s, self )
 
     # =======================================================================
 
@@ -56,6 +134,21 @@ class font:
         :param c: (chr)
             the char for which the :class:`~godafoss.glyph` is retrieved
         """
+
+        return glyph_cache.default.read( self, c )
+
+    # =======================================================================
+
+    def _read_implementation(
+        self,
+        c: chr
+    ) -> glyph:
+        """
+        the :class:`~godafoss.glyph` for the character (implementation)
+
+        This method must be implemented by a concrete font.
+        It is called only when the glyph is not in the glyph cache.
+        """
         
         raise NotImplementedError
 
@@ -64,21 +157,85 @@ class font:
 
 # ===========================================================================
 
-class _default_font_image( glyph ):
+class font_atlas:
     """
-    glyph of the built-in 8x8 font
+    the pixels of all glyphs of a fixed width font
+
+    :param size: (:class:`~godafoss.xy`)
+        the size of a glyph
+
+    :param data: (bytearray)
+        the pixels of the glyphs
+
+    :param first: (int)
+        the character code of the first glyph in the data (default: 0)
+
+    A font atlas stores the glyphs of a fixed width font
+    in one blob of bytes.
+    The pixels of each glyph are stored in MONO_VLSB format:
+    each byte is (part of) a column of 8 pixels,
+    the LSB is the top pixel.
+    The data of a glyph is size.x * ( ( size.y + 7 ) // 8 ) bytes,
+    the glyphs are stored one after the other.
     """
 
     # =======================================================================
 
-    def __init__( self, c ):
-        glyph.__init__( self, xy( 8, 8 ) )
+    def __init__(
+        self,
+        size: xy,
+        data: bytearray,
+        first: int = 0
+    ) -> None:
+        self.size = size
+        self.data = data
+        self._first = first
+        self._glyph_bytes = size.x * ( ( size.y + 7 ) // 8 )
+        self._n = len( data ) // self._glyph_bytes
+
+    # =======================================================================
+
+    def glyph(
+        self,
+        c: chr
+    ) -> glyph:
+        """
+        the :class:`~godafoss.glyph` for the specified character
+
+        :param c: (chr)
+            the char for which the :class:`~godafoss.glyph` is retrieved
+
+        A character that is not in the atlas yields an empty glyph.
+        """
+
+        n = ord( c ) - self._first
+        if ( n < 0 ) or ( n >= self._n ):
+            return _atlas_glyph( self.size, bytearray( self._glyph_bytes ) )
+        start = n * self._glyph_bytes
+        return _atlas_glyph(
+            self.size,
+            memoryview( self.data )[ start : start + self._glyph_bytes ]
+        )
+
+    # =======================================================================
+
+
+# ===========================================================================
 
-        import framebuf
-        buf = bytearray(( self.size.y // 8 ) * self.size.x )
-        self._charbuf = framebuf.FrameBuffer( buf, 8, 8, framebuf.MONO_VLSB )
-        self._charbuf.fill( 0 )
-        self._charbuf.text( c, 0, 0 )
+class _atlas_glyph( glyph ):
+    """
+    glyph of which the pixels are stored in MONO_VLSB format
+    """
+
+    # =======================================================================
+
+    def __init__(
+        self,
+        size: xy,
+        data: [ bytearray, memoryview ]
+    ) -> None:
+        glyph.__init__( self, size )
+        self._data = data
 
     # =======================================================================
 
@@ -86,7 +243,10 @@ class _default_font_image( glyph ):
         self,
         location: xy
     ) -> bool:
-        return self._charbuf.pixel( location.x, location.y )
+        return ( (
+            self._data[ location.x + ( location.y >> 3 ) * self.size.x ]
+                >> ( location.y & 0x07 )
+        ) & 0x01 ) != 0
 
     # =======================================================================
 
@@ -96,26 +256,75 @@ class _default_font_image( glyph ):
 class font_default( font ):
     """
     the micropython built-in 8x8 font
+
+    All glyphs are rendered once (by the first font_default that is
+    used) into a :class:`~godafoss.font_atlas` of 1 Kb.
+    On CPython, which has no built-in font, an included font is used.
+    All font_default objects are equal, so they share
+    their glyphs in the glyph cache.
     """
 
+    _atlas = None
+
     # =======================================================================
 
     def __init__(
         self
     ) -> None:
         font.__init__( self, xy( 8, 8 ) )
+        if font_default._atlas is None:
+            font_default._atlas = font_atlas(
+                self.size,
+                _default_font_atlas_data()
+            )
 
     # =======================================================================
 
-    def read(
+    def __eq__( self, other ) -> bool:
+        return isinstance( other, font_default )
+
+    # =======================================================================
+
+    def __hash__( self ) -> int:
+        return hash( font_default )
+
+    # =======================================================================
+
+    def _read_implementation(
         self,
         c: chr
     ) -> glyph:
-        return _default_font_image( c )
+        return font_default._atlas.glyph( c )
 
     # =======================================================================
 
 
+# ===========================================================================
+
+def _default_font_atlas_data() -> bytearray:
+    """
+    the pixels of the 128 characters of the 8x8 font, in MONO_VLSB format
+    """
+
+    data = bytearray( 128 * 8 )
+
+    if framebuf is not None:
+        # one 1024 x 8 MONO_VLSB framebuffer has the atlas layout
+        buffer = framebuf.FrameBuffer( data, 128 * 8, 8, framebuf.MONO_VLSB )
+        buffer.text( "".join( chr( c ) for c in range( 128 ) ), 0, 0, 1 )
+
+    else:
+        # the included font has the rows LSB first
+        for c in range( 128 ):
+            for y in range( 8 ):
+                row = _pixels[ c ][ y ]
+                for x in range( 8 ):
+                    if row & ( 0x01 << x ):
+                        data[ 8 * c + x ] |= 0x01 << y
+
+    return data
+
+
 # ===========================================================================
 #
 # from https://github.com/dhepper/font8x8/raw/master/font8x8_basic.h
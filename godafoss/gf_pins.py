@@ -832,14 +832,14 @@ class _pin_in_inverted( pin_in ):
 
 # ===========================================================================
 
-class _pin_out_inverted( pin_out ):
+class _pin_out_inverted( pin_out, _worker ):
 
     # =======================================================================
 
     def __init__( self, pin ):
-        pin_out.__init__( self, self )
         self.pin = None
         self._pin = pin.as_pin_out()
+        pin_out.__init__( self, self )
 
     # =======================================================================
 
@@ -0,0 +1,605 @@
+# ===========================================================================
+#
+# file     : gf_pixel_formats.py
+# part of  : godafoss micropython library
+# url      : https://www.github.com/wovo/godafoss
+# author   : Wouter van Ooijen (wouter@voti.nl) 2024
+# license  : MIT license, see license attribute (godafoss.license)
+#
+# ===========================================================================
+#
+# Bulk conversions between pixel formats.
+#
+# Each conversion reads n pixels from a source buffer and writes them
+# to a target bytearray or memoryview.
+# On MicroPython the inner loops are viper kernels.
+# On CPython they are replaced by bulk slice and translate operations,
+# which are much faster than a per-pixel loop in Python.
+# The viper kernels also run on CPython (as plain Python),
+# the unit test checks that both produce the same bytes.
+#
+# ===========================================================================
+
+from godafoss import *
+
+
+# ===========================================================================
+
+def _order_offsets(
+    order: str
+) -> int:
+    """
+    the source offsets of the channels for a color order, packed
+
+    This function returns the offsets within an rgb888 pixel of the
+    channels that are to be stored first, second and third,
+    packed as 2 bits each.
+    """
+
+    order = order.upper()
+    if ( len( order ) != 3 ) or ( sorted( order ) != [ "B", "G", "R" ] ):
+        raise ValueError( "unsupported color order '%s'" % order )
+    return (
+        "RGB".index( order[ 0 ] )
+        | ( "RGB".index( order[ 1 ] ) << 2 )
+        | ( "RGB".index( order[ 2 ] ) << 4 )
+    )
+
+
+# ===========================================================================
+
+_rgb332_tables = {}
+
+def _rgb332_table(
+    big_endian: bool
+) -> bytearray:
+    """
+    the rgb332 to rgb565 lookup table for a byte order
+
+    The 512 byte table holds the two rgb565 bytes of each rgb332 value,
+    in the target byte order.
+    It is created by the first call.
+    """
+
+    try:
+        return _rgb332_tables[ big_endian ]
+    except KeyError:
+        pass
+
+    table = bytearray( 512 )
+    for v in range( 256 ):
+        c = (
+            ( ( v & 0xE0 ) << 8 )
+            | ( ( ( v << 3 ) & 0xE0 ) << 3 )
+            | ( ( ( v << 6 ) & 0xC0 ) >> 3 )
+        )
+        table[ 2 * v ] = ( c >> 8 ) if big_endian else ( c & 0xFF )
+        table[ 2 * v + 1 ] = ( c & 0xFF ) if big_endian else ( c >> 8 )
+    _rgb332_tables[ big_endian ] = table
+    return table
+
+
+# ===========================================================================
+#
+# viper kernels
+#
+# A viper function can have at most 4 arguments,
+# so the conversion parameters are packed.
+#
+# ===========================================================================
+
+@micropython.viper
+def _rgb888_to_rgb565_viper( source, target, n: int, order: int ):
+    s = ptr8( source )
+    t = ptr8( target )
+    a = order & 3
+    b = ( order >> 2 ) & 3
+    c = ( order >> 4 ) & 3
+    high = ( order >> 6 ) & 1
+    low = 1 - high
+    i = 0
+    j = 0
+    end = 3 * n
+    while i < end:
+        v = ( ( s[ i + a ] & 0xF8 ) << 8 ) \
+            | ( ( s[ i + b ] & 0xFC ) << 3 ) \
+            | ( s[ i + c ] >> 3 )
+        t[ j + high ] = v >> 8
+        t[ j + low ] = v & 0xFF
+        i += 3
+        j += 2
+
+
+# ===========================================================================
+
+@micropython.viper
+def _rgb332_to_rgb565_viper( source, target, n: int, table ):
+    s = ptr8( source )
+    t = ptr8( target )
+    lookup = ptr8( table )
+    i = 0
+    j = 0
+    while i < n:
+        v = 2 * s[ i ]
+        t[ j ] = lookup[ v ]
+        t[ j + 1 ] = lookup[ v + 1 ]
+        i += 1
+        j += 2
+
+
+# ===========================================================================
+
+@micropython.viper
+def _rgb888_to_rgb444_viper( source, target, n: int, high: int ):
+    s = ptr8( source )
+    t = ptr8( target )
+    low = 1 - high
+    i = 0
+    j = 0
+    end = 3 * n
+    while i < end:
+        t[ j + high ] = s[ i ] >> 4
+        t[ j + low ] = ( s[ i + 1 ] & 0xF0 ) | ( s[ i + 2 ] >> 4 )
+        i += 3
+        j += 2
+
+
+# ===========================================================================
+
+@micropython.viper
+def _rgb888_to_grb_viper( source, target, n: int ):
+    s = ptr8( source )
+    t = ptr8( target )
+    i = 0
+    end = 3 * n
+    while i < end:
+        t[ i ] = s[ i + 1 ]
+        t[ i + 1 ] = s[ i ]
+        t[ i + 2 ] = s[ i + 2 ]
+        i += 3
+
+
+# ===========================================================================
+
+@micropython.viper
+def _rgb888_lookup_viper( source, target, mode: int, table ):
+    # mode: bits 0..19 number of pixels, 20..23 target stride
+    s = ptr8( source )
+    t = ptr8( target )
+    lookup = ptr8( table )
+    stride = ( mode >> 20 ) & 0xF
+    i = 0
+    j = 0
+    end = 3 * ( mode & 0xFFFFF )
+    while i < end:
+        t[ j ] = lookup[ s[ i ] ]
+        t[ j + 1 ] = lookup[ s[ i + 1 ] ]
+        t[ j + 2 ] = lookup[ s[ i + 2 ] ]
+        i += 3
+        j += stride
+
+
+# ===========================================================================
+
+@micropython.viper
+def _mono_row_to_rgb565_viper( source, target, mode: int, colors ):
+    # mode: bits 0..15 width, 16..17 format, 18..20 vlsb bit
+    s = ptr8( source )
+    t = ptr8( target )
+    c = ptr8( colors )
+    width = mode & 0xFFFF
+    format = ( mode >> 16 ) & 3
+    bit = ( mode >> 18 ) & 7
+    x = 0
+    j = 0
+    while x < width:
+        if format == 0:
+            v = ( s[ x ] >> bit ) & 1
+        elif format == 1:
+            v = ( s[ x >> 3 ] >> ( 7 - ( x & 7 ) ) ) & 1
+        else:
+            v = ( s[ x >> 3 ] >> ( x & 7 ) ) & 1
+        k = 0 if v else 2
+        t[ j ] = c[ k ]
+        t[ j + 1 ] = c[ k + 1 ]
+        x += 1
+        j += 2
+
+
+# ===========================================================================
+#
+# CPython: bulk operations
+#
+# ===========================================================================
+
+if not running_micropython:
+
+    # =======================================================================
+
+    def _table( f ):
+        return bytes( f( v ) & 0xFF for v in range( 256 ) )
+
+    def _or( a, b ):
+        # the bitwise or of two byte strings of the same length
+        return (
+            int.from_bytes( a, "big" ) | int.from_bytes( b, "big" )
+        ).to_bytes( len( a ), "big" )
+
+    _bits_7_3 = _table( lambda v: v & 0xF8 )
+    _bits_7_5_low = _table( lambda v: v >> 5 )
+    _bits_4_2_high = _table( lambda v: ( v << 3 ) & 0xE0 )
+    _bits_7_3_low = _table( lambda v: v >> 3 )
+    _bits_7_4 = _table( lambda v: v & 0xF0 )
+    _bits_7_4_low = _table( lambda v: v >> 4 )
+
+    # =======================================================================
+
+    def _rgb888_to_rgb565_bulk( source, target, n, order ):
+        m = 3 * n
+        s = bytes( source[ : m ] )
+        a = s[ order & 3 : m : 3 ]
+        b = s[ ( order >> 2 ) & 3 : m : 3 ]
+        c = s[ ( order >> 4 ) & 3 : m : 3 ]
+        high = ( order >> 6 ) & 1
+        target[ high : 2 * n : 2 ] = _or(
+            a.translate( _bits_7_3 ), b.translate( _bits_7_5_low ) )
+        target[ 1 - high : 2 * n : 2 ] = _or(
+            b.translate( _bits_4_2_high ), c.translate( _bits_7_3_low ) )
+
+    # =======================================================================
+
+    def _rgb332_to_rgb565_bulk( source, target, n, table ):
+        s = bytes( source[ : n ] )
+        target[ 0 : 2 * n : 2 ] = s.translate( bytes( table[ 0 : : 2 ] ) )
+        target[ 1 : 2 * n : 2 ] = s.translate( bytes( table[ 1 : : 2 ] ) )
+
+    # =======================================================================
+
+    def _rgb888_to_rgb444_bulk( source, target, n, high ):
+        m = 3 * n
+        s = bytes( source[ : m ] )
+        target[ high : 2 * n : 2 ] = \
+            s[ 0 : m : 3 ].translate( _bits_7_4_low )
+        target[ 1 - high : 2 * n : 2 ] = _or(
+            s[ 1 : m : 3 ].translate( _bits_7_4 ),
+            s[ 2 : m : 3 ].translate( _bits_7_4_low ) )
+
+    # =======================================================================
+
+    def _rgb888_to_grb_bulk( source, target, n ):
+        m = 3 * n
+        s = bytes( source[ : m ] )
+        target[ 0 : m : 3 ] = s[ 1 : m : 3 ]
+        target[ 1 : m : 3 ] = s[ 0 : m : 3 ]
+        target[ 2 : m : 3 ] = s[ 2 : m : 3 ]
+
+    # =======================================================================
+
+    def _rgb888_lookup_bulk( source, target, mode, table ):
+        n = mode & 0xFFFFF
+        stride = ( mode >> 20 ) & 0xF
+        s = bytes( source[ : 3 * n ] ).translate( table )
+        if stride == 3:
+            target[ : 3 * n ] = s
+        else:
+            end = stride * ( n - 1 ) + 3
+            for i in range( 3 ):
+                target[ i : end : stride ] = s[ i : : 3 ]
+
+    # =======================================================================
+
+    def _mono_row_to_rgb565_bulk( source, target, mode, colors ):
+        width = mode & 0xFFFF
+        format = ( mode >> 16 ) & 3
+        bit = ( mode >> 18 ) & 7
+        on, off = bytes( colors[ 0 : 2 ] ), bytes( colors[ 2 : 4 ] )
+        if format == 0:
+            bits = ( ( v >> bit ) & 1 for v in source[ : width ] )
+        else:
+            shifts = ( 7, 6, 5, 4, 3, 2, 1, 0 ) if format == 1 \
+                else ( 0, 1, 2, 3, 4, 5, 6, 7 )
+            bits = (
+                ( v >> shift ) & 1
+                    for v in source[ : ( width + 7 ) // 8 ]
+                        for shift in shifts )
+        target[ : 2 * width ] = b"".join(
+            on if v else off for v, _ in zip( bits, range( width ) ) )
+
+
+# ===========================================================================
+#
+# the kernels used by the conversions
+#
+# ===========================================================================
+
+if running_micropython:
+    _rgb888_to_rgb565_kernel = _rgb888_to_rgb565_viper
+    _rgb332_to_rgb565_kernel = _rgb332_to_rgb565_viper
+    _rgb888_to_rgb444_kernel = _rgb888_to_rgb444_viper
+    _rgb888_to_grb_kernel = _rgb888_to_grb_viper
+    _rgb888_lookup_kernel = _rgb888_lookup_viper
+    _mono_row_to_rgb565_kernel = _mono_row_to_rgb565_viper
+
+else:
+    _rgb888_to_rgb565_kernel = _rgb888_to_rgb565_bulk
+    _rgb332_to_rgb565_kernel = _rgb332_to_rgb565_bulk
+    _rgb888_to_rgb444_kernel = _rgb888_to_rgb444_bulk
+    _rgb888_to_grb_kernel = _rgb888_to_grb_bulk
+    _rgb888_lookup_kernel = _rgb888_lookup_bulk
+    _mono_row_to_rgb565_kernel = _mono_row_to_rgb565_bulk
+
+
+# ===========================================================================
+#
+# conversions
+#
+# ===========================================================================
+
+def rgb888_to_rgb565(
+    source: [ bytes | bytearray | memoryview ],
+    target: [ bytearray | memoryview ],
+    n: int,
+    order: str = "RGB",
+    big_endian: bool = True
+) -> None:
+    """
+    convert rgb888 pixels to rgb565
+
+    :param source: bytes, bytearray, memoryview
+        the rgb888 pixels: 3 bytes per pixel, red first
+
+    :param target: bytearray, memoryview
+        the rgb565 pixels: 2 bytes per pixel
+
+    :param n: int
+        the number of pixels
+
+    :param order: str
+        the order in which the channels are stored in the rgb565 value
+        (default: "RGB", the first channel is stored in the high bits)
+
+    :param big_endian: bool
+        True (default) to store the high byte first, as is
+        sent to an lcd, False to store the low byte first,
+        as a framebuf.RGB565 FrameBuffer does on a little endian chip
+    """
+
+    _rgb888_to_rgb565_kernel(
+        source,
+        target,
+        n,
+        _order_offsets( order ) | ( 0 if big_endian else 0x40 )
+    )
+
+
+# ===========================================================================
+
+def rgb332_to_rgb565(
+    source: [ bytes | bytearray | memoryview ],
+    target: [ bytearray | memoryview ],
+    n: int,
+    big_endian: bool = True
+) -> None:
+    """
+    convert rgb332 pixels to rgb565
+
+    :param source: bytes, bytearray, memoryview
+        the rgb332 pixels: 1 byte per pixel
+
+    :param target: bytearray, memoryview
+        the rgb565 pixels: 2 bytes per pixel
+
+    :param n: int
+        the number of pixels
+
+    :param big_endian: bool
+        True (default) to store the high byte first
+
+    The conversion uses a 512 byte lookup table,
+    which is created by the first call.
+    """
+
+    _rgb332_to_rgb565_kernel(
+        source,
+        target,
+        n,
+        _rgb332_table( big_endian )
+    )
+
+
+# ===========================================================================
+
+def rgb888_to_rgb444(
+    source: [ bytes | bytearray | memoryview ],
+    target: [ bytearray | memoryview ],
+    n: int,
+    big_endian: bool = True
+) -> None:
+    """
+    convert rgb888 pixels to 16-bit rgb444 values
+
+    :param source: bytes, bytearray, memoryview
+        the rgb888 pixels: 3 bytes per pixel, red first
+
+    :param target: bytearray, memoryview
+        the rgb444 values: 2 bytes per pixel, 0x0RGB
+
+    :param n: int
+        the number of pixels
+
+    :param big_endian: bool
+        True (default) to store the high byte first
+
+    This is the 4 bits per channel format of the hub75 driver.
+    """
+
+    _rgb888_to_rgb444_kernel( source, target, n, 0 if big_endian else 1 )
+
+
+# ===========================================================================
+
+def rgb888_to_grb(
+    source: [ bytes | bytearray | memoryview ],
+    target: [ bytearray | memoryview ],
+    n: int
+) -> None:
+    """
+    convert rgb888 pixels to grb888
+
+    :param source: bytes, bytearray, memoryview
+        the rgb888 pixels: 3 bytes per pixel, red first
+
+    :param target: bytearray, memoryview
+        the grb888 pixels: 3 bytes per pixel, green first
+
+    :param n: int
+        the number of pixels
+
+    This is the byte order of ws2812 (neopixel) leds.
+    """
+
+    _rgb888_to_grb_kernel( source, target, n )
+
+
+# ===========================================================================
+
+def rgb888_lookup(
+    source: [ bytes | bytearray | memoryview ],
+    target: [ bytearray | memoryview ],
+    n: int,
+    table: [ bytes | bytearray ],
+    stride: int = 3
+) -> None:
+    """
+    pass the bytes of rgb888 pixels through a lookup table
+
+    :param source: bytes, bytearray, memoryview
+        the pixels: 3 bytes per pixel, in any color order
+
+    :param target: bytearray, memoryview
+        the looked-up pixels, in the same color order
+
+    :param n: int
+        the number of pixels
+
+    :param table: bytes, bytearray
+        the 256 entry lookup table
+
+    :param stride: int
+        the distance between the pixels in the target, 3..15 (default: 3)
+
+    Each byte v of the source is written as table[ v ] to the target.
+    A stride larger than 3 leaves the bytes between the pixels alone,
+    for instance the brightness byte of each apa102 pixel.
+    """
+
+    if not 3 <= stride <= 15:
+        raise ValueError( "stride %d" % stride )
+    if n > 0:
+        _rgb888_lookup_kernel( source, target, n | ( stride << 20 ), table )
+
+
+# ===========================================================================
+
+def brightness_table(
+    gamma: float = 1.0,
+    brightness: int = 255
+) -> bytes:
+    """
+    a lookup table for gamma correction and dimming
+
+    :param gamma: float
+        the gamma exponent (default: 1.0, no correction)
+
+    :param brightness: int
+        the brightness, 0..255 (default: 255, full brightness)
+
+    :result: bytes
+        the 256 entry table for :func:`rgb888_lookup`
+
+    Entry v of the table is brightness * ( v / 255 ) ** gamma,
+    rounded, so the default table leaves the bytes unchanged.
+    A gamma of about 2.5 makes the perceived brightness of leds
+    (which is not linear in their duty cycle) more even.
+    """
+
+    if not 0 <= brightness <= 255:
+        raise ValueError( "brightness %d" % brightness )
+    return bytes(
+        int( brightness * ( v / 255 ) ** gamma + 0.5 )
+            for v in range( 256 )
+    )
+
+
+# ===========================================================================
+
+def mono_to_rgb565(
+    source: [ bytes | bytearray | memoryview ],
+    format: int,
+    size: xy,
+    target: [ bytearray | memoryview ],
+    on: int,
+    off: int,
+    big_endian: bool = True
+) -> None:
+    """
+    convert monochrome pixels to rgb565
+
+    :param source: bytes, bytearray, memoryview
+        the monochrome pixels
+
+    :param format: int
+        the :class:`~godafoss.pixel_format` of the source,
+        one of the pixel_format.monochrome formats
+
+    :param size: :class:`~godafoss.xy`
+        the size of the source in pixels
+
+    :param target: bytearray, memoryview
+        the rgb565 pixels: 2 bytes per pixel,
+        size.x pixels per row
+
+    :param on: int
+        the rgb565 value for a set pixel
+
+    :param off: int
+        the rgb565 value for a pixel that is not set
+
+    :param big_endian: bool
+        True (default) to store the high byte first
+    """
+
+    if format not in pixel_format.monochrome:
+        raise ValueError( "unsupported pixel format %d" % format )
+
+    if big_endian:
+        colors = bytes( [ on >> 8, on & 0xFF, off >> 8, off & 0xFF ] )
+    else:
+        colors = bytes( [ on & 0xFF, on >> 8, off & 0xFF, off >> 8 ] )
+
+    source = memoryview( source )
+    target = memoryview( target )
+    row = 2 * size.x
+    if format == pixel_format.mono_vlsb:
+        for y in range( size.y ):
+            start = ( y >> 3 ) * size.x
+            _mono_row_to_rgb565_kernel(
+                source[ start : start + size.x ],
+                target[ y * row : ( y + 1 ) * row ],
+                size.x | ( ( y & 7 ) << 18 ),
+                colors
+            )
+    else:
+        stride = ( size.x + 7 ) // 8
+        mode = size.x | (
+            ( 1 if format == pixel_format.mono_hlsb else 2 ) << 16 )
+        for y in range( size.y ):
+            _mono_row_to_rgb565_kernel(
+                source[ y * stride : ( y + 1 ) * stride ],
+                target[ y * row : ( y + 1 ) * row ],
+                mode,
+                colors
+            )
+
+
+# ===========================================================================
@@ -0,0 +1,456 @@
+# ===========================================================================
+#
+# file     : gf_rp2.py
+# part of  : godafoss micropython library
+# url      : https://www.github.com/wovo/godafoss
+# author   : Wouter van Ooijen (wouter@voti.nl) 2024
+# license  : MIT license, see license attribute (godafoss.license)
+#
+# ===========================================================================
+#
+# RP2040 DMA and PIO register values.
+#
+# The rp2 drivers (hub75, ws281x_rp2) program the DMA channels by
+# writing their registers with machine.mem32.
+# This file computes the register addresses and values,
+# without using the rp2, machine and uctypes modules,
+# so it can be tested on CPython.
+#
+# ===========================================================================
+
+from godafoss import *
+
+
+# ===========================================================================
+
+rp2_dma_base = const( 0x50000000 )
+"base address of the DMA registers"
+
+rp2_dma_multi_trigger = const( 0x50000430 )
+"DMA register that triggers the channels in the written mask"
+
+rp2_dma_abort = const( 0x50000444 )
+"DMA register that aborts the channels in the written mask"
+
+
+# ===========================================================================
+
+def rp2_dma_register(
+    channel: int,
+    offset: int
+) -> int:
+    """
+    the address of a DMA channel register
+
+    :param channel: int
+        the DMA channel, 0..11
+
+    :param offset: int
+        the offset of the register: 0x00 read address,
+        0x04 write address, 0x08 transfer count, 0x0C control (trigger),
+        0x10 control (no trigger), 0x3C read address (trigger)
+    """
+
+    if not 0 <= channel < 12:
+        raise ValueError( "dma channel %d" % channel )
+    return rp2_dma_base + channel * 0x40 + offset
+
+
+# ===========================================================================
+
+def rp2_dma_control(
+    treq: int,
+    chain_to: int,
+    data_size: int = 2,
+    increment_read: bool = True,
+    increment_write: bool = False,
+    byte_swap: bool = False
+) -> int:
+    """
+    the value of a DMA channel control register
+
+    :param treq: int
+        the transfer request signal (for instance a PIO tx fifo)
+        that paces the transfer, 0x3F for unpaced
+
+    :param chain_to: int
+        the channel that is triggered when the transfer is done,
+        the channel itself for no chaining
+
+    :param data_size: int
+        the size of a transfer: 0 byte, 1 half word, 2 word (default)
+
+    :param increment_read: bool
+        increment the read address after each transfer (default: True)
+
+    :param increment_write: bool
+        increment the write address after each transfer (default: False)
+
+    :param byte_swap: bool
+        reverse the order of the bytes in each transfer (default: False)
+
+    The value has the enable bit set.
+    """
+
+    return (
+        ( 1 << 22 if byte_swap else 0 )
+        | ( treq << 15 )
+        | ( chain_to << 11 )
+        | ( 1 << 5 if increment_write else 0 )
+        | ( 1 << 4 if increment_read else 0 )
+        | ( data_size << 2 )
+        | 1
+    )
+
+
+# ===========================================================================
+
+def rp2_pio_tx_fifo(
+    pio: int,
+    sm: int
+) -> int:
+    """
+    the address of the tx fifo of a PIO state machine
+    """
+
+    return ( 0x50200010 if pio == 0 else 0x50300010 ) + 4 * sm
+
+
+# ===========================================================================
+
+def rp2_pio_tx_dreq(
+    pio: int,
+    sm: int
+) -> int:
+    """
+    the DMA transfer request number of the tx fifo of a PIO state machine
+    """
+
+    return 8 * pio + sm
+
+
+# ===========================================================================
+
+class rp2_frames:
+    """
+    a set of frame buffers that is used round-robin
+
+    :param size: int
+        the size of a frame in bytes
+
+    :param n: int
+        the number of frames (default: 2, double buffering)
+
+    A driver draws (or encodes) the next frame into back(),
+    while the hardware is still transferring the previous frame.
+    swap() returns the back frame, which is then to be transferred,
+    and makes the next frame the back frame.
+    With a single frame, the driver must wait for the transfer
+    to finish before it can write to back().
+    """
+
+    # =======================================================================
+
+    def __init__(
+        self,
+        size: int,
+        n: int = 2
+    ):
+        self.frames = [ bytearray( size ) for _ in range( n ) ]
+        self._back = 0
+
+    # =======================================================================
+
+    def back( self ) -> bytearray:
+        """
+        the frame that is to be written
+        """
+
+        return self.frames[ self._back ]
+
+    # =======================================================================
+
+    def swap( self ) -> bytearray:
+        """
+        the frame that was written, the next frame becomes the back frame
+        """
+
+        frame = self.frames[ self._back ]
+        self._back = ( self._back + 1 ) % len( self.frames )
+        return frame
+
+
+# ===========================================================================
+
+def rp2_ws281x_dma(
+    address: int,
+    n: int,
+    channels: list,
+    pio: int,
+    sms: list
+) -> list:
+    """
+    the DMA register writes that transfer a ws281x frame
+
+    :param address: int
+        the address of the frame: 4 bytes per pixel, the strips
+        one after the other
+
+    :param n: int
+        the number of pixels of each strip
+
+    :param channels: list
+        the DMA channel for each strip
+
+    :param pio: int
+        the PIO block (0 or 1) of the state machines
+
+    :param sms: list
+        the state machine (0..3) for each strip
+
+    :result: list
+        the ( register, value ) writes that configure the channels,
+        without starting them
+
+    Each channel transfers the 32-bit words of its strip to the
+    tx fifo of its state machine, paced by that fifo.
+    The bytes of each word are swapped, so the wire order bytes
+    (stored first in the word) are shifted out first.
+    The channels are started together by writing their mask
+    to rp2_dma_multi_trigger.
+    """
+
+    if len( channels ) != len( sms ):
+        raise ValueError( "%d channels for %d state machines"
+            % ( len( channels ), len( sms ) ) )
+    writes = []
+    for strip, ( channel, sm ) in enumerate( zip( channels, sms ) ):
+        writes.extend( [
+            ( rp2_dma_register( channel, 0x00 ), address + 4 * n * strip ),
+            ( rp2_dma_register( channel, 0x04 ),
+                rp2_pio_tx_fifo( pio, sm ) ),
+            ( rp2_dma_register( channel, 0x08 ), n ),
+            ( rp2_dma_register( channel, 0x10 ), rp2_dma_control(
+                treq = rp2_pio_tx_dreq( pio, sm ),
+                chain_to = channel,
+                byte_swap = True
+            ) ),
+        ] )
+    return writes
+
+
+# ===========================================================================
+
+def rp2_hub75_frame(
+    width: int,
+    rows: int,
+    depth: int,
+    on_time: int,
+    exec_words: list
+) -> bytearray:
+    """
+    the PIO data stream for a hub75 panel, with blank bitplanes
+
+    :param width: int
+        the number of pixels in a row, a multiple of 4
+
+    :param rows: int
+        the number of row pairs (half the height of the panel)
+
+    :param depth: int
+        the number of bitplanes, 1..8
+
+    :param on_time: int
+        the display time (in state machine cycles) of the least
+        significant bitplane
+
+    :param exec_words: list
+        for each row pair, the PIO instruction that selects it
+
+    :result: bytearray
+        the stream of records, bitplane after bitplane,
+        row pair after row pair
+
+    The record for a bitplane p of a row pair consists of
+    the number of pixels - 1 (a 32-bit word),
+    a byte with the 6 color bits for each pixel,
+    the row select instruction (a 32-bit word),
+    and the display time - 1 (a 32-bit word).
+    The display time of bitplane p is on_time << p:
+    each bitplane is displayed twice as long as the previous one
+    (binary code modulation).
+    """
+
+    if width % 4:
+        raise ValueError( "hub75 width %d is not a multiple of 4" % width )
+    if not 1 <= depth <= 8:
+        raise ValueError( "hub75 depth %d" % depth )
+    if on_time < 1:
+        raise ValueError( "hub75 on_time %d" % on_time )
+    record = width + 12
+    frame = bytearray( depth * rows * record )
+    for plane in range( depth ):
+        for row in range( rows ):
+            i = ( plane * rows + row ) * record
+            frame[ i : i + 4 ] = ( width - 1 ).to_bytes( 4, "little" )
+            i += 4 + width
+            frame[ i : i + 4 ] = exec_words[ row ].to_bytes( 4, "little" )
+            frame[ i + 4 : i + 8 ] = \
+                ( ( on_time << plane ) - 1 ).to_bytes( 4, "little" )
+    return frame
+
+
+# ===========================================================================
+
+@micropython.viper
+def _hub75_bitplanes_viper( source, target, mode: int, row: int ):
+    # mode: bits 0..11 width, 12..19 rows, 20..23 depth
+    s = ptr8( source )
+    t = ptr8( target )
+    width = mode & 0xFFF
+    rows = ( mode >> 12 ) & 0xFF
+    depth = ( mode >> 20 ) & 0xF
+    record = width + 12
+    first = row * record + 4
+    step = rows * record
+    upper = 2 * width * row
+    lower = 2 * width * ( row + rows )
+    x = 0
+    while x < width:
+        a = s[ upper ] | ( s[ upper + 1 ] << 8 )
+        b = s[ lower ] | ( s[ lower + 1 ] << 8 )
+        r1 = ( ( a >> 8 ) & 0xF8 ) | ( a >> 13 )
+        g1 = ( ( a >> 3 ) & 0xFC ) | ( ( a >> 9 ) & 0x03 )
+        b1 = ( ( a << 3 ) & 0xF8 ) | ( ( a >> 2 ) & 0x07 )
+        r2 = ( ( b >> 8 ) & 0xF8 ) | ( b >> 13 )
+        g2 = ( ( b >> 3 ) & 0xFC ) | ( ( b >> 9 ) & 0x03 )
+        b2 = ( ( b << 3 ) & 0xF8 ) | ( ( b >> 2 ) & 0x07 )
+        j = first + x
+        plane = 0
+        while plane < depth:
+            shift = 8 - depth + plane
+            t[ j ] = ( ( r1 >> shift ) & 1 ) \
+                | ( ( ( g1 >> shift ) & 1 ) << 1 ) \
+                | ( ( ( b1 >> shift ) & 1 ) << 2 ) \
+                | ( ( ( r2 >> shift ) & 1 ) << 3 ) \
+                | ( ( ( g2 >> shift ) & 1 ) << 4 ) \
+                | ( ( ( b2 >> shift ) & 1 ) << 5 )
+            j += step
+            plane += 1
+        upper += 2
+        lower += 2
+        x += 1
+
+
+# ===========================================================================
+
+if not running_micropython:
+
+    from godafoss.gf_pixel_formats import _table, _or
+
+    # =======================================================================
+
+    def _hub75_bit(
+        channel: int,
+        shift: int
+    ):
+        # the byte (high or low) and bit of an rgb565 pixel that
+        # holds bit shift of the channel, expanded to 8 bits
+        # by repeating its most significant bits
+        if channel == 1:
+            k = shift - 2 if shift >= 2 else shift + 4
+            return ( True, k - 3 ) if k >= 3 else ( False, k + 5 )
+        k = shift - 3 if shift >= 3 else shift + 2
+        return ( True, k + 3 ) if channel == 0 else ( False, k )
+
+    _hub75_tables = {}
+
+    def _hub75_table( bit, position ):
+        try:
+            return _hub75_tables[ bit, position ]
+        except KeyError:
+            table = _table( lambda v: ( ( v >> bit ) & 1 ) << position )
+            _hub75_tables[ bit, position ] = table
+            return table
+
+    # =======================================================================
+
+    def _hub75_bitplanes_bulk( source, target, mode, row ):
+        width = mode & 0xFFF
+        rows = ( mode >> 12 ) & 0xFF
+        depth = ( mode >> 20 ) & 0xF
+        record = width + 12
+        halves = []
+        for r in ( row, row + rows ):
+            data = bytes( source[ 2 * width * r : 2 * width * ( r + 1 ) ] )
+            halves.append( ( data[ 1 : : 2 ], data[ 0 : : 2 ] ) )
+        for plane in range( depth ):
+            shift = 8 - depth + plane
+            value = bytes( width )
+            for half, ( high, low ) in enumerate( halves ):
+                for channel in range( 3 ):
+                    in_high, bit = _hub75_bit( channel, shift )
+                    table = _hub75_table( bit, 3 * half + channel )
+                    value = _or( value, ( high if in_high else low )
+                        .translate( table ) )
+            j = ( plane * rows + row ) * record + 4
+            target[ j : j + width ] = value
+
+
+# ===========================================================================
+
+if running_micropython:
+    _hub75_bitplanes_kernel = _hub75_bitplanes_viper
+
+else:
+    _hub75_bitplanes_kernel = _hub75_bitplanes_bulk
+
+
+# ===========================================================================
+
+def rp2_hub75_encode(
+    source: [ bytes | bytearray | memoryview ],
+    target: [ bytearray | memoryview ],
+    width: int,
+    rows: int,
+    depth: int,
+    row: int
+) -> None:
+    """
+    encode the bitplanes of a row pair of a hub75 panel
+
+    :param source: bytes, bytearray, memoryview
+        the pixels of the panel: rgb565, 2 bytes per pixel,
+        least significant byte first (as in a framebuf.RGB565)
+
+    :param target: bytearray, memoryview
+        the stream made by :func:`rp2_hub75_frame`
+
+    :param width: int
+        the number of pixels in a row
+
+    :param rows: int
+        the number of row pairs
+
+    :param depth: int
+        the number of bitplanes
+
+    :param row: int
+        the row pair: the rows row and row + rows of the panel
+
+    Each channel is expanded to 8 bits,
+    bitplane p holds bit 8 - depth + p of the channels.
+    The 6 color bits of a pixel of a bitplane are
+    r1 (bit 0), g1, b1, r2, g2, b2 (bit 5),
+    where 1 is the upper and 2 the lower half of the panel.
+    """
+
+    _hub75_bitplanes_kernel(
+        source,
+        target,
+        width | ( rows << 12 ) | ( depth << 20 ),
+        row
+    )
+
+
+# ===========================================================================
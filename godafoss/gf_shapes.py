@@ -212,6 +212,18 @@ class line( shape ):
         $macro_insert shape_write
         """
 
+        # horizontal and vertical lines are written as a single span
+        if ( self._span.x == 0 ) or ( self._span.y == 0 ):
+            vertical = self._span.x == 0
+            length = self._span.y if vertical else self._span.x
+            if length < 0:
+                # the start pixel is included, the far end is not
+                length = - length
+                offset = offset + self._span + (
+                    xy( 0, 1 ) if vertical else xy( 1, 0 ) )
+            s.fill_span( offset, length, ink, vertical )
+            return
+
         x0 = offset.x
         y0 = offset.y
         x1 = offset.x + self._span.x
@@ -248,10 +260,10 @@ class line( shape ):
 
         for x in range( x0, x1, xstep ):
 
-            s.write_pixel(
-                xy( y, x ) if steep else xy( x, y ),
-                ink
-            )
+            if steep:
+                s.write_pixel_xy( y, x, ink )
+            else:
+                s.write_pixel_xy( x, y, ink )
 
             if E > 0:
                 E += TwoDyTwoDx  # E += 2*Dy - 2*Dx
@@ -305,9 +317,7 @@ class rectangle( shape ):
         """
 
         if self._fill:
-            for dx in range( 0, self._span.x ):
-                for dy in range( 0, self._span.y ):
-                    s.write_pixel( offset + xy( dx, dy ), ink )
+            s.fill_rect( offset, self._span, ink )
         else:
             h = line( xy( self._span.x, 0 ) )
             v = line( xy( 0, self._span.y ) )
@@ -403,13 +413,12 @@ class circle( shape ):
         y,
         ink
     ):
-        sheet.write_pixel( offset + xy( - x, y ) )
-        sheet.write_pixel( offset + xy( + x, y ) )
         if self._fill:
-            sheet.write(
-                line( 2 * xy( x, 0 ) ), xy( -x,  y ) + offset,
-                ink
-            )
+            sheet.fill_span(
+                xy._fast( offset.x - x, offset.y + y ), 2 * x + 1, ink )
+        else:
+            sheet.write_pixel_xy( offset.x - x, offset.y + y, ink )
+            sheet.write_pixel_xy( offset.x + x, offset.y + y, ink )
 
     # =======================================================================
 
@@ -450,7 +459,7 @@ class image( shape ):
     ):
         for x in range( self.size.x ):
             for y in range( self.size.y ):
-                source = xy( x, y )
+                source = xy._fast( x, y )
                 c =  self.read( source )
                 canvas.draw( source + offset, c )
 
@@ -475,6 +484,7 @@ class glyph( shape ):
         size: xy
     ) -> None:
         self.size = size
+        self._data = None
         shape.__init__( self )
 
     # =======================================================================
@@ -493,6 +503,25 @@ class glyph( shape ):
 
     # =======================================================================
 
+    def data( self ) -> bytearray:
+        """
+        the pixels of the glyph, in pixel_format.mono_vlsb
+
+        The pixels are read (once) from the glyph.
+        """
+
+        if self._data is None:
+            self._data = bytearray(
+                self.size.x * ( ( self.size.y + 7 ) // 8 ) )
+            for x in range( self.size.x ):
+                for y in range( self.size.y ):
+                    if self.read( xy._fast( x, y ) ):
+                        self._data[ x + ( y >> 3 ) * self.size.x ] \
+                            |= 0x01 << ( y & 0x07 )
+        return self._data
+
+    # =======================================================================
+
     def write(
         self,
         sheet: "sheet",
@@ -507,11 +536,16 @@ class glyph( shape ):
 
         :param offset: :class:`~godafoss.xy`
             the location within the sheet where the glyph is written
+
+        The pixels of the glyph are written by a single sheet.blit().
         """
-        for x in range( self.size.x ):
-            for y in range( self.size.y ):
-                if self.read( xy( x, y ) ):
-                    sheet.write_pixel( offset + xy( x, y ), ink )
+        sheet.blit(
+            self.data(),
+            pixel_format.mono_vlsb,
+            self.size,
+            offset,
+            ink
+        )
 
     # =======================================================================
 
@@ -529,15 +563,24 @@ class text( shape ):
     ):
         self._text = text
         self._font = font
-        if self._font == None:
-            # avoid draging in font_default.read()
-            self._font = font_default()
-            self.size = xy( len( self._text ) * 8, 8 )
-        else:
-            self.size = xy(
-                sum( [ self._font.read( c ).size.x for c in text ] ),
-                self._font.size.y
-            )
+        if self._font is None:
+            # gf_fonts is imported after this module
+            self._font = gf.font_default()
+
+        # each glyph is read only once
+        self._glyphs = [
+            self._font.read( c ) for c in self._text if c != '\n' ]
+
+        width, line_width, lines, i = 0, 0, 1, 0
+        for c in self._text:
+            if c == '\n':
+                line_width = 0
+                lines += 1
+            else:
+                line_width += self._glyphs[ i ].size.x
+                width = max( width, line_width )
+                i += 1
+        self.size = xy( width, lines * self._font.size.y )
         shape.__init__( self )
 
     # =======================================================================
@@ -550,6 +593,7 @@ class text( shape ):
     ):
         x_offset_in_text = 0
         y_offset = 0
+        i = 0
         for c in self._text:
 
             if c == '\n':
@@ -562,7 +606,8 @@ class text( shape ):
 
                 continue
 
-            glyph = self._font.read( c )
+            glyph = self._glyphs[ i ]
+            i += 1
             x_offset_in_sheet = offset.x + x_offset_in_text
 
             # skip when beyond the right side of the sheet
@@ -603,10 +648,19 @@ class ggf( shape ):
     constructed.
     When cached is False, the file data is read (but not permanently stored)
     when the ggf object is written to a canvas. This is slower, but
-    saves RAM.
-
-    The Godafoss Graphic Format (ggf) is a very simple uncompressed
-    graphic file format.
+    saves RAM: the file is read one row at a time into a single
+    row buffer.
+
+    The image is written to the canvas one row at a time, by blit().
+    For a canvas that is rgb565, the rgb332 and rgb888 rows are
+    converted to rgb565 first.
+    The rgb565 and mono_vlsb pixel formats are stored in the
+    native format of color lcds and of most monochrome displays,
+    so they are written without conversion.
+    For mono_vlsb a row is a page of 8 pixel rows.
+
+    The Godafoss Graphic Format (ggf) is a very simple
+    graphic file format, uncompressed or run-length packed.
     The gpy script (in the make directory of the godafoss github)
     can be used to create ggf files from any graphic format readable
     by PIL.
@@ -616,21 +670,53 @@ class ggf( shape ):
     +-----------+----------------+-----------------------------------+
     | byte 0    | identification | 0xA6                              |
     +-----------+----------------+-----------------------------------+
-    | byte 1    | pixel format:  | 0: 1 bit/pixel MSB first          |
+    | byte 1    | pixel format:  | 0: 1 bit/pixel LSB first          |
     |           |                +-----------------------------------+
     |           |                | 1: 1-byte RGB 3,3,2 R first       |
     |           |                +-----------------------------------+
     |           |                | 2: 3-byte RGB R first             |
+    |           |                +-----------------------------------+
+    |           |                | 3: 2-byte RGB 5,6,5 high byte     |
+    |           |                | first                             |
+    |           |                +-----------------------------------+
+    |           |                | 4: 1 bit/pixel in pages of 8 rows |
+    |           |                | (mono_vlsb)                       |
+    |           |                +-----------------------------------+
+    |           |                | + 0x80: packed                    |
     +-----------+----------------+-----------------------------------+
     | bytes 2-3 | x pixels size  | high byte first                   |
     +-----------+----------------+-----------------------------------+
     | bytes 4-5 | y pixels size  | high byte first                   |
     +-----------+----------------+-----------------------------------+
-    | bytes 6.. | pixel data     | by row; for B/W the last byte of  |
-    |           |                | each row is padded to a full byte |
+    | bytes 6.. | pixel data     | by row; for 0 the last byte of    |
+    |           |                | each row is padded to a full byte,|
+    |           |                | for 4 by page, the last page is   |
+    |           |                | padded to 8 rows                  |
     +-----------+----------------+-----------------------------------+
+
+    A packed image stores each row as its length (2 bytes, high
+    byte first) followed by the PackBits encoding of the row,
+    in units of a pixel (1 byte for 0, 1 and 4, 2 bytes for 3,
+    3 bytes for 2):
+
+    - a count byte c < 128 is followed by c + 1 literal units;
+    - a count byte c > 128 is followed by one unit
+      that is repeated 257 - c times;
+    - a count byte 128 is ignored.
+
+    Photos hardly compress, but the large areas of a single color
+    in icons, splash screens and other UI graphics do.
     """
 
+    # the pixel_format of each depth
+    _formats = (
+        pixel_format.mono_hmsb,
+        pixel_format.rgb332,
+        pixel_format.rgb888,
+        pixel_format.rgb565,
+        pixel_format.mono_vlsb
+    )
+
     # =======================================================================
 
     def __init__(
@@ -647,24 +733,30 @@ class ggf( shape ):
 
         x = f.read( 1 )[ 0 ]
         if x != 0xA6:
-            raise valueError(
+            raise ValueError(
                 "file %s first byte %02X, should be 0xA6"
                 % ( file_name, x ) )
 
         self.depth = f.read( 1 )[ 0 ]
-        if not self.depth in [ 0, 1, 2 ]:
+        self.packed = ( self.depth & 0x80 ) != 0
+        self.depth &= 0x7F
+        if not self.depth in [ 0, 1, 2, 3, 4 ]:
             raise ValueError(
-                "file %s depth byte %d, should be 0,1,2"
-                % ( file_name, depth ) )
+                "file %s depth byte %d, should be 0,1,2,3,4"
+                % ( file_name, self.depth ) )
 
         s = f.read( 2 )
         x = s[ 0 ] * 256 + s[ 1 ]
         s = f.read( 2 )
         y = s[ 0 ] * 256 + s[ 1 ]
         self.size = xy( x, y )
+        self._row_bytes = \
+            ( ( x + 7 ) // 8, x, 3 * x, 2 * x, x )[ self.depth ]
+        self._row_height = 8 if self.depth == 4 else 1
+        self._unit = ( 1, 1, 3, 2, 1 )[ self.depth ]
 
         if cached:
-            self.data = f.read( x * y * 3 )
+            self.data = bytearray( f.read() )
             self.write = self._write_cached
         else:
             self.file_name = file_name
@@ -677,87 +769,210 @@ class ggf( shape ):
     def _write_cached(
         self,
         c: canvas,
-        offset: xy = xy( 0, 0 )
+        offset: xy = xy( 0, 0 ),
+        ink: bool | color = True
     ):
-        i = 0
-        for y in range( self.size.y ):
-            for x in range( self.size.x ):
+        data = memoryview( self.data )
+        n = self._row_bytes
+
+        if not self.packed:
+            self._write_rows(
+                c,
+                offset,
+                ink,
+                lambda i, row: data[ i * n : ( i + 1 ) * n ]
+            )
+            return
+
+        # the rows are read in order
+        start = 0
 
-                if self.depth == 0:
-                    if ( x % 8 ) == 0:
-                        v = self.data[ i ]
-                        i += 1
-                    c.write_pixel(
-                        offset + xy( x, y ),
-                        v & 0x01 != 0x00
-                    )
-                    v = v >> 1
-
-                elif self.depth == 1:
-                    d = f.read( 1 )[ 0 ]
-                    r = (( d >> 5 ) & 0x07 ) << 5
-                    g = (( d >> 2 ) & 0x07 ) << 5
-                    b = (( d >> 0 ) & 0x03 ) << 6
-                    c.write_pixel(
-                        offset + xy( x, y ),
-                        color( r, g, b )
-                    )
-
-                else:
-                    p = color(
-                        self.data[ i ],
-                        self.data[ i + 1 ],
-                        self.data[ i + 2 ]
-                    )
-                    i += 3
-                    c.write_pixel( offset + xy( x, y ), p )
+        def read_row( i, row ):
+            nonlocal start
+            length = ( data[ start ] << 8 ) | data[ start + 1 ]
+            start += 2 + length
+            _unpack_row( data[ start - length : start ], row, self._unit )
+            return row
+
+        self._write_rows( c, offset, ink, read_row, bytearray( n ) )
 
     # =======================================================================
 
     def _write_from_file(
         self,
         c: canvas,
-        offset: xy = xy( 0, 0 )
+        offset: xy = xy( 0, 0 ),
+        ink: bool | color = True
     ):
         f = open( self.file_name, "rb" )
-        f.read( 5 )
-        for y in range( self.size.y ):
-            for x in range( self.size.x ):
+        f.read( 6 )
+        row = bytearray( self._row_bytes )
+
+        if self.packed:
+            # the largest packed row has a count byte per 128 bytes
+            packed = memoryview( bytearray(
+                self._row_bytes + ( self._row_bytes + 127 ) // 128 ) )
+            length = bytearray( 2 )
+
+            def read_row( i, row ):
+                f.readinto( length )
+                n = ( length[ 0 ] << 8 ) | length[ 1 ]
+                if n > len( packed ):
+                    raise ValueError( "packed row length %d" % n )
+                if f.readinto( packed[ : n ] ) != n:
+                    raise ValueError( "packed row truncated" )
+                _unpack_row( packed[ : n ], row, self._unit )
+                return row
 
-                if self.depth == 0:
-                    if ( x % 8 ) == 0:
-                        v = f.read( 1 )[ 0 ]
-                    c.write_pixel(
-                        offset + xy( x, y ),
-                        v & 0x01 != 0x00
-                    )
-                    v = v >> 1
-
-                elif self.depth == 1:
-                    d = f.read( 1 )[ 0 ]
-                    r = (( d >> 5 ) & 0x07 ) << 5
-                    g = (( d >> 2 ) & 0x07 ) << 5
-                    b = (( d >> 0 ) & 0x03 ) << 6
-                    c.write_pixel(
-                        offset + xy( x, y ),
-                        color( r, g, b )
-                    )
-
-                else:
-                    d = f.read( 3 )
-                    p = color(
-                        d[ 0 ],
-                        d[ 1 ],
-                        d[ 2 ]
-                    )
-                    c.write_pixel(
-                        offset + xy( x, y ),
-                        p
-                    )
-        f.close()
+        else:
+
+            def read_row( i, row ):
+                f.readinto( row )
+                return row
+
+        try:
+            self._write_rows( c, offset, ink, read_row, row )
+        finally:
+            f.close()
+
+    # =======================================================================
+
+    def _write_rows(
+        self,
+        c: canvas,
+        offset: xy,
+        ink: bool | color,
+        read_row,
+        row = None
+    ):
+        """
+        write the image to the canvas, one row at a time
+
+        read_row( i, row ) returns the data of row i
+        (the row argument is a buffer that it can use).
+        Each row is blitted to the canvas.
+        When the canvas is rgb565 the rgb332 and rgb888 rows are first
+        converted to rgb565 in a (single) row buffer.
+        The rows below the canvas are not read.
+        """
+
+        if self.depth in ( 0, 4 ):
+            # the pixels that are not set are written too
+            c.fill_rect( offset, self.size, False )
+
+        format = ggf._formats[ self.depth ]
+        convert = None
+        if (
+            ( self.depth in ( 1, 2 ) )
+            and ( c.native_format == pixel_format.rgb565 )
+        ):
+            convert = (
+                rgb332_to_rgb565
+                if self.depth == 1 else
+                rgb888_to_rgb565 )
+            buffer = bytearray( 2 * self.size.x )
+            format = pixel_format.rgb565
+
+        h = self._row_height
+        y = 0
+        while ( y < self.size.y ) and ( offset.y + y < c.size.y ):
+            data = read_row( y // h, row )
+            if offset.y + y + h > 0:
+                if convert is not None:
+                    convert( data, buffer, self.size.x )
+                    data = buffer
+                c.blit(
+                    data,
+                    format,
+                    xy( self.size.x, min( h, self.size.y - y ) ),
+                    xy( offset.x, offset.y + y ),
+                    ink
+                )
+            y += h
 
     # =======================================================================
 
 
 # ===========================================================================
 
+@micropython.viper
+def _unpack_row_viper( source, target, unit: int ):
+    s = ptr8( source )
+    t = ptr8( target )
+    n = int( len( source ) )
+    m = int( len( target ) )
+    i = 0
+    j = 0
+    while i < n:
+        c = s[ i ]
+        i += 1
+        if c < 128:
+            k = ( c + 1 ) * unit
+            if ( i + k > n ) or ( j + k > m ):
+                raise ValueError( "packed row run" )
+            end = i + k
+            while i < end:
+                t[ j ] = s[ i ]
+                i += 1
+                j += 1
+        elif c > 128:
+            repeat = 257 - c
+            if ( i + unit > n ) or ( j + repeat * unit > m ):
+                raise ValueError( "packed row run" )
+            while repeat > 0:
+                k = 0
+                while k < unit:
+                    t[ j + k ] = s[ i + k ]
+                    k += 1
+                j += unit
+                repeat -= 1
+            i += unit
+    if j != m:
+        raise ValueError( "packed row length" )
+
+
+# ===========================================================================
+
+def _unpack_row_bulk(
+    source: memoryview,
+    target: bytearray,
+    unit: int
+) -> None:
+    i, j, n, m = 0, 0, len( source ), len( target )
+    while i < n:
+        c = source[ i ]
+        i += 1
+        if c < 128:
+            k = ( c + 1 ) * unit
+            if ( i + k > n ) or ( j + k > m ):
+                raise ValueError( "packed row run" )
+            target[ j : j + k ] = source[ i : i + k ]
+            i += k
+            j += k
+        elif c > 128:
+            if ( i + unit > n ) or ( j + ( 257 - c ) * unit > m ):
+                raise ValueError( "packed row run" )
+            for _ in range( 257 - c ):
+                for k in range( unit ):
+                    target[ j + k ] = source[ i + k ]
+                j += unit
+            i += unit
+    if j != m:
+        raise ValueError( "packed row length" )
+
+
+# ===========================================================================
+#
+# unpack a PackBits packed row of units of 1..3 bytes:
+# on MicroPython with a viper loop,
+# on CPython by copying the literal runs as slices.
+# A run that would read past the packed row or write past the
+# target row, or a row that doesn't fill the target, is a ValueError.
+#
+# ===========================================================================
+
+_unpack_row = _unpack_row_viper if running_micropython else _unpack_row_bulk
+
+
+# ===========================================================================
+
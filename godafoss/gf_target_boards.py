@@ -848,6 +848,26 @@ class board_lilygo_ttgo_t_dongle_s3:
                 
     # =======================================================================
         
+    def led_spi(
+        self,
+        baudrate = 4_000_000
+    ):
+        """
+        the (soft) SPI bus of the neopixel
+        """
+
+        import machine
+        return machine.SoftSPI(
+            baudrate = baudrate,
+            sck = machine.Pin( self.led_ci ),
+            mosi = machine.Pin( self.led_di ),
+
+            # dummy
+            miso = machine.Pin( 6 )
+        )
+
+    # =======================================================================
+
     def neopixel( self ):
         """
         the single neopixel
@@ -855,8 +875,7 @@ class board_lilygo_ttgo_t_dongle_s3:
         
         return apa102(
             n = 1, 
-            ci = self.led_ci,
-            di = self.led_di,
+            spi = self.led_spi()
         )
         
     # =======================================================================
@@ -185,6 +185,30 @@ class terminal:
 
     # =======================================================================
 
+    async def async_write(
+        self,
+        s: str
+    ) -> None:
+        """
+        write a string, letting other tasks run meanwhile
+
+        :param s: (str)
+            the string to be written
+
+        This is the asyncio version of write():
+        it awaits after each character, and a \\\\f is handled
+        by async_clear().
+        """
+
+        for c in s:
+            if ( c == '\f' ) and ( self._goto_state == 0 ):
+                await self.async_clear()
+            else:
+                self.write_char( c )
+                await asyncio.sleep( 0 )
+
+    # =======================================================================
+
     def clear(
         self,
         c: chr = ' '
@@ -207,6 +231,18 @@ class terminal:
 
     # =======================================================================
 
+    async def async_clear( self ) -> None:
+        """
+        clear the terminal, letting other tasks run meanwhile
+
+        The default implementation calls clear().
+        """
+
+        self.clear()
+        await asyncio.sleep( 0 )
+
+    # =======================================================================
+
 
 # ===========================================================================
 
@@ -11,6 +11,7 @@
 # ===========================================================================
 
 import sys
+import io
 from PIL import Image
 
 
@@ -21,10 +22,11 @@ def make_ggf(
     output_name, 
     depth, 
     x_size, 
-    y_size 
+    y_size,
+    packed = False
 ):
-    if not depth in [ 1, 8, 24 ]:
-        print( "depth must be 1, 8 or 24 (not %d)" % depth )
+    if not depth in [ 1, 8, 24, 16, "1v" ]:
+        print( "depth must be 1, 8, 24, 16 or 1v (not %s)" % depth )
         return
 
     im = Image.open( input_file )
@@ -41,6 +43,10 @@ def make_ggf(
         x_size, y_size = im.size
 
     im = im.resize( ( x_size, y_size ) )   
+    if depth in [ 8, 16, 24 ]:
+        im = im.convert( 'RGB' )
+    elif depth == "1v":
+        im = im.convert( 'L' ) # greyscale
     
     data = []
     if depth == 1:
@@ -82,9 +88,24 @@ def make_ggf(
         output_name += ".ggf"
     f = open( output_name, "wb" )
     f.write( bytes( [ 0xA6 ] ) )
-    f.write( bytes( [ { 1:0, 8:1, 24:2 }[ depth ] ] ) )
+    f.write( bytes( [ { 1:0, 8:1, 24:2, 16:3, "1v":4 }[ depth ] ] ) )
     f.write( bytes( [ x_size // 256, x_size % 256 ] ) )
     f.write( bytes( [ y_size // 256, y_size % 256 ] ) )
+
+    if depth == "1v":
+        # MONO_VLSB: pages of 8 rows, each byte is a column, LSB on top
+        for page in range( ( y_size + 7 ) // 8 ):
+            for x in range( x_size ):
+                v = 0
+                for y in range( 8 * page, min( 8 * page + 8, y_size ) ):
+                    if im.getpixel( ( x, y ) ) > 127:
+                        v |= 1 << ( y % 8 )
+                f.write( bytes( [ v ] ) )
+        f.close()
+        if packed:
+            pack_ggf( output_name )
+        return
+
     v = 0
     m = 1
     for y in range( y_size ):
@@ -106,10 +127,120 @@ def make_ggf(
                 rgb = ( r << 5 ) | ( g << 2 ) | ( b << 0 )
                 f.write( bytes( [ rgb ] ) )
                 
+            elif depth == 16:
+                # RGB565, high byte first: the color lcd format
+                rgb = ( ( p[ 0 ] >> 3 ) << 11 ) \
+                    | ( ( p[ 1 ] >> 2 ) << 5 ) | ( p[ 2 ] >> 3 )
+                f.write( bytes( [ rgb >> 8, rgb & 0xFF ] ) )
+
             else:
                 f.write( bytes( p ) )          
         
     f.close()
+    if packed:
+        pack_ggf( output_name )
+
+# ===========================================================================
+
+def row_size( depth, x_size, y_size ):
+    """
+    the number of bytes in a row, and the number of rows
+    """
+
+    if depth == 4:
+        return x_size, ( y_size + 7 ) // 8
+    return ( ( x_size + 7 ) // 8, x_size, 3 * x_size, 2 * x_size )[ depth ], \
+        y_size
+
+# ===========================================================================
+
+def pack_row( row, unit ):
+    """
+    PackBits encoding of a row, in units of unit bytes
+    """
+
+    units = [ row[ i : i + unit ] for i in range( 0, len( row ), unit ) ]
+    result = bytearray()
+    literal = []
+
+    def flush():
+        if literal:
+            result.append( len( literal ) - 1 )
+            for u in literal:
+                result.extend( u )
+            literal.clear()
+
+    i = 0
+    while i < len( units ):
+        n = 1
+        while (
+            ( i + n < len( units ) )
+            and ( n < 128 )
+            and ( units[ i + n ] == units[ i ] )
+        ):
+            n += 1
+
+        # a run of 2 single bytes is cheaper as a literal
+        if n >= ( 3 if unit == 1 else 2 ):
+            flush()
+            result.append( 257 - n )
+            result.extend( units[ i ] )
+            i += n
+        else:
+            literal.append( units[ i ] )
+            if len( literal ) == 128:
+                flush()
+            i += 1
+
+    flush()
+    return result
+
+# ===========================================================================
+
+def pack_ggf( file_name ):
+    """
+    replace a ggf file by its packed version
+    """
+
+    data = open( file_name, "rb" ).read()
+    depth = data[ 1 ]
+    x_size = data[ 2 ] * 256 + data[ 3 ]
+    y_size = data[ 4 ] * 256 + data[ 5 ]
+    size, rows = row_size( depth, x_size, y_size )
+    unit = ( 1, 1, 3, 2, 1 )[ depth ]
+
+    f = open( file_name, "wb" )
+    f.write( bytes( [ 0xA6, depth | 0x80 ] ) + data[ 2 : 6 ] )
+    for y in range( rows ):
+        packed = pack_row( data[ 6 + y * size : 6 + ( y + 1 ) * size ], unit )
+        f.write( bytes( [ len( packed ) >> 8, len( packed ) & 0xFF ] ) )
+        f.write( packed )
+    f.close()
+
+# ===========================================================================
+
+def unpack_rows( f, depth, x_size, y_size ):
+    """
+    a file-like object with the unpacked rows of a packed ggf file
+    """
+
+    size, rows = row_size( depth, x_size, y_size )
+    unit = ( 1, 1, 3, 2, 1 )[ depth ]
+    result = bytearray()
+    for y in range( rows ):
+        s = f.read( 2 )
+        data = f.read( s[ 0 ] * 256 + s[ 1 ] )
+        i = 0
+        while i < len( data ):
+            c = data[ i ]
+            i += 1
+            if c < 128:
+                result.extend( data[ i : i + ( c + 1 ) * unit ] )
+                i += ( c + 1 ) * unit
+            elif c > 128:
+                result.extend( ( 257 - c ) * data[ i : i + unit ] )
+                i += unit
+    return io.BytesIO( result )
     
 # ===========================================================================
 
@@ -125,8 +256,10 @@ def show_ggf( file_name ):
         return
         
     depth = f.read( 1 )[ 0 ]    
-    if not depth in [ 0, 1, 2 ]:
-        print( "file %s depth byte %d, should be 0,1,2" 
+    packed = ( depth & 0x80 ) != 0
+    depth &= 0x7F
+    if not depth in [ 0, 1, 2, 3, 4 ]:
+        print( "file %s depth byte %d, should be 0,1,2,3,4"
             % ( file_name, depth ) )
         return    
         
@@ -135,8 +268,22 @@ def show_ggf( file_name ):
     s = f.read( 2 )
     y_size = s[ 0 ] * 256 + s[ 1 ]
     
-    print( "size (%d,%d) format %d" % ( x_size, y_size, depth ) )
+    print( "size (%d,%d) format %d%s"
+        % ( x_size, y_size, depth, " packed" if packed else "" ) )
+    if packed:
+        f = unpack_rows( f, depth, x_size, y_size )
     img = Image.new( 'RGB', (x_size, y_size), color = 'red' )
+
+    if depth == 4:
+        data = f.read()
+        for y in range( y_size ):
+            for x in range( x_size ):
+                v = data[ x + ( y // 8 ) * x_size ]
+                c = 0xFF if v & ( 1 << ( y % 8 ) ) else 0x00
+                img.putpixel( ( x, y ), ( c, c, c ) )
+        img.show()
+        f.close()
+        return
     
     for y in range( y_size ):
         for x in range( x_size ):
@@ -153,6 +300,12 @@ def show_ggf( file_name ):
                 g = ( c >> 2 ) & 0x07
                 b = ( c >> 0 ) & 0x03
                 img.putpixel( ( x, y ), ( r << 5, g << 5, b << 6 ) )
+
+            elif depth == 3:
+                d = f.read( 2 )
+                c = ( d[ 0 ] << 8 ) | d[ 1 ]
+                img.putpixel( ( x, y ), (
+                    ( c >> 8 ) & 0xF8, ( c >> 3 ) & 0xFC, ( c << 3 ) & 0xF8 ) )
                 
             else:
                 c = tuple( f.read( 3 ) )
@@ -178,7 +331,10 @@ def run( args ):
         print( "" )
         print( "input_file:  image file, must be acceptable to PIL.Image.open()" )
         print( "output:      output file name (.ggf will be appended)" )
-        print( "depth:       color depth in bits, must be 1, 8 or 24. default is 24" )
+        print( "depth:       color depth in bits, must be 1, 8, 16 or 24. default is 24" )
+        print( "             16 is RGB565 high byte first (the color lcd format)," )
+        print( "             1v is 1 bit in MONO_VLSB pages (the oled format)." )
+        print( "             append p (for instance 16p) for a run-length packed file." )
         print( "x_size:      x_size of the written image. default: taken from input." )
         print( "y_size:      y_size of the written image. default: taken from input." )
         print( " " )
@@ -190,12 +346,17 @@ def run( args ):
         show_ggf( args[ 1 ] )
         
     else:           
+        depth = args[ 3 ] if len( args ) > 3 else "24"
+        packed = depth.endswith( "p" )
+        if packed:
+            depth = depth[ : -1 ]
         make_ggf( 
             args[ 1 ], 
             args[ 2 ], 
-            int( args[ 3 ] ) if len( args ) > 3 else 24,
+            depth if depth == "1v" else int( depth ),
             int( args[ 4 ] ) if len( args ) > 4 else 0,
-            int( args[ 5 ] ) if len( args ) > 5 else 0
+            int( args[ 5 ] ) if len( args ) > 5 else 0,
+            packed = packed
         )        
 
 # ===========================================================================
@@ -0,0 +1,45 @@
+# ===========================================================================
+#
+# file     : test_ggf.py
+# part of  : godafoss micropython library
+# url      : https://www.github.com/wovo/godafoss
+# author   : Wouter van Ooijen (wouter@voti.nl) 2024
+# license  : MIT license, see license attribute (godafoss.license)
+#
+# ===========================================================================
+#
+# Test of the ggf command line tool (requires PIL).
+#
+# ===========================================================================
+
+import os
+
+from PIL import Image
+
+import ggf
+
+
+# ===========================================================================
+
+def unit_test_ggf_tool():
+    print( "test ggf tool" )
+
+    image = Image.new( "RGB", ( 8, 2 ), ( 0xFF, 0x00, 0x00 ) )
+    image.save( "test_ggf.png" )
+
+    # the p suffix of the depth writes a packed file
+    for depth, header in ( ( "16", 3 ), ( "16p", 0x83 ), ( "1vp", 0x84 ) ):
+        ggf.run( [ "ggf", "test_ggf.png", "test_ggf", depth ] )
+        data = open( "test_ggf.ggf", "rb" ).read()
+        assert data[ : 6 ] == bytes( [ 0xA6, header, 0, 8, 0, 2 ] )
+
+    os.remove( "test_ggf.png" )
+    os.remove( "test_ggf.ggf" )
+
+
+# ===========================================================================
+
+if __name__ == "__main__":
+    unit_test_ggf_tool()
+
+# ===========================================================================
@@ -15,3 +15,14 @@ from .unit_test_pins import *
 from .unit_test_ports import *
 from .unit_test_terminal import *
 from .unit_test_canvas import *
+from .unit_test_pixel_formats import *
+from .unit_test_fonts import *
+from .unit_test_ggf import *
+from .unit_test_generic_color_lcd import *
+from .unit_test_ssd1306 import *
+from .unit_test_uc8151 import *
+from .unit_test_sx127x import *
+from .unit_test_async import *
+from .unit_test_matrix_layout import *
+from .unit_test_rp2 import *
+from .benchmarks import *
@@ -0,0 +1,202 @@
+# ===========================================================================
+#
+# file     : benchmarks.py
+# part of  : godafoss micropython library
+# url      : https://www.github.com/wovo/godafoss
+# author   : Wouter van Ooijen (wouter@voti.nl) 2024
+# license  : MIT license, see license attribute (godafoss.license)
+#
+# ===========================================================================
+#
+# Micro-benchmarks of the library hot paths.
+# They print timings instead of checking results,
+# so they are not part of run_tests().
+#
+# ===========================================================================
+
+import godafoss as gf
+
+
+# ===========================================================================
+
+def _time_us( f, n: int ) -> int:
+    """
+    the time of n calls of f, in microseconds
+    """
+
+    before = gf.time_us()
+    for _ in range( n ):
+        f()
+    return gf.time_us() - before
+
+
+# ===========================================================================
+
+def _report(
+    name: str,
+    normal_us: int,
+    fast_us: int,
+    n: int
+) -> None:
+    print( "%-28s %7.2f us  %7.2f us  x %.1f" % (
+        name,
+        normal_us / n,
+        fast_us / n,
+        normal_us / max( fast_us, 1 )
+    ) )
+
+
+# ===========================================================================
+
+def benchmark_xy( n: int = 2_000 ) -> None:
+    """
+    xy and color construction: normal versus trusted constructor
+    """
+
+    print( "%-28s %10s  %10s" % ( "benchmark xy", "normal", "fast" ) )
+
+    _report(
+        "xy( x, y )",
+        _time_us( lambda: gf.xy( 3, 4 ), n ),
+        _time_us( lambda: gf.xy._fast( 3, 4 ), n ),
+        n
+    )
+
+    _report(
+        "color( r, g, b )",
+        _time_us( lambda: gf.color( 3, 4, 5 ), n ),
+        _time_us( lambda: gf.color._fast( 3, 4, 5 ), n ),
+        n
+    )
+
+    # a pixel write, including the creation of its location
+    canvas = gf.canvas_dummy( gf.xy( 16, 16 ) )
+    _report(
+        "write_pixel( xy( x, y ) )",
+        _time_us( lambda: canvas.write_pixel( gf.xy( 3, 4 ) ), n ),
+        _time_us( lambda: canvas.write_pixel( gf.xy._fast( 3, 4 ) ), n ),
+        n
+    )
+
+
+# ===========================================================================
+
+def benchmark_write_pixel( n: int = 2_000 ) -> None:
+    """
+    pixel writes: xy location versus integer coordinates
+    """
+
+    print( "%-28s %10s  %10s" % ( "benchmark write_pixel", "xy", "x, y" ) )
+
+    canvas = gf.canvas_dummy( gf.xy( 16, 16 ) )
+    _report(
+        "canvas",
+        _time_us( lambda: canvas.write_pixel( gf.xy( 3, 4 ) ), n ),
+        _time_us( lambda: canvas.write_pixel_xy( 3, 4 ), n ),
+        n
+    )
+
+    c = canvas.rotated( 90 ).part( gf.xy( 2, 2 ), gf.xy( 8, 8 ) )
+    _report(
+        "rotated( 90 ).part()",
+        _time_us( lambda: c.write_pixel( gf.xy( 3, 4 ) ), n ),
+        _time_us( lambda: c.write_pixel_xy( 3, 4 ), n ),
+        n
+    )
+
+
+# ===========================================================================
+
+class _rgb565_canvas( gf.canvas_dummy ):
+    """
+    canvas that encodes its inks like an rgb565 lcd
+    """
+
+    def _encode( self, ink ):
+        return (
+            ( ( ink.red & 0xF8 ) << 8 )
+            | ( ( ink.green & 0xFC ) << 3 )
+            | ( ink.blue >> 3 )
+        )
+
+
+# ===========================================================================
+
+def benchmark_native_ink( n: int = 2_000 ) -> None:
+    """
+    ink encoding: every time versus memoized
+    """
+
+    print( "%-28s %10s  %10s" % ( "benchmark ink", "encode", "memoized" ) )
+
+    canvas = _rgb565_canvas( gf.xy( 16, 16 ) )
+    ink = gf.colors.red
+    _report(
+        "encode one ink",
+        _time_us( lambda: canvas._encode( ink ), n ),
+        _time_us( lambda: canvas._native_ink( ink ), n ),
+        n
+    )
+
+
+# ===========================================================================
+
+def _rgb888_to_rgb565_per_pixel( source, target, n ):
+    """
+    rgb888 to rgb565 conversion, one pixel at a time
+    """
+
+    j = 0
+    for i in range( 0, 3 * n, 3 ):
+        g = source[ i + 1 ]
+        target[ j ] = ( source[ i ] & 0xF8 ) | ( g >> 5 )
+        target[ j + 1 ] = ( ( g << 3 ) & 0xE0 ) | ( source[ i + 2 ] >> 3 )
+        j += 2
+
+
+# ===========================================================================
+
+def benchmark_pixel_formats( n: int = 20 ) -> None:
+    """
+    pixel format conversion of a row of 128 pixels:
+    per pixel versus the bulk conversions
+    """
+
+    print( "%-28s %10s  %10s" % (
+        "benchmark 128 pixels", "per pixel", "bulk" ) )
+
+    source = bytearray( v & 0xFF for v in range( 3 * 128 ) )
+    target = bytearray( 3 * 128 )
+    _report(
+        "rgb888 to rgb565",
+        _time_us(
+            lambda: _rgb888_to_rgb565_per_pixel( source, target, 128 ), n ),
+        _time_us(
+            lambda: gf.rgb888_to_rgb565( source, target, 128 ), n ),
+        n
+    )
+
+    def rgb888_to_grb_per_pixel():
+        for i in range( 0, 3 * 128, 3 ):
+            target[ i ] = source[ i + 1 ]
+            target[ i + 1 ] = source[ i ]
+            target[ i + 2 ] = source[ i + 2 ]
+
+    _report(
+        "rgb888 to grb",
+        _time_us( rgb888_to_grb_per_pixel, n ),
+        _time_us( lambda: gf.rgb888_to_grb( source, target, 128 ), n ),
+        n
+    )
+
+
+# ===========================================================================
+
+def run_benchmarks() -> None:
+    benchmark_xy()
+    benchmark_write_pixel()
+    benchmark_native_ink()
+    benchmark_pixel_formats()
+
+
+# ===========================================================================
@@ -0,0 +1,155 @@
+# ===========================================================================
+#
+# file     : framebuf_double.py
+# part of  : godafoss micropython library
+# url      : https://www.github.com/wovo/godafoss
+# author   : Wouter van Ooijen (wouter@voti.nl) 2024
+# license  : MIT license, see license attribute (godafoss.license)
+#
+# ===========================================================================
+#
+# A pure Python double of the MicroPython framebuf module,
+# for the tests of the canvases that store their pixels in a framebuf.
+#
+# Only the formats and the methods that godafoss uses are implemented.
+# Like the real module, rgb565 values are stored low byte first.
+#
+# ===========================================================================
+
+import sys
+
+import godafoss as gf
+
+MONO_VLSB = 0
+RGB565 = 1
+MONO_HLSB = 3
+MONO_HMSB = 4
+
+
+# ===========================================================================
+
+class FrameBuffer:
+    """
+    pure Python double of framebuf.FrameBuffer
+    """
+
+    def __init__( self, buffer, width, height, format, stride = None ):
+        if format not in ( MONO_VLSB, RGB565, MONO_HLSB, MONO_HMSB ):
+            raise ValueError( "framebuf format %d" % format )
+        self.buffer = buffer
+        self.width = width
+        self.height = height
+        self.format = format
+        self.stride = width if stride is None else stride
+        if format in ( MONO_HLSB, MONO_HMSB ):
+            self.stride = ( self.stride + 7 ) & ~ 7
+
+    # =======================================================================
+
+    def _get( self, x, y ):
+        if self.format == MONO_VLSB:
+            byte = self.buffer[ ( y >> 3 ) * self.stride + x ]
+            return ( byte >> ( y & 7 ) ) & 0x01
+        elif self.format == MONO_HLSB:
+            byte = self.buffer[ ( y * self.stride + x ) >> 3 ]
+            return ( byte >> ( 7 - ( x & 7 ) ) ) & 0x01
+        elif self.format == MONO_HMSB:
+            byte = self.buffer[ ( y * self.stride + x ) >> 3 ]
+            return ( byte >> ( x & 7 ) ) & 0x01
+        else:
+            i = 2 * ( y * self.stride + x )
+            return self.buffer[ i ] | ( self.buffer[ i + 1 ] << 8 )
+
+    # =======================================================================
+
+    def _set( self, x, y, c ):
+        if self.format == MONO_VLSB:
+            i = ( y >> 3 ) * self.stride + x
+            mask = 0x01 << ( y & 7 )
+        elif self.format == MONO_HLSB:
+            i = ( y * self.stride + x ) >> 3
+            mask = 0x80 >> ( x & 7 )
+        elif self.format == MONO_HMSB:
+            i = ( y * self.stride + x ) >> 3
+            mask = 0x01 << ( x & 7 )
+        else:
+            i = 2 * ( y * self.stride + x )
+            self.buffer[ i ] = c & 0xFF
+            self.buffer[ i + 1 ] = ( c >> 8 ) & 0xFF
+            return
+        if c & 0x01:
+            self.buffer[ i ] |= mask
+        else:
+            self.buffer[ i ] &= ~ mask & 0xFF
+
+    # =======================================================================
+
+    def pixel( self, x, y, c = None ):
+        if ( 0 <= x < self.width ) and ( 0 <= y < self.height ):
+            if c is None:
+                return self._get( x, y )
+            self._set( x, y, c )
+
+    def fill_rect( self, x, y, w, h, c ):
+        for j in range( max( y, 0 ), min( y + h, self.height ) ):
+            for i in range( max( x, 0 ), min( x + w, self.width ) ):
+                self._set( i, j, c )
+
+    def fill( self, c ):
+        self.fill_rect( 0, 0, self.width, self.height, c )
+
+    def hline( self, x, y, w, c ):
+        self.fill_rect( x, y, w, 1, c )
+
+    def vline( self, x, y, h, c ):
+        self.fill_rect( x, y, 1, h, c )
+
+    # =======================================================================
+
+    def blit( self, source, x, y, key = -1, palette = None ):
+        for j in range( max( 0, - y ), source.height ):
+            if y + j >= self.height:
+                break
+            for i in range( max( 0, - x ), source.width ):
+                if x + i >= self.width:
+                    break
+                c = source._get( i, j )
+                if palette is not None:
+                    c = palette._get( c, 0 )
+                if c != key:
+                    self._set( x + i, y + j, c )
+
+    # =======================================================================
+
+    def text( self, s, x, y, c = 1 ):
+        # the font that godafoss includes for CPython, rows LSB first
+        for n, char in enumerate( s ):
+            rows = gf.gf_fonts._pixels[ ord( char ) & 0x7F ]
+            for j, row in enumerate( rows ):
+                for i in range( 8 ):
+                    if row & ( 0x01 << i ):
+                        self.pixel( x + 8 * n + i, y + j, c )
+
+
+# ===========================================================================
+
+def framebuf_double_install() -> None:
+    """
+    use this double as framebuf when there is no framebuf module
+
+    Each godafoss module has its own (star-imported) framebuf name,
+    so the double is installed in all loaded godafoss modules.
+    """
+
+    if gf.framebuf is not None:
+        return
+    double = sys.modules[ __name__ ]
+    for name, module in list( sys.modules.items() ):
+        if (
+            name.startswith( "godafoss" )
+            and ( getattr( module, "framebuf", double ) is None )
+        ):
+            module.framebuf = double
+
+
+# ===========================================================================
@@ -53,6 +53,16 @@ def run_tests( name: str = None ):
     gf.tests.unit_test_ports()
     gf.tests.unit_test_terminal()
     gf.tests.unit_test_canvas()
+    gf.tests.unit_test_pixel_formats()
+    gf.tests.unit_test_fonts()
+    gf.tests.unit_test_ggf()
+    gf.tests.unit_test_generic_color_lcd()
+    gf.tests.unit_test_ssd1306()
+    gf.tests.unit_test_uc8151()
+    gf.tests.unit_test_sx127x()
+    gf.tests.unit_test_async()
+    gf.tests.unit_test_matrix_layout()
+    gf.tests.unit_test_rp2()
 
 
 # ===========================================================================
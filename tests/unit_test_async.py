@@ -0,0 +1,152 @@
+# ===========================================================================
+#
+# file     : unit_test_async.py
+# part of  : godafoss micropython library
+# url      : https://www.github.com/wovo/godafoss
+# author   : Wouter van Ooijen (wouter@voti.nl) 2024
+# license  : MIT license, see license attribute (godafoss.license)
+#
+# ===========================================================================
+
+import godafoss as gf
+
+from .framebuf_double import framebuf_double_install
+
+
+# ===========================================================================
+
+class _spi_chunks:
+    """
+    spi mock that records the written data
+    """
+
+    def __init__( self ):
+        self.log = []
+
+    def write( self, data ):
+        self.log.append( bytes( data ) )
+
+
+# ===========================================================================
+
+def _ramwr_data( log: list ) -> list:
+    """
+    the data written after each RAMWR command
+    """
+
+    return [
+        log[ i + 1 ]
+            for i, data in enumerate( log )
+                if data == bytes( [ 0x2C ] )
+    ]
+
+
+# ===========================================================================
+
+async def _count_until_done( counter: list, task ):
+    """
+    count the scheduler rounds until the task is done
+    """
+
+    while not task.done():
+        counter[ 0 ] += 1
+        await gf.asyncio.sleep( 0 )
+
+
+# ===========================================================================
+
+def unit_test_async():
+    print( "test async" )
+
+    if gf.asyncio is None:
+        return
+    asyncio = gf.asyncio
+
+    # an async flush of a canvas only flushes when something was written
+    canvas = gf.canvas_dummy( gf.xy( 4, 2 ) )
+    canvas.flush()
+    canvas.flush_count = 0
+    asyncio.run( canvas.async_flush() )
+    assert canvas.flush_count == 0
+    canvas.write_pixel_xy( 1, 1 )
+    asyncio.run( canvas.async_flush() )
+    assert canvas.flush_count == 1
+    asyncio.run( canvas.part( gf.xy( 1, 0 ), gf.xy( 2, 2 ) ).async_flush(
+        forced = True ) )
+    assert canvas.flush_count == 2
+
+    # the requests during a frame are combined into one flush
+    async def paced():
+        pacer = gf.frame_pacer( canvas, frame_us = 10_000 )
+        task = asyncio.create_task( pacer.run( 2 ) )
+        for frame in range( 2 ):
+            for x in range( 3 ):
+                canvas.write_pixel_xy( x, frame )
+                pacer.request()
+            await asyncio.sleep( 0 )
+        await task
+        return pacer.frames
+
+    canvas.flush_count = 0
+    assert asyncio.run( paced() ) == 2
+    assert canvas.flush_count == 2
+
+    # an async write gives the same result as a write
+    async_terminal = gf.terminal_dummy( gf.xy( 4, 2 ) )
+    terminal = gf.terminal_dummy( gf.xy( 4, 2 ) )
+    for s in ( "ab\ncd", "\t0101x\rz" ):
+        asyncio.run( async_terminal.async_write( s ) )
+        terminal.write( s )
+        assert async_terminal.lines() == terminal.lines()
+
+    # the lcd buffer requires a framebuf implementation
+    framebuf_double_install()
+
+    # an async lcd flush transfers the buffer in chunks,
+    # and other tasks run between the chunks
+    for double_buffered in ( False, True ):
+        spi = _spi_chunks()
+        lcd = gf.generic_color_lcd(
+            gf.xy( 8, 4 ),
+            spi,
+            data_command = gf.pin_out( None ),
+            chip_select = gf.pin_out( None ),
+            double_buffered = double_buffered,
+            chunk_size = 16
+        )
+        lcd.write_pixel_xy( 0, 0, gf.colors.red )
+
+        async def flush():
+            counter = [ 0 ]
+            task = asyncio.create_task( lcd.async_flush() )
+            await _count_until_done( counter, task )
+            return counter[ 0 ]
+
+        spi.log = []
+        assert asyncio.run( flush() ) >= 4
+        assert _ramwr_data( spi.log ) == [
+            bytes( [ 0xF8, 0x00 ] ) + bytes( 14 ) ] + 3 * [ bytes( 16 ) ]
+        assert lcd.flush_done()
+
+        # a flush during an async flush first completes its transfer
+        lcd.write_pixel_xy( 0, 0, gf.colors.blue )
+        lcd.write_pixel_xy( 7, 3, gf.colors.blue )
+
+        async def interrupted():
+            task = asyncio.create_task( lcd.async_flush() )
+            await asyncio.sleep( 0 )
+            assert 0 < len( _ramwr_data( spi.log ) ) < 4
+            lcd.flush( forced = True )
+            await task
+
+        spi.log = []
+        asyncio.run( interrupted() )
+        blue = bytes( [ 0x00, 0x1F ] )
+        frame = blue + bytes( 60 ) + blue
+        data = _ramwr_data( spi.log )
+        assert b"".join( data[ : 4 ] ) == frame
+        assert b"".join( data[ 4 : ] ) == frame
+        assert lcd.flush_done()
+
+
+# ===========================================================================
@@ -33,5 +33,21 @@ def unit_test_basics():
 
     # make_tuple
 
+    # on CPython the native and viper decorators leave a function as is,
+    # and the viper casts index the bytes of a buffer
+    if not gf.running_micropython:
+        f = lambda: 42
+        assert gf.micropython.native( f ) is f
+        assert gf.micropython.viper( f ) is f
+        data = bytearray( [ 1, 2, 3, 4 ] )
+        gf.ptr8( data )[ 1 ] = 7
+        assert data[ 1 ] == 7
+        assert len( gf.ptr16( data ) ) == 2
+        assert len( gf.ptr32( data ) ) == 1
+
+    start = gf.time_us()
+    assert gf.ticks_diff_us( gf.time_us(), start ) >= 0
+    assert gf.ticks_diff_us( start, start ) == 0
+
 
 # ===========================================================================
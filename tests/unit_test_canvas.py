@@ -96,6 +96,88 @@ def unit_test_canvas():
         "..............***.......***.............",
     ]
 
+    canvas.clear()
+    canvas.fill_span( gf.xy( -3, 0 ), 6 )
+    canvas.fill_span( gf.xy( 36, 1 ), 10 )
+    canvas.fill_span( gf.xy( 2, 8 ), 5, vertical = True )
+    canvas.fill_span( gf.xy( 5, 2 ), 0 )
+    canvas.fill_span( gf.xy( 5, 3 ), 4, None )
+    canvas.fill_rect( gf.xy( 6, 2 ), gf.xy( 4, 3 ) )
+    canvas.fill_rect( gf.xy( 38, 8 ), gf.xy( 5, 5 ) )
+    canvas.fill_rect( gf.xy( 20, 20 ), gf.xy( 5, 5 ) )
+    canvas.write( gf.line( gf.xy( -4, 0 ) ), gf.xy( 20, 6 ) )
+    canvas.write( gf.line( gf.xy( 0, -3 ) ), gf.xy( 30, 7 ) )
+    #print( canvas )
+    assert canvas.lines() == [
+        "***.....................................",
+        "....................................****",
+        "......****..............................",
+        "......****..............................",
+        "......****..............................",
+        "..............................*.........",
+        ".................****.........*.........",
+        "..............................*.........",
+        "..*...................................**",
+        "..*...................................**",
+    ]
+
+    # the same image in each monochrome format
+    image = [
+        "*.**.....*",
+        "**********",
+        ".*.......*",
+    ]
+    size = gf.xy( 10, 3 )
+    vlsb = bytearray( 10 )
+    hlsb = bytearray( 2 * 3 )
+    hmsb = bytearray( 2 * 3 )
+    for y, line in enumerate( image ):
+        for x, c in enumerate( line ):
+            if c == "*":
+                vlsb[ x ] |= 0x01 << y
+                hlsb[ 2 * y + x // 8 ] |= 0x80 >> ( x % 8 )
+                hmsb[ 2 * y + x // 8 ] |= 0x01 << ( x % 8 )
+    for data, format in (
+        ( vlsb, gf.pixel_format.mono_vlsb ),
+        ( hlsb, gf.pixel_format.mono_hlsb ),
+        ( hmsb, gf.pixel_format.mono_hmsb ),
+    ):
+        canvas.clear()
+        canvas.blit( data, format, size, gf.xy( -1, 8 ) )
+        canvas.blit( data, format, size, gf.xy( 20, 4 ), None )
+        assert canvas.lines()[ 4 : ] == [
+            "........................................",
+            "........................................",
+            "........................................",
+            "........................................",
+            ".**.....*...............................",
+            "*********...............................",
+        ]
+
+    # color pixels are written, except for the key color
+    data = bytearray( [
+        0x00, 0x00, 0x00,  0xFF, 0xFF, 0xFF,  0x00, 0x00, 0x00
+    ] )
+    canvas.clear()
+    canvas.fill_rect( gf.xy( 0, 0 ), gf.xy( 3, 2 ) )
+    canvas.blit( data, gf.pixel_format.rgb888, gf.xy( 3, 1 ) )
+    canvas.blit(
+        data, gf.pixel_format.rgb888, gf.xy( 3, 1 ), gf.xy( 0, 1 ),
+        key = 0xFFFFFF )
+    assert canvas.lines()[ 0 : 2 ] == [
+        "*.*.....................................",
+        "***.....................................",
+    ]
+
+    # color data can't be written to a monochrome canvas
+    mono = gf.canvas_dummy( gf.xy( 4, 4 ), False, False,
+        { False: ".", True: "*" } )
+    try:
+        mono.blit( data, gf.pixel_format.rgb888, gf.xy( 3, 1 ) )
+        assert False
+    except ValueError:
+        pass
+
     canvas.clear()
     #canvas.write( "Hi", gf.xy(  2,  2 ) )
     #print( canvas )
@@ -232,5 +314,84 @@ def unit_test_canvas():
     except:
         pass
 
+    canvas = gf.canvas_dummy( gf.xy( 6, 4 ) )
+    canvas.clear()
+    canvas.flush()
+    canvas.write_pixel_xy( 1, 2 )
+    canvas.write_pixel_xy( 6, 0 )
+    canvas.write_pixel_xy( 0, -1 )
+    canvas.write_pixel_xy( 2, 2, None )
+    assert ( canvas._dirty_x0, canvas._dirty_y0 ) == ( 1, 2 )
+    assert ( canvas._dirty_x1, canvas._dirty_y1 ) == ( 2, 3 )
+    c = canvas.part( gf.xy( 1, 1 ), gf.xy( 4, 2 ) ).rotated( 90 ).inverted()
+    c.clear()
+    c.write_pixel_xy( 1, 0 )
+    c.write_pixel_xy( 0, 3 )
+    c.write_pixel_xy( 2, 0 )
+    #print( canvas )
+    assert canvas.lines() == [
+        "......",
+        "..***.",
+        ".***..",
+        "......",
+    ]
+    canvas.flush()
+    c.write_pixel_xy( 0, 0 )
+    assert ( canvas._dirty_x0, canvas._dirty_y0 ) == ( 4, 1 )
+    assert ( canvas._dirty_x1, canvas._dirty_y1 ) == ( 5, 2 )
+
+    canvas = gf.canvas_dummy( gf.xy( 6, 4 ) )
+    canvas.clear()
+    v = canvas.rotated( 90 ).part( gf.xy( 1, 1 ), gf.xy( 2, 3 ) )
+    assert v._base is canvas
+    assert v.size == gf.xy( 2, 3 )
+    v.fill_rect( gf.xy( 0, 0 ), gf.xy( 5, 5 ) )
+    #print( canvas )
+    assert canvas.lines() == [
+        "......",
+        "..***.",
+        "..***.",
+        "......",
+    ]
+    w = v.part( gf.xy( 1, 0 ), gf.xy( 4, 4 ) )
+    assert w._base is canvas
+    w.fill_rect( gf.xy( 0, 0 ), gf.xy( 4, 4 ), False )
+    w.fill_span( gf.xy( 0, 1 ), 4, False, vertical = True )
+    v.inverted().write_pixel_xy( 1, 0, False )
+    #print( canvas )
+    assert canvas.lines() == [
+        "......",
+        "..***.",
+        "....*.",
+        "......",
+    ]
+
+    canvas = gf.canvas_dummy( gf.xy( 6, 3 ) )
+    canvas.clear()
+    p = canvas.part( gf.xy( 1, 1 ), gf.xy( 3, 1 ) )
+    p.blit(
+        bytearray( [ 0b1011_0000 ] ),
+        gf.pixel_format.mono_hlsb,
+        gf.xy( 4, 1 )
+    )
+    p.blit(
+        bytearray( [ 0b1000_0000 ] ),
+        gf.pixel_format.mono_hlsb,
+        gf.xy( 2, 1 ),
+        gf.xy( 1, 0 )
+    )
+    #print( canvas )
+    assert canvas.lines() == [
+        "......",
+        ".***..",
+        "......",
+    ]
+
+    # the memoized native inks are bounded
+    for n in range( 40 ):
+        ink = gf.color( n, 0, 0 )
+        assert canvas._native_ink( ink ) is ink
+        assert len( canvas._native_inks ) <= 16
+
 
 # ===========================================================================
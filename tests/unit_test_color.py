@@ -90,5 +90,15 @@ def unit_test_color():
     assert gf.color( 10, 11, 12 ).inverted() == gf.color( 245, 244, 243 )
     assert - gf.colors.white == gf.colors.black
 
+    # the trusted constructor creates the same (immutable) value
+    c = gf.color._fast( 10, 0, 255 )
+    assert c == gf.color( 10, 0, 255 )
+    assert hash( c ) == hash( gf.color( 10, 0, 255 ) )
+    try:
+        c.red = 5
+        assert False
+    except:
+        pass
+
 
 # ===========================================================================
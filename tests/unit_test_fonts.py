@@ -0,0 +1,74 @@
+# ===========================================================================
+#
+# file     : unit_test_fonts.py
+# part of  : godafoss micropython library
+# url      : https://www.github.com/wovo/godafoss
+# author   : Wouter van Ooijen (wouter@voti.nl) 2024
+# license  : MIT license, see license attribute (godafoss.license)
+#
+# ===========================================================================
+
+import godafoss as gf
+
+
+# ===========================================================================
+
+class _counting_font( gf.font ):
+    """
+    font that counts how often a glyph is read from it
+    """
+
+    def __init__( self ):
+        gf.font.__init__( self, gf.xy( 8, 8 ) )
+        self.reads = 0
+
+    def _read_implementation( self, c ):
+        self.reads += 1
+        return gf.font_default().read( c )
+
+
+# ===========================================================================
+
+def unit_test_fonts():
+    print( "test fonts" )
+
+    # all default fonts share their glyphs
+    a = gf.font_default().read( "A" )
+    assert a.size == gf.xy( 8, 8 )
+    assert gf.font_default().read( "A" ) is a
+
+    # a glyph is read from the font only when it is not in the cache
+    gf.glyph_cache.default.clear()
+    f = _counting_font()
+    t = gf.text( "abba\nab", f )
+    assert f.reads == 2
+    assert t.size == gf.xy( 32, 16 )
+    canvas = gf.canvas_dummy( gf.xy( 40, 20 ) )
+    canvas.clear()
+    canvas.write( t, gf.xy( 1, 2 ) )
+    assert f.reads == 2
+
+    # the text is written as its glyphs
+    lines = canvas.lines()
+    b = f.read( "b" )
+    for x in range( 8 ):
+        for y in range( 8 ):
+            pixel = "*" if b.read( gf.xy( x, y ) ) else "."
+            assert lines[ 2 + y ][ 1 + 8 + x ] == pixel
+            assert lines[ 2 + 8 + y ][ 1 + 8 + x ] == pixel
+
+    # the least recently used glyph is dropped
+    cache = gf.glyph_cache( 2 )
+    f.reads = 0
+    cache.read( f, "x" )
+    cache.read( f, "y" )
+    cache.read( f, "x" )
+    assert f.reads == 2
+    cache.read( f, "z" )
+    cache.read( f, "x" )
+    assert f.reads == 3
+    cache.read( f, "y" )
+    assert f.reads == 4
+
+
+# ===========================================================================
@@ -0,0 +1,256 @@
+# ===========================================================================
+#
+# file     : unit_test_generic_color_lcd.py
+# part of  : godafoss micropython library
+# url      : https://www.github.com/wovo/godafoss
+# author   : Wouter van Ooijen (wouter@voti.nl) 2024
+# license  : MIT license, see license attribute (godafoss.license)
+#
+# ===========================================================================
+
+import godafoss as gf
+
+from .framebuf_double import framebuf_double_install
+
+
+# ===========================================================================
+
+class _spi_recorder:
+    """
+    spi mock that records the data / command level and the bytes
+    """
+
+    def __init__( self, data_command ):
+        self._data_command = data_command
+        self.log = []
+
+    def write( self, data ):
+        self.log.append( ( self._data_command.value, bytes( data ) ) )
+
+
+# ===========================================================================
+
+class _spi_timed( _spi_recorder ):
+    """
+    spi recorder that simulates the transfer time: 1 us per byte
+    """
+
+    def __init__( self, data_command ):
+        _spi_recorder.__init__( self, data_command )
+        self.time = 0
+
+    def write( self, data ):
+        _spi_recorder.write( self, data )
+        self.time += len( data )
+
+
+# ===========================================================================
+
+def unit_test_generic_color_lcd():
+    print( "test generic_color_lcd" )
+
+    # the lcd buffer requires a framebuf implementation
+    framebuf_double_install()
+
+    data_command = gf.pin_out( None )
+    spi = _spi_recorder( data_command )
+    lcd = gf.generic_color_lcd(
+        gf.xy( 8, 4 ),
+        spi,
+        data_command = data_command,
+        chip_select = gf.pin_out( None ),
+        offset = gf.xy( 2, 1 )
+    )
+
+    # the first flush transfers the whole buffer
+    lcd.flush()
+    assert spi.log[ -6 : -2 ] == [
+        ( False, bytes( [ 0x2A ] ) ),
+        ( True,  bytes( [ 0, 2, 0, 9 ] ) ),
+        ( False, bytes( [ 0x2B ] ) ),
+        ( True,  bytes( [ 0, 1, 0, 4 ] ) ),
+    ]
+    assert spi.log[ -1 ] == ( True, bytes( 2 * 8 * 4 ) )
+
+    # nothing written: no transfer
+    spi.log = []
+    lcd.flush()
+    assert spi.log == []
+
+    # only the window that contains the written pixels is transferred
+    lcd.write_pixel( gf.xy( 2, 1 ), gf.colors.red )
+    lcd.fill_rect( gf.xy( 3, 2 ), gf.xy( 2, 1 ), gf.colors.blue )
+    lcd.flush()
+    assert spi.log == [
+        ( False, bytes( [ 0x2A ] ) ),
+        ( True,  bytes( [ 0, 4, 0, 6 ] ) ),
+        ( False, bytes( [ 0x2B ] ) ),
+        ( True,  bytes( [ 0, 2, 0, 3 ] ) ),
+        ( False, bytes( [ 0x2C ] ) ),
+        ( True,  bytes( [ 0xF8, 0x00, 0x00, 0x00, 0x00, 0x00 ] ) ),
+        ( True,  bytes( [ 0x00, 0x00, 0x00, 0x1F, 0x00, 0x1F ] ) ),
+    ]
+
+    # complete rows are transferred as one part of the buffer
+    spi.log = []
+    lcd.fill_span( gf.xy( 0, 3 ), 8, gf.colors.white )
+    lcd.flush()
+    assert spi.log[ 1 ] == ( True, bytes( [ 0, 2, 0, 9 ] ) )
+    assert spi.log[ 3 ] == ( True, bytes( [ 0, 4, 0, 4 ] ) )
+    assert spi.log[ 5 : ] == [ ( True, bytes( 16 * [ 0xFF ] ) ) ]
+
+    # a forced flush transfers the whole buffer
+    spi.log = []
+    lcd.flush( forced = True )
+    assert len( spi.log[ -1 ][ 1 ] ) == 2 * 8 * 4
+
+    # rgb565 data is copied into the buffer, high byte first
+    lcd.clear( gf.colors.black )
+    lcd.blit(
+        bytearray( [ 0xF8, 0x00, 0x12, 0x34, 0x00, 0x1F, 0x12, 0x34 ] ),
+        gf.pixel_format.rgb565,
+        gf.xy( 2, 2 ),
+        gf.xy( 7, 0 ),
+        key = 0x1234
+    )
+    assert lcd._buffer[ 14 : 16 ] == bytes( [ 0xF8, 0x00 ] )
+    assert lcd._buffer[ 16 : 18 ] == bytes( [ 0x00, 0x00 ] )
+    assert lcd._buffer[ 30 : 32 ] == bytes( [ 0x00, 0x1F ] )
+    assert lcd._buffer[ 32 : 34 ] == bytes( [ 0x00, 0x00 ] )
+
+    # the set pixels of monochrome data are written with the ink
+    lcd.clear( gf.colors.black )
+    lcd.blit(
+        bytearray( [ 0b10100000 ] ),
+        gf.pixel_format.mono_hlsb,
+        gf.xy( 3, 1 ),
+        gf.xy( 0, 3 ),
+        gf.colors.red
+    )
+    assert lcd._buffer[ 48 : 54 ] == bytes(
+        [ 0xF8, 0x00, 0x00, 0x00, 0xF8, 0x00 ] )
+
+    # a rotation reconfigures the chip and re-uses the buffer
+    buffer = lcd._buffer
+    spi.log = []
+    lcd.rotate( 90 )
+    assert lcd.size == gf.xy( 4, 8 )
+    assert lcd._buffer is buffer
+    assert spi.log == [
+        ( False, bytes( [ 0x36 ] ) ),
+        ( True,  bytes( [ 0x60 ] ) ),
+    ]
+    lcd.flush()
+    assert spi.log[ 3 ] == ( True, bytes( [ 0, 1, 0, 4 ] ) )
+    assert spi.log[ 5 ] == ( True, bytes( [ 0, 2, 0, 9 ] ) )
+    spi.log = []
+    lcd.rotate( 90 )
+    assert lcd.size == gf.xy( 8, 4 )
+    assert spi.log[ 1 ] == ( True, bytes( [ 0xC0 ] ) )
+    spi.log = []
+    lcd.rotate( 180 )
+    assert spi.log[ 1 ] == ( True, bytes( [ 0x00 ] ) )
+
+    # rotated() is a view, the lcd itself is not rotated
+    spi.log = []
+    view = lcd.rotated( 90 )
+    assert view is not lcd
+    assert view.size == gf.xy( 4, 8 )
+    assert lcd.size == gf.xy( 8, 4 )
+    assert spi.log == []
+
+    # an ink is encoded once per shape, not once per pixel
+    encode = lcd._encode
+    encoded = []
+    lcd._encode = lambda c: encoded.append( c ) or encode( c )
+    a, b = gf.color( 8, 16, 24 ), gf.color( 32, 40, 48 )
+    lcd.write( gf.line( gf.xy( 7, 3 ) ), ink = a )
+    lcd.write( gf.line( gf.xy( 3, 3 ) ), ink = b )
+    lcd.write( gf.line( gf.xy( 7, 3 ) ), ink = a )
+    assert encoded == [ a, b ]
+    assert lcd._framebuffer.pixel( 1, 1 ) == encode( b )
+
+    # each monochrome mechanism writes the same rgb565 data,
+    # in the on and off colors
+    pixels = ( ( 0, 0 ), ( 9, 1 ), ( 15, 4 ) )
+    expected = b"".join(
+        bytes( [ 0xF8, 0x00 ] if ( x, y ) in pixels else [ 0x00, 0x1F ] )
+            for y in range( 5 ) for x in range( 16 ) )
+    for mechanism in ( 0, 1, 3 ):
+        spi = _spi_recorder( data_command )
+        mono = gf.generic_color_lcd(
+            gf.xy( 16, 5 ),
+            spi,
+            data_command = data_command,
+            chip_select = gf.pin_out( None ),
+            monochrome = True,
+            mechanism = mechanism,
+            monochrome_on = gf.colors.red,
+            monochrome_off = gf.colors.blue
+        )
+        for x, y in pixels:
+            mono.write_pixel_xy( x, y )
+        spi.log = []
+        mono.flush()
+        start = spi.log.index( ( False, bytes( [ 0x2C ] ) ) ) + 1
+        assert b"".join( data for _, data in spi.log[ start : ] ) == expected
+
+    # a rotation resizes the line buffer
+    mono.rotate( 90 )
+    assert len( mono._line_buffer ) == 2 * 5
+
+    # double buffered: a flush transfers the first chunk,
+    # meanwhile drawing doesn't affect the frame that is transferred
+    spi = _spi_timed( data_command )
+    chip_select = gf.pin_out( None )
+    lcd = gf.generic_color_lcd(
+        gf.xy( 8, 4 ),
+        spi,
+        data_command = data_command,
+        chip_select = chip_select,
+        double_buffered = True,
+        chunk_size = 16
+    )
+    lcd.flush()
+    lcd.wait_flush()
+    lcd.write_pixel_xy( 0, 0, gf.colors.red )
+    lcd.write_pixel_xy( 7, 3, gf.colors.red )
+    spi.log = []
+    spi.time = 0
+    lcd.flush()
+    assert spi.time == 11 + 16
+    assert chip_select.value
+    lcd.write_pixel_xy( 1, 0, gf.colors.blue )
+    assert not lcd.flush_done()
+    assert chip_select.value
+    lcd.wait_flush()
+    assert lcd.flush_done()
+
+    # each chunk (here: a row) is a transaction with its own window
+    for y in range( 4 ):
+        assert spi.log[ 6 * y : 6 * y + 6 ] == [
+            ( False, bytes( [ 0x2A ] ) ), ( True, bytes( [ 0, 0, 0, 7 ] ) ),
+            ( False, bytes( [ 0x2B ] ) ), ( True, bytes( [ 0, y, 0, y ] ) ),
+            ( False, bytes( [ 0x2C ] ) ),
+            ( True, spi.log[ 6 * y + 5 ][ 1 ] )
+        ]
+    assert len( spi.log ) == 4 * 6
+    chunks = [ data for _, data in spi.log[ 5 : : 6 ] ]
+    assert b"".join( chunks ) == bytes( [ 0xF8, 0x00 ] ) \
+        + bytes( 60 ) + bytes( [ 0xF8, 0x00 ] )
+    assert spi.time == 4 * ( 11 + 16 )
+
+    # a flush completes the previous transfer before it starts the next,
+    # the changed row is transferred from the front buffer
+    lcd.flush()
+    lcd.write_pixel_xy( 2, 0, gf.colors.blue )
+    spi.log = []
+    lcd.flush()
+    lcd.wait_flush()
+    start = spi.log.index( ( False, bytes( [ 0x2A ] ) ) )
+    assert spi.log[ start + 1 ] == ( True, bytes( [ 0, 2, 0, 2 ] ) )
+    assert spi.log[ -1 ] == ( True, bytes( [ 0x00, 0x1F ] ) )
+    assert lcd._front == lcd._buffer
+
+
+# ===========================================================================
@@ -0,0 +1,167 @@
+# ===========================================================================
+#
+# file     : unit_test_ggf.py
+# part of  : godafoss micropython library
+# url      : https://www.github.com/wovo/godafoss
+# author   : Wouter van Ooijen (wouter@voti.nl) 2024
+# license  : MIT license, see license attribute (godafoss.license)
+#
+# ===========================================================================
+
+import os
+
+import godafoss as gf
+
+from .framebuf_double import framebuf_double_install
+
+
+# ===========================================================================
+
+class _spi_sink:
+    """
+    spi mock that ignores the data
+    """
+
+    def write( self, data ):
+        pass
+
+
+# ===========================================================================
+
+def _ggf_file( depth, size, data ):
+    """
+    write a ggf file, return its name
+    """
+
+    name = "unit_test.ggf"
+    f = open( name, "wb" )
+    f.write( bytes( [
+        0xA6, depth, size.x >> 8, size.x & 0xFF, size.y >> 8, size.y & 0xFF
+    ] ) )
+    f.write( bytes( data ) )
+    f.close()
+    return name
+
+
+# ===========================================================================
+
+def unit_test_ggf():
+    print( "test ggf" )
+
+    grey = gf.color( 0xE0, 0xE0, 0xC0 )
+    canvas = gf.canvas_dummy(
+        gf.xy( 12, 4 ),
+        palet = { gf.colors.white: ".", gf.colors.black: "*", grey: "+" }
+    )
+
+    # each depth, packed or not, from RAM and from the file
+    for depth, data in (
+        ( 0, [ 0b00001101, 0b10, 0b11111111, 0b11 ] ),
+        ( 1, [ 0xFF, 0x00, 0xFF ] + 7 * [ 0xFF ]
+            + [ 0x00, 0xFF, 0xFF ] + 7 * [ 0x00 ] ),
+        ( 2, [ 0xE0, 0xE0, 0xC0, 0, 0, 0 ] + 8 * [ 0xE0, 0xE0, 0xC0 ]
+            + [ 0, 0, 0 ] + 2 * [ 0xE0, 0xE0, 0xC0 ] + 7 * [ 0, 0, 0 ] ),
+        ( 3, [ 0xE7, 0x18, 0, 0 ] + 8 * [ 0xE7, 0x18 ]
+            + [ 0, 0 ] + 2 * [ 0xE7, 0x18 ] + 7 * [ 0, 0 ] ),
+        ( 4, [ 3, 2, 3, 3, 2, 2, 2, 2, 2, 3 ] ),
+        ( 0x81, [ 0, 5, 1, 0xFF, 0x00, 249, 0xFF ]
+            + [ 0, 7, 0, 0x00, 128, 255, 0xFF, 250, 0x00 ] ),
+        ( 0x82, [ 0, 11, 1, 0xE0, 0xE0, 0xC0, 0, 0, 0 ]
+            + [ 249, 0xE0, 0xE0, 0xC0 ]
+            + [ 0, 12, 0, 0, 0, 0, 255, 0xE0, 0xE0, 0xC0, 250, 0, 0, 0 ] ),
+    ):
+        name = _ggf_file( depth, gf.xy( 10, 2 ), data )
+        for cached in ( True, False ):
+            image = gf.ggf( name, cached )
+            assert image.size == gf.xy( 10, 2 )
+            canvas.clear()
+            canvas.write( image, gf.xy( 3, 2 ), gf.colors.black )
+            canvas.write( image, gf.xy( 1, -1 ), gf.colors.black )
+            if depth & 0x7F in ( 0, 4 ):
+                assert canvas.lines() == [
+                    ".**********.",
+                    "............",
+                    "...*.**.....",
+                    "...*********",
+                ]
+            else:
+                assert canvas.lines() == [
+                    ".*++*******.",
+                    "............",
+                    "...+*+++++++",
+                    "...*++******",
+                ]
+        os.remove( name )
+
+    # the viper and the bulk unpacking produce the same bytes
+    for unit, packed, unpacked in (
+        ( 1, [ 2, 1, 2, 3, 128, 253, 9, 0, 4 ], [ 1, 2, 3, 9, 9, 9, 9, 4 ] ),
+        ( 3, [ 0, 1, 2, 3, 254, 4, 5, 6, 1, 7, 8, 9, 10, 11, 12 ],
+            [ 1, 2, 3 ] + 3 * [ 4, 5, 6 ] + list( range( 7, 13 ) ) ),
+    ):
+        for unpack in (
+            gf.gf_shapes._unpack_row_viper,
+            gf.gf_shapes._unpack_row_bulk
+        ):
+            row = bytearray( len( unpacked ) )
+            unpack( memoryview( bytes( packed ) ), row, unit )
+            assert row == bytes( unpacked )
+
+    # a corrupt packed row is not unpacked past its source or target
+    for unit, packed, size in (
+        ( 1, [ 3, 1, 2, 3, 4 ], 3 ),
+        ( 1, [ 3, 1, 2 ], 4 ),
+        ( 1, [ 253, 9 ], 3 ),
+        ( 3, [ 254, 1, 2 ], 9 ),
+        ( 1, [ 1, 1, 2 ], 3 ),
+    ):
+        for unpack in (
+            gf.gf_shapes._unpack_row_viper,
+            gf.gf_shapes._unpack_row_bulk
+        ):
+            row = bytearray( size )
+            try:
+                unpack( memoryview( bytes( packed ) ), row, unit )
+                assert False
+            except ValueError:
+                pass
+            assert len( row ) == size
+
+    # a packed row that doesn't fit the row, from RAM and from the file
+    name = _ggf_file( 0x83, gf.xy( 2, 1 ), [ 0, 200, 3, 0, 0, 0, 0 ] )
+    for cached in ( True, False ):
+        try:
+            canvas.write( gf.ggf( name, cached ) )
+            assert False
+        except ValueError:
+            pass
+    os.remove( name )
+
+    # the lcd buffer requires a framebuf implementation
+    framebuf_double_install()
+
+    # color rows are converted to rgb565, rgb565 rows are copied
+    lcd = gf.generic_color_lcd(
+        gf.xy( 4, 2 ),
+        _spi_sink(),
+        data_command = gf.pin_out( None ),
+        chip_select = gf.pin_out( None )
+    )
+    for depth, data in (
+        ( 1, [ 0xE0, 0x1C, 0x03, 0xFF ] ),
+        ( 2, [ 0xFF, 0, 0,  0, 0xFF, 0,  0, 0, 0xFF,  0xE0, 0xE0, 0xC0 ] ),
+        ( 3, [ 0xF8, 0x00, 0x07, 0xE0, 0x00, 0x1F, 0xE7, 0x18 ] ),
+    ):
+        name = _ggf_file( depth, gf.xy( 4, 1 ), data )
+        for cached in ( True, False ):
+            lcd.clear()
+            lcd.write( gf.ggf( name, cached ), gf.xy( 0, 1 ) )
+            assert lcd._buffer[ 8 : 16 ] == bytes( [
+                0xE0, 0x00, 0x07, 0x00, 0x00, 0x18, 0xE7, 0x18
+            ] if depth == 1 else [
+                0xF8, 0x00, 0x07, 0xE0, 0x00, 0x1F, 0xE7, 0x18
+            ] )
+        os.remove( name )
+
+
+# ===========================================================================
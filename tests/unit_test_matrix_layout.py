@@ -0,0 +1,111 @@
+# ===========================================================================
+#
+# file     : unit_test_matrix_layout.py
+# part of  : godafoss micropython library
+# url      : https://www.github.com/wovo/godafoss
+# author   : Wouter van Ooijen (wouter@voti.nl) 2024
+# license  : MIT license, see license attribute (godafoss.license)
+#
+# ===========================================================================
+
+import godafoss as gf
+
+
+# ===========================================================================
+
+class _strip( gf.canvas ):
+    """
+    strip mock that records its pixels and the written spans
+    """
+
+    def __init__( self, n ):
+        gf.canvas.__init__( self, gf.xy( n, 1 ), False, False )
+        self.pixels = [ 0 ] * n
+        self.spans = []
+
+    def _write_pixel_xy_implementation( self, x, y, ink ):
+        self.pixels[ x ] = ink
+
+    def _fill_rect_implementation( self, location, size, ink ):
+        self.spans.append( ( location.x, size.x ) )
+        for x in range( location.x, location.x + size.x ):
+            self.pixels[ x ] = ink
+
+
+# ===========================================================================
+
+def _rows( layout ):
+    return [
+        [ layout.index( x, y ) for x in range( layout.size.x ) ]
+            for y in range( layout.size.y )
+    ]
+
+
+# ===========================================================================
+
+def unit_test_matrix_layout():
+    print( "test matrix_layout" )
+
+    # the mapping of the panel pixels
+    assert _rows( gf.matrix_layout( gf.xy( 4, 3 ) ) ) == [
+        [ 0, 1, 2, 3 ], [ 7, 6, 5, 4 ], [ 8, 9, 10, 11 ] ]
+    assert _rows( gf.matrix_layout( gf.xy( 3, 2 ), zigzag = False ) ) == [
+        [ 0, 1, 2 ], [ 3, 4, 5 ] ]
+    assert _rows( gf.matrix_layout(
+        gf.xy( 3, 2 ), column_major = True ) ) == [
+        [ 0, 3, 4 ], [ 1, 2, 5 ] ]
+    assert _rows( gf.matrix_layout(
+        gf.xy( 2, 2 ), zigzag = False, mirror_x = True ) ) == [
+        [ 1, 0 ], [ 3, 2 ] ]
+    assert _rows( gf.matrix_layout(
+        gf.xy( 2, 2 ), zigzag = False, mirror_y = True ) ) == [
+        [ 2, 3 ], [ 0, 1 ] ]
+
+    # the chaining of the panels
+    assert _rows( gf.matrix_layout(
+        gf.xy( 2, 2 ), zigzag = False, panels = gf.xy( 2, 1 ) ) ) == [
+        [ 0, 1, 4, 5 ], [ 2, 3, 6, 7 ] ]
+    layout = gf.matrix_layout(
+        gf.xy( 1, 1 ), panels = gf.xy( 2, 2 ), panels_zigzag = True )
+    assert _rows( layout ) == [ [ 0, 1 ], [ 3, 2 ] ]
+    layout = gf.matrix_layout( gf.xy( 8, 8 ), panels = gf.xy( 32, 1 ) )
+    assert layout.size == gf.xy( 256, 8 )
+    assert layout.table.typecode == "H"
+    assert sorted( layout.table ) == list( range( 2048 ) )
+
+    try:
+        gf.matrix_layout( gf.xy( 256, 256 ), panels = gf.xy( 2, 1 ) )
+        assert False
+    except ValueError:
+        pass
+
+    # a matrix on a strip writes the mapped strip pixels,
+    # spans and rectangles as runs of the strip
+    layout = gf.matrix_layout( gf.xy( 4, 3 ) )
+    strip = _strip( 13 )
+    matrix = strip.matrix( layout )
+    matrix.write_pixel_xy( 1, 1 )
+    assert strip.pixels[ 6 ] == True
+    matrix.fill_rect( gf.xy( 1, 0 ), gf.xy( 2, 3 ) )
+    assert strip.spans == [ ( 1, 2 ), ( 5, 2 ), ( 9, 2 ) ]
+    assert strip.pixels == [ 0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 1, 0, 0 ]
+    strip.spans = []
+    matrix.fill_span( gf.xy( 3, 0 ), 3, vertical = True )
+    assert strip.spans == [ ( 3, 2 ), ( 11, 1 ) ]
+    strip.spans = []
+    matrix.clear()
+    assert strip.spans == [ ( 0, 12 ) ]
+
+    layout = gf.matrix_layout( gf.xy( 3, 4 ), column_major = True )
+    strip = _strip( 12 )
+    strip.matrix( layout ).fill_span( gf.xy( 1, 0 ), 4, vertical = True )
+    assert strip.spans == [ ( 4, 4 ) ]
+
+    try:
+        _strip( 11 ).matrix( gf.matrix_layout( gf.xy( 4, 3 ) ) )
+        assert False
+    except ValueError:
+        pass
+
+
+# ===========================================================================
@@ -0,0 +1,173 @@
+# ===========================================================================
+#
+# file     : unit_test_pixel_formats.py
+# part of  : godafoss micropython library
+# url      : https://www.github.com/wovo/godafoss
+# author   : Wouter van Ooijen (wouter@voti.nl) 2024
+# license  : MIT license, see license attribute (godafoss.license)
+#
+# ===========================================================================
+
+import godafoss as gf
+
+
+# ===========================================================================
+
+def _rgb565(
+    a: int,
+    b: int,
+    c: int,
+    big_endian: bool
+) -> bytes:
+    """
+    the two bytes of an rgb565 value, computed pixel by pixel
+    """
+
+    v = ( ( a >> 3 ) << 11 ) | ( ( b >> 2 ) << 5 ) | ( c >> 3 )
+    return bytes(
+        [ v >> 8, v & 0xFF ] if big_endian else [ v & 0xFF, v >> 8 ] )
+
+
+# ===========================================================================
+
+def unit_test_pixel_formats():
+    print( "test pixel_formats" )
+
+    pixels = [ ( 0xFF, 0x00, 0x00 ), ( 0x12, 0x34, 0x56 ),
+        ( 0x00, 0xFC, 0x08 ), ( 0xF8, 0x80, 0xFF ), ( 0x01, 0x02, 0x03 ) ]
+    source = bytearray( sum( pixels, () ) )
+    n = len( pixels )
+
+    # rgb888 to rgb565, all orders and both byte orders
+    for order in ( "RGB", "RBG", "GRB", "GBR", "BRG", "BGR" ):
+        for big_endian in ( True, False ):
+            target = bytearray( 2 * n + 2 )
+            gf.rgb888_to_rgb565( source, target, n, order, big_endian )
+            assert target == b"".join(
+                _rgb565(
+                    *( p[ "RGB".index( c ) ] for c in order ),
+                    big_endian
+                ) for p in pixels
+            ) + bytes( 2 )
+
+    try:
+        gf.rgb888_to_rgb565( source, bytearray( 2 * n ), n, "RGR" )
+        assert False
+    except ValueError:
+        pass
+
+    # rgb332 to rgb565, into a memoryview
+    target = bytearray( 2 + 2 * 256 )
+    gf.rgb332_to_rgb565(
+        bytes( range( 256 ) ), memoryview( target )[ 2 : ], 256 )
+    for v in range( 256 ):
+        c = gf.gf_canvas._pixel_color( gf.pixel_format.rgb332, v )
+        assert target[ 2 + 2 * v : 4 + 2 * v ] \
+            == _rgb565( c.red, c.green, c.blue, True )
+    target = bytearray( 2 * n )
+    gf.rgb332_to_rgb565( bytes( [ 0xE0, 0x03 ] ), target, 2, False )
+    assert target[ : 4 ] == bytes( [ 0x00, 0xE0, 0x18, 0x00 ] )
+
+    # rgb888 to rgb444
+    target = bytearray( 2 * n )
+    gf.rgb888_to_rgb444( source, target, n )
+    assert target == b"".join(
+        bytes( [ r >> 4, ( g & 0xF0 ) | ( b >> 4 ) ] )
+            for r, g, b in pixels )
+    gf.rgb888_to_rgb444( source, target, n, False )
+    assert target == b"".join(
+        bytes( [ ( g & 0xF0 ) | ( b >> 4 ), r >> 4 ] )
+            for r, g, b in pixels )
+
+    # rgb888 to grb
+    target = bytearray( 3 * n )
+    gf.rgb888_to_grb( source, target, n )
+    assert target == bytes(
+        sum( ( ( g, r, b ) for r, g, b in pixels ), () ) )
+
+    # rgb888 through a lookup table, packed and with a stride
+    table = bytes( ( 7 * v + 3 ) & 0xFF for v in range( 256 ) )
+    looked_up = bytes( table[ v ] for v in source )
+    target = bytearray( 3 * n + 1 )
+    gf.rgb888_lookup( source, target, n, table )
+    assert target == looked_up + bytes( 1 )
+    target = bytearray( [ 0xEE ] * ( 4 * n + 1 ) )
+    gf.rgb888_lookup( source, memoryview( target )[ 1 : ], n, table, 4 )
+    assert target == b"".join(
+        bytes( [ 0xEE ] ) + looked_up[ 3 * i : 3 * i + 3 ]
+            for i in range( n ) ) + bytes( [ 0xEE ] )
+
+    try:
+        gf.rgb888_lookup( source, target, n, table, 2 )
+        assert False
+    except ValueError:
+        pass
+
+    assert gf.brightness_table() == bytes( range( 256 ) )
+    assert gf.brightness_table( brightness = 0 ) == bytes( 256 )
+    table = gf.brightness_table( 2.0, 128 )
+    assert ( table[ 0 ], table[ 128 ], table[ 255 ] ) == ( 0, 32, 128 )
+
+    # the monochrome formats to rgb565
+    size = gf.xy( 10, 9 )
+    on, off = 0x1234, 0xABCD
+    for format, data in (
+        ( gf.pixel_format.mono_vlsb, bytes( range( 1, 21 ) ) ),
+        ( gf.pixel_format.mono_hlsb, bytes( range( 3, 57, 3 ) ) ),
+        ( gf.pixel_format.mono_hmsb, bytes( range( 5, 95, 5 ) ) ),
+    ):
+        for big_endian in ( True, False ):
+            target = bytearray( 2 * size.x * size.y )
+            gf.mono_to_rgb565(
+                data, format, size, target, on, off, big_endian )
+            for y in range( size.y ):
+                for x in range( size.x ):
+                    v = on if gf.gf_canvas._pixel_value(
+                        data, format, size, x, y ) else off
+                    i = 2 * ( x + y * size.x )
+                    assert target[ i : i + 2 ] == bytes(
+                        [ v >> 8, v & 0xFF ] if big_endian
+                            else [ v & 0xFF, v >> 8 ] )
+
+    try:
+        gf.mono_to_rgb565(
+            bytes( 4 ), gf.pixel_format.rgb332, gf.xy( 2, 2 ),
+            bytearray( 8 ), on, off )
+        assert False
+    except ValueError:
+        pass
+
+    # the viper kernels, run as plain Python,
+    # produce the same bytes as the bulk kernels
+    m = gf.gf_pixel_formats
+    source = bytes( ( 37 * i + 11 ) & 0xFF for i in range( 3 * 41 ) )
+    for kernel, size, modes in (
+        ( "_rgb888_to_rgb565", 2, [ m._order_offsets( order ) | endian
+            for order in ( "RGB", "GBR", "BGR" )
+                for endian in ( 0, 0x40 ) ] ),
+        ( "_rgb332_to_rgb565", 2,
+            [ m._rgb332_table( True ), m._rgb332_table( False ) ] ),
+        ( "_rgb888_to_rgb444", 2, [ 0, 1 ] ),
+        ( "_rgb888_to_grb", 3, [ None ] ),
+        ( "_rgb888_lookup", 5, [ 41 | ( 3 << 20 ), 41 | ( 5 << 20 ) ] ),
+        ( "_mono_row_to_rgb565", 2, [ 41 | ( 5 << 18 ), 41 | ( 1 << 16 ),
+            41 | ( 2 << 16 ) ] ),
+    ):
+        for mode in modes:
+            targets = []
+            for implementation in ( "_viper", "_bulk" ):
+                f = getattr( m, kernel + implementation )
+                target = bytearray( size * 41 + 1 )
+                if kernel == "_mono_row_to_rgb565":
+                    f( source, target, mode, bytes( [ 1, 2, 3, 4 ] ) )
+                elif kernel == "_rgb888_lookup":
+                    f( source, target, mode, table )
+                elif mode is None:
+                    f( source, target, 41 )
+                else:
+                    f( source, target, 41, mode )
+                targets.append( target )
+            assert targets[ 0 ] == targets[ 1 ]
+
+
+# ===========================================================================
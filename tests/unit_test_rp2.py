@@ -0,0 +1,136 @@
+# ===========================================================================
+#
+# file     : unit_test_rp2.py
+# part of  : godafoss micropython library
+# url      : https://www.github.com/wovo/godafoss
+# author   : Wouter van Ooijen (wouter@voti.nl) 2024
+# license  : MIT license, see license attribute (godafoss.license)
+#
+# ===========================================================================
+
+import godafoss as gf
+
+
+# ===========================================================================
+
+def _expanded( v: int ) -> tuple:
+    """
+    the 8-bit red, green and blue of an rgb565 value
+    """
+
+    r, g, b = v >> 11, ( v >> 5 ) & 0x3F, v & 0x1F
+    return ( r << 3 ) | ( r >> 2 ), ( g << 2 ) | ( g >> 4 ), \
+        ( b << 3 ) | ( b >> 2 )
+
+
+# ===========================================================================
+
+def unit_test_rp2():
+    print( "test rp2" )
+
+    # the control values used by the hub75 driver
+    assert gf.rp2_dma_control( treq = 0, chain_to = 0 ) \
+        == ( 0x0 << 15 ) | ( 0 << 11 ) | ( 1 << 4 ) | ( 2 << 2 ) | 1
+    assert gf.rp2_dma_control(
+        treq = 0x3F, chain_to = 0, increment_read = False ) \
+        == ( 0x3F << 15 ) | ( 0 << 11 ) | ( 0 << 4 ) | ( 2 << 2 ) | 1
+    assert gf.rp2_dma_control( 9, 3, byte_swap = True ) \
+        == ( 1 << 22 ) | ( 9 << 15 ) | ( 3 << 11 ) | ( 1 << 4 ) | 9
+
+    assert gf.rp2_dma_register( 1, 0x3C ) == 0x5000007C
+    try:
+        gf.rp2_dma_register( 12, 0 )
+        assert False
+    except ValueError:
+        pass
+    assert gf.rp2_pio_tx_fifo( 0, 0 ) == 0x50200010
+    assert gf.rp2_pio_tx_fifo( 1, 3 ) == 0x5030001C
+    assert gf.rp2_pio_tx_dreq( 1, 2 ) == 10
+
+    # the dma writes for two strips of 5 pixels on pio 1
+    assert gf.rp2_ws281x_dma( 0x20001000, 5, [ 2, 3 ], 1, [ 0, 1 ] ) == [
+        ( 0x50000080, 0x20001000 ),
+        ( 0x50000084, 0x50300010 ),
+        ( 0x50000088, 5 ),
+        ( 0x50000090, gf.rp2_dma_control( 8, 2, byte_swap = True ) ),
+        ( 0x500000C0, 0x20001014 ),
+        ( 0x500000C4, 0x50300014 ),
+        ( 0x500000C8, 5 ),
+        ( 0x500000D0, gf.rp2_dma_control( 9, 3, byte_swap = True ) ),
+    ]
+    try:
+        gf.rp2_ws281x_dma( 0, 5, [ 2, 3 ], 1, [ 0 ] )
+        assert False
+    except ValueError:
+        pass
+
+    # the frames are used round-robin
+    frames = gf.rp2_frames( 8 )
+    a = frames.back()
+    assert ( len( a ), frames.swap() ) == ( 8, a )
+    b = frames.back()
+    assert ( b is not a ) and ( frames.swap() is b )
+    assert frames.back() is a
+    frames = gf.rp2_frames( 8, 1 )
+    assert frames.swap() is frames.back()
+
+    # a frame encoded with a stride of 4 holds in each byte-swapped
+    # word the wire order bytes, in the 24 bits that are shifted out
+    pixels = bytes( [ 0x12, 0x34, 0x56, 0xAB, 0xCD, 0xEF ] )
+    frame = frames.back()
+    gf.rgb888_lookup( pixels, frame, 2, gf.brightness_table(), 4 )
+    for i in range( 2 ):
+        word = int.from_bytes( frame[ 4 * i : 4 * i + 4 ], "little" )
+        swapped = int.from_bytes( word.to_bytes( 4, "big" ), "little" )
+        assert swapped >> 8 == int.from_bytes(
+            pixels[ 3 * i : 3 * i + 3 ], "big" )
+
+    # the hub75 stream: per bitplane and row pair the pixel count,
+    # the pixels, the row select instruction and the display time
+    frame = gf.rp2_hub75_frame( 4, 2, 3, 5, [ 0xE000, 0xE001 ] )
+    assert len( frame ) == 3 * 2 * 16
+    assert frame[ 16 : 32 ] == bytes( [ 3, 0, 0, 0 ] ) + bytes( 4 ) \
+        + bytes( [ 1, 0xE0, 0, 0, 4, 0, 0, 0 ] )
+    assert frame[ 92 : 96 ] == bytes( [ 19, 0, 0, 0 ] )
+    for width, depth in ( ( 6, 3 ), ( 4, 0 ), ( 4, 9 ) ):
+        try:
+            gf.rp2_hub75_frame( width, 2, depth, 5, [ 0, 0 ] )
+            assert False
+        except ValueError:
+            pass
+
+    # the bitplanes of a row pair, for each depth
+    width, rows = 8, 2
+    source = bytes(
+        ( 59 * i + 13 ) & 0xFF for i in range( 4 * width * rows ) )
+    m = gf.gf_rp2
+    for depth in range( 1, 9 ):
+        targets = []
+        for kernel in ( m._hub75_bitplanes_viper, m._hub75_bitplanes_bulk ):
+            target = gf.rp2_hub75_frame( width, rows, depth, 1, [ 0, 0 ] )
+            kernel( source, target, width | ( rows << 12 ) | ( depth << 20 ),
+                1 )
+            targets.append( target )
+        assert targets[ 0 ] == targets[ 1 ]
+
+        target = gf.rp2_hub75_frame( width, rows, depth, 1, [ 0, 0 ] )
+        gf.rp2_hub75_encode( source, target, width, rows, depth, 1 )
+        assert target == targets[ 0 ]
+        for plane in range( depth ):
+            j = ( plane * rows + 1 ) * ( width + 12 ) + 4
+            for x in range( width ):
+                v = 0
+                for half, y in enumerate( ( 1, 1 + rows ) ):
+                    i = 2 * ( x + y * width )
+                    for channel, c in enumerate( _expanded(
+                        source[ i ] | ( source[ i + 1 ] << 8 ) )
+                    ):
+                        bit = ( c >> ( 8 - depth + plane ) ) & 1
+                        v |= bit << ( 3 * half + channel )
+                assert target[ j + x ] == v
+
+        # the other row pair is not touched
+        assert target[ 4 : 4 + width ] == bytes( width )
+
+
+# ===========================================================================
@@ -0,0 +1,122 @@
+# ===========================================================================
+#
+# file     : unit_test_ssd1306.py
+# part of  : godafoss micropython library
+# url      : https://www.github.com/wovo/godafoss
+# author   : Wouter van Ooijen (wouter@voti.nl) 2024
+# license  : MIT license, see license attribute (godafoss.license)
+#
+# ===========================================================================
+
+import godafoss as gf
+
+from .framebuf_double import framebuf_double_install
+
+
+# ===========================================================================
+
+class _i2c_recorder:
+    """
+    i2c mock that records the commands and the data transactions
+    """
+
+    def __init__( self ):
+        self.commands = []
+        self.data = []
+
+    def writeto( self, address, data ):
+        self.commands.append( data[ 1 ] )
+
+    def start( self ):
+        self._transaction = b""
+
+    def write( self, data ):
+        self._transaction += bytes( data )
+
+    def stop( self ):
+        self.data.append( self._transaction[ 2 : ] )
+
+
+# ===========================================================================
+
+def unit_test_ssd1306():
+    print( "test ssd1306" )
+
+    # the oled buffer requires a framebuf implementation
+    framebuf_double_install()
+
+    i2c = _i2c_recorder()
+    oled = gf.ssd1306_i2c( gf.xy( 64, 32 ), i2c )
+
+    # the first flush transfers all pages
+    oled.flush()
+    assert i2c.commands[ -6 : ] == [ 0x21, 32, 95, 0x22, 0, 3 ]
+    assert i2c.data == [ bytes( 64 * 4 ) ]
+
+    # nothing written: no transfer
+    i2c.commands, i2c.data = [], []
+    oled.flush()
+    assert i2c.commands == []
+    assert i2c.data == []
+
+    # only the written columns of the written page are transferred
+    oled.write_pixel( gf.xy( 5, 9 ) )
+    oled.fill_span( gf.xy( 3, 10 ), 4 )
+    oled.flush()
+    assert i2c.commands == [ 0x21, 32 + 3, 32 + 6, 0x22, 1, 1 ]
+    assert i2c.data == [ bytes( [ 0x04, 0x04, 0x06, 0x04 ] ) ]
+
+    # pages with different column ranges get their own window
+    i2c.commands, i2c.data = [], []
+    oled.write_pixel( gf.xy( 0, 0 ) )
+    oled.fill_rect( gf.xy( 10, 16 ), gf.xy( 2, 16 ) )
+    oled.flush()
+    assert i2c.commands == [
+        0x21, 32, 32, 0x22, 0, 0,
+        0x21, 42, 43, 0x22, 2, 3
+    ]
+    assert i2c.data == [
+        bytes( [ 0x01 ] ),
+        bytes( [ 0xFF, 0xFF, 0xFF, 0xFF ] )
+    ]
+
+    # a pixel written through a view transfers its page window
+    i2c.commands, i2c.data = [], []
+    oled.part( gf.xy( 10, 8 ), gf.xy( 20, 20 ) ).write_pixel( gf.xy( 1, 1 ) )
+    oled.flush()
+    assert i2c.commands == [ 0x21, 32 + 11, 32 + 11, 0x22, 1, 1 ]
+    assert i2c.data == [ bytes( [ 0x02 ] ) ]
+
+    # a glyph is blitted into the buffer
+    oled.clear()
+    glyph = gf.font_default().read( "A" )
+    oled.write( glyph, gf.xy( 60, 4 ) )
+    for x in range( 4 ):
+        for y in range( 8 ):
+            assert oled._framebuf.pixel( 60 + x, 4 + y ) == (
+                1 if glyph.read( gf.xy( x, y ) ) else 0 )
+
+    # a rotation by 180 flips the scan directions, and rewrites all pages
+    oled.flush()
+    i2c.commands, i2c.data = [], []
+    oled.rotate( 180 )
+    oled.flush()
+    assert i2c.commands[ : 2 ] == [ 0xA0, 0xC0 ]
+    assert i2c.data == [ bytes( oled._buffer ) ]
+    i2c.commands = []
+    oled.rotate( 180 )
+    assert i2c.commands == [ 0xA1, 0xC8 ]
+
+    # other rotations can't be done in hardware,
+    # rotated() is a view for all rotations
+    try:
+        oled.rotate( 90 )
+        assert False
+    except ValueError:
+        pass
+    i2c.commands = []
+    assert oled.rotated( 180 ) is not oled
+    assert i2c.commands == []
+
+
+# ===========================================================================
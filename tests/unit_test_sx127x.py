@@ -0,0 +1,115 @@
+# ===========================================================================
+#
+# file     : unit_test_sx127x.py
+# part of  : godafoss micropython library
+# url      : https://www.github.com/wovo/godafoss
+# author   : Wouter van Ooijen (wouter@voti.nl) 2024
+# license  : MIT license, see license attribute (godafoss.license)
+#
+# ===========================================================================
+
+import godafoss as gf
+
+
+# ===========================================================================
+
+class _sx127x_chip:
+    """
+    spi mock with the registers and the fifo of an sx127x
+
+    Like the chip, a transaction that starts with the fifo address
+    accesses successive fifo locations,
+    other addresses access successive registers.
+    """
+
+    def __init__( self ):
+        self.registers = bytearray( 128 )
+        self.fifo = bytearray( 256 )
+        self.transactions = 0
+        self._address = None
+
+    def select( self, selected ):
+        if selected:
+            self.transactions += 1
+        self._address = None
+
+    def _fifo_next( self ):
+        # the fifo address pointer, post-incremented
+        address = self.registers[ 0x0D ]
+        self.registers[ 0x0D ] = ( address + 1 ) & 0xFF
+        return address
+
+    def write( self, data ):
+        for value in data:
+            if self._address is None:
+                self._address = value & 0x7F
+            elif self._address == 0x00:
+                self.fifo[ self._fifo_next() ] = value
+            else:
+                self.registers[ self._address ] = value
+                self._address += 1
+
+    def readinto( self, buffer ):
+        for i in range( len( buffer ) ):
+            if self._address == 0x00:
+                buffer[ i ] = self.fifo[ self._fifo_next() ]
+            else:
+                buffer[ i ] = self.registers[ self._address ]
+                self._address += 1
+
+
+# ===========================================================================
+
+class _chip_select( gf.can_pin_out ):
+    """
+    chip select pin that informs the spi mock
+    """
+
+    def __init__( self, chip ):
+        self.chip = chip
+        self.pin = None
+
+    def as_pin_out( self ):
+        return self
+
+    def write( self, value ):
+        self.chip.select( not value )
+
+
+# ===========================================================================
+
+def unit_test_sx127x():
+    print( "test sx127x" )
+
+    chip = _sx127x_chip()
+    radio = gf.sx127x( chip, _chip_select( chip ) )
+
+    # the payload is written to the fifo in one transaction
+    payload = bytes( ( 7 * i ) & 0xFF for i in range( 255 ) )
+    chip.transactions = 0
+    radio.transmit( payload, wait = False )
+    assert chip.transactions < 10
+    base = radio.tx_fifo_base_address
+    assert chip.fifo[ base : ] + chip.fifo[ : base ] \
+        == payload + bytes( 1 )
+    assert chip.registers[ 0x22 ] == 255
+
+    radio.transmit( [ 1, 2, 3 ], 2, wait = False )
+    assert chip.fifo[ base : base + 3 ] == bytes( [ 1, 2, 14 ] )
+    assert chip.registers[ 0x22 ] == 2
+
+    # the payload is read from the fifo into the buffer
+    chip.registers[ 0x10 ] = 0x40
+    chip.registers[ 0x13 ] = 5
+    chip.fifo[ 0x40 : 0x45 ] = b"hello"
+    buffer = bytearray( 16 )
+    chip.transactions = 0
+    assert radio.read_payload_into( buffer ) == 5
+    assert chip.transactions == 4
+    assert buffer[ : 5 ] == b"hello"
+    assert radio.read_payload_into( memoryview( buffer )[ 8 : 11 ] ) == 3
+    assert buffer[ 8 : 11 ] == b"hel"
+    assert radio.read_payload() == b"hello"
+
+
+# ===========================================================================
@@ -0,0 +1,126 @@
+# ===========================================================================
+#
+# file     : unit_test_uc8151.py
+# part of  : godafoss micropython library
+# url      : https://www.github.com/wovo/godafoss
+# author   : Wouter van Ooijen (wouter@voti.nl) 2024
+# license  : MIT license, see license attribute (godafoss.license)
+#
+# ===========================================================================
+
+import godafoss as gf
+
+from .framebuf_double import framebuf_double_install
+
+
+# ===========================================================================
+
+class _spi_commands:
+    """
+    spi mock that records the commands, each with its data bytes
+    """
+
+    def __init__( self, data_command ):
+        self._data_command = data_command
+        self.log = []
+
+    def write( self, data ):
+        if self._data_command.value:
+            self.log[ -1 ][ 1 ] += bytes( data )
+        else:
+            self.log.append( [ data[ 0 ], b"" ] )
+
+    def commands( self ):
+        return [ command for command, _ in self.log ]
+
+
+# ===========================================================================
+
+def unit_test_uc8151():
+    print( "test uc8151" )
+
+    m = gf.gf_chips_uc8151
+
+    # the partial window: x in bytes, y (gates) as 16 bits
+    assert m._partial_window( 8, 10, 24, 300 ) == bytes(
+        [ 8, 23, 0, 10, 0x01, 0x2B, 0x01 ] )
+
+    # the window part of a 16 x 4 framebuffer
+    fb = bytearray( range( 1, 9 ) )
+    assert m._partial_data( fb, 16, 8, 1, 16, 3 ) == bytes( [ 4, 6 ] )
+    assert m._partial_data( fb, 16, 0, 0, 16, 4 ) == fb
+    assert m._partial_data( fb, 16, 0, 3, 8, 4 ) == bytes( [ 7 ] )
+
+    # the display buffer requires a framebuf implementation
+    framebuf_double_install()
+
+    c = gf.uc8151._commands
+    data_command = gf.pin_out( None )
+    spi = _spi_commands( data_command )
+
+    # the busy pin is low while the display is busy
+    busy = gf.pin_in( None )
+    busy.value = True
+    epd = gf.uc8151(
+        spi,
+        cs = gf.pin_out( None ),
+        dc = data_command,
+        rst = gf.pin_out( None ),
+        busy = busy,
+        full_update_period = 2,
+        partial = True
+    )
+
+    # the first flush is a full refresh, which switches partial mode off,
+    # the display is switched off when the refresh is done
+    spi.log = []
+    epd.flush()
+    assert spi.commands() == [ c.PON, c.PTOU, c.DTM2, c.DSP, c.DRF ]
+    busy.value = False
+    assert not epd.flush_done()
+    assert spi.commands()[ -1 ] == c.DRF
+    busy.value = True
+    assert epd.flush_done()
+    assert spi.commands()[ -1 ] == c.POF
+    assert epd.flush_done()
+    assert spi.commands().count( c.POF ) == 1
+
+    # a small change is a partial refresh of its window,
+    # with x widened to multiples of 8
+    epd.write_pixel_xy( 9, 2 )
+    epd.write_pixel_xy( 20, 3 )
+    spi.log = []
+    epd.flush()
+    assert spi.commands() == [ c.PON, c.PTIN, c.PTL, c.DTM2, c.DSP, c.DRF ]
+    assert spi.log[ 2 ][ 1 ] == m._partial_window( 8, 2, 24, 4 )
+    assert spi.log[ 3 ][ 1 ] == bytes( [ 0x40, 0x00, 0x00, 0x08 ] )
+
+    # after full_update_period partial refreshes, a full refresh
+    epd.write_pixel_xy( 0, 0 )
+    spi.log = []
+    epd.flush()
+    assert c.PTIN in spi.commands()
+    epd.write_pixel_xy( 0, 0, False )
+    spi.log = []
+    epd.flush()
+    assert spi.commands()[ : 2 ] == [ c.POF, c.PON ]
+    assert spi.commands()[ 2 ] == c.PTOU
+    assert c.PTIN not in spi.commands()
+
+    # when more than half of the display is written, a full refresh
+    epd.write_pixel_xy( 0, 0 )
+    epd.write_pixel_xy( 127, 150 )
+    spi.log = []
+    epd.flush()
+    assert c.PTIN not in spi.commands()
+    assert c.PTOU in spi.commands()
+
+    # a forced flush is a full refresh
+    epd.write_pixel_xy( 0, 0 )
+    spi.log = []
+    epd.flush( forced = True )
+    assert c.PTIN not in spi.commands()
+    assert c.PTOU in spi.commands()
+
+
+# ===========================================================================
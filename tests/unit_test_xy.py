@@ -69,6 +69,17 @@ def unit_test_xy():
     assert gf.xy( 4, 9 ) // 2 == gf.xy( 2, 4 )
     assert str( gf.xy( 1, 2 ) ) == "(1,2)"
 
+    # the trusted constructor creates the same (immutable) value
+    v = gf.xy._fast( 3, -4 )
+    assert v == gf.xy( 3, -4 )
+    assert v.xy == ( 3, -4 )
+    assert isinstance( v, gf.xy )
+    try:
+        v.x = 5
+        assert False
+    except:
+        pass
+
 
 
 